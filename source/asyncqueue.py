@@ -0,0 +1,230 @@
+#!python
+
+from linkedlist import DoublyLinkedList
+from priorityqueue import PriorityQueue
+from queue import ArrayQueue
+import asyncio
+
+
+def _wake(waiter):
+    """Wake up the given waiter if it is still waiting"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncContainer(object):
+    """An AsyncContainer lets coroutines on one asyncio event loop await room
+    to put an item, if it is bounded, and await an item to get. Waiting
+    coroutines are kept in linked lists of futures in arrival order, and
+    each put or get wakes up the first waiter on the other side. Subclasses
+    choose the underlying storage and the order items come out in.
+    This module requires Python 3."""
+
+    def __init__(self, capacity=None):
+        """Initialize this container. If capacity is given, put waits until
+        there are fewer items than capacity, so fast producers are slowed to
+        the pace of consumers (backpressure)."""
+        if capacity is not None and capacity < 1:
+            raise ValueError('Capacity must be positive: {}'.format(capacity))
+        self.capacity = capacity
+        # Futures of coroutines waiting to get or put an item, oldest first
+        self.getters = DoublyLinkedList()
+        self.putters = DoublyLinkedList()
+
+    def __repr__(self):
+        """Return a string representation of this container"""
+        return '{}({} items)'.format(type(self).__name__, self.length())
+
+    def __len__(self):
+        """Return the number of items in this container"""
+        return self.length()
+
+    def is_empty(self):
+        """Return True if this container is empty, or False otherwise"""
+        return self.length() == 0
+
+    def is_full(self):
+        """Return True if this container is bounded and full, or False"""
+        return self.capacity is not None and self.length() >= self.capacity
+
+    def _wake_next(self, waiters):
+        """Wake up the first of the given waiters that is still waiting"""
+        while not waiters.is_empty():
+            waiter = waiters.pop_head()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready, timeout=None):
+        """Wait in line with the given waiters until the given ready function
+        returns True, and return True, or return False if it is still not
+        ready after timeout seconds. Cancelling the waiting coroutine passes
+        its wake up call on to the next waiter so it is never lost."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        while not ready():
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            waiter = loop.create_future()
+            node = waiters.append(waiter)
+            # Wake up this waiter at the deadline without cancelling it,
+            # so a timeout is not mistaken for cancellation
+            timer = (loop.call_later(deadline - loop.time(), _wake, waiter)
+                     if deadline is not None else None)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()  # In case it is not done yet
+                if not waiter.cancelled() and ready():
+                    # This waiter was woken up but will not act on it
+                    self._wake_next(waiters)
+                raise
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                try:
+                    # Remove this waiter if it was not removed to wake it
+                    waiters.remove_node(node)
+                except ValueError:
+                    pass
+        return True
+
+    async def _put(self, *entry):
+        """Add the given entry, waiting for room if this container is full"""
+        await self._wait(self.putters, lambda: not self.is_full())
+        self._add(*entry)
+        self._wake_next(self.getters)
+
+    def _put_nowait(self, *entry):
+        """Add the given entry, or raise ValueError if this is full"""
+        if self.is_full():
+            raise ValueError('{} is full with {} items'.format(
+                type(self).__name__, self.length()))
+        self._add(*entry)
+        self._wake_next(self.getters)
+
+    async def get(self):
+        """Remove and return the next item, waiting for one if this container
+        is empty. If cancelled while waiting, no item is removed."""
+        await self._wait(self.getters, lambda: not self.is_empty())
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Remove and return the next item, or raise ValueError if this
+        container is empty"""
+        if self.is_empty():
+            raise ValueError('{} is empty'.format(type(self).__name__))
+        item = self._remove()
+        self._wake_next(self.putters)
+        return item
+
+    async def get_batch(self, count, timeout=None):
+        """Remove and return a list of up to count items. Without a timeout,
+        wait for one item, then take any others that are ready right away.
+        With a timeout, wait up to timeout seconds for count items and return
+        as many as arrived, which may be none. If cancelled while waiting
+        after some items were taken, return those items instead of raising
+        CancelledError so they are not lost; otherwise no item is removed."""
+        items = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        try:
+            while len(items) < count:
+                remaining = (max(0, deadline - loop.time())
+                             if deadline is not None else None)
+                if deadline is None and items:
+                    break  # Do not wait for more than the first item
+                if not await self._wait(self.getters,
+                                        lambda: not self.is_empty(),
+                                        remaining):
+                    break  # Timed out
+                # Take everything that is ready without waiting again, and
+                # wake up a waiting putter for each item taken
+                while len(items) < count and not self.is_empty():
+                    items.append(self._remove())
+                    self._wake_next(self.putters)
+        except asyncio.CancelledError:
+            if not items:
+                raise
+            # These items were already removed, so hand them to the caller
+        if items and not self.is_empty():
+            # Another getter may have been waiting while this one took items
+            self._wake_next(self.getters)
+        return items
+
+
+class AsyncQueue(AsyncContainer):
+    """An AsyncQueue is a first-in, first-out queue for coroutines, stored in
+    a growable circular buffer (ArrayQueue)."""
+
+    def __init__(self, iterable=None, capacity=None):
+        """Initialize this queue and enqueue the given items, if any"""
+        super(AsyncQueue, self).__init__(capacity)
+        self.queue = ArrayQueue(iterable)
+        if capacity is not None and self.queue.length() > capacity:
+            raise ValueError('Too many items for capacity {}'.format(capacity))
+
+    def length(self):
+        """Return the number of items in this queue"""
+        return self.queue.length()
+
+    def front(self):
+        """Return the item at the front of this queue without removing it,
+        or None if this queue is empty"""
+        return self.queue.front()
+
+    async def put(self, item):
+        """Insert the given item at the back of this queue, waiting for room
+        if it is full"""
+        await self._put(item)
+
+    def put_nowait(self, item):
+        """Insert the given item at the back of this queue, or raise
+        ValueError if it is full"""
+        self._put_nowait(item)
+
+    def _add(self, item):
+        """Enqueue the given item at the back of this queue"""
+        self.queue.enqueue(item)
+
+    def _remove(self):
+        """Dequeue and return the item at the front of this queue"""
+        return self.queue.dequeue()
+
+
+class AsyncPriorityQueue(AsyncContainer):
+    """An AsyncPriorityQueue is a priority queue for coroutines that gets the
+    item with the least priority first, and items with equal priorities in
+    the order they were put, stored in a binary heap (PriorityHeap)."""
+
+    def __init__(self, capacity=None):
+        """Initialize this priority queue"""
+        super(AsyncPriorityQueue, self).__init__(capacity)
+        self.queue = PriorityQueue(stable=True)
+
+    def length(self):
+        """Return the number of items in this priority queue"""
+        return self.queue.length()
+
+    def front(self):
+        """Return the item at the front of this priority queue without
+        removing it, or None if this priority queue is empty"""
+        return self.queue.front()
+
+    async def put(self, item, priority):
+        """Insert the given item in order according to the given priority,
+        waiting for room if this priority queue is full"""
+        await self._put(item, priority)
+
+    def put_nowait(self, item, priority):
+        """Insert the given item in order according to the given priority, or
+        raise ValueError if this priority queue is full"""
+        self._put_nowait(item, priority)
+
+    def _add(self, item, priority):
+        """Enqueue the given item with the given priority"""
+        self.queue.enqueue(item, priority)
+
+    def _remove(self):
+        """Dequeue and return the item with the least priority"""
+        return self.queue.dequeue()
@@ -0,0 +1,170 @@
+#!python
+
+from binarysearchtree import BinaryNode, BinarySearchTree
+
+
+class AVLNode(BinaryNode):
+
+    # Add a slot for the cached height to the slots of BinaryNode
+    __slots__ = ('_height',)
+
+    def __init__(self, data):
+        """Initialize this AVL node with the given data"""
+        super(AVLNode, self).__init__(data)
+        # Cache this node's height so it never has to be recalculated
+        # recursively; a new node is a leaf, so its height is 0
+        self._height = 0
+
+    def __repr__(self):
+        """Return a string representation of this AVL node"""
+        return 'AVLNode({})'.format(repr(self.data))
+
+    def height(self):
+        """Return the number of edges on the longest downward path from this
+        node to a descendant leaf node.
+        Running time: O(1) because the height is cached in this node."""
+        return self._height
+
+    def update_height(self):
+        """Recalculate this node's height from its children's cached heights"""
+        left_height = self.left._height if self.left is not None else -1
+        right_height = self.right._height if self.right is not None else -1
+        self._height = 1 + max(left_height, right_height)
+
+    def balance_factor(self):
+        """Return the difference between this node's left child's height and
+        right child's height, which is between -1 and 1 if it is balanced"""
+        left_height = self.left._height if self.left is not None else -1
+        right_height = self.right._height if self.right is not None else -1
+        return left_height - right_height
+
+
+class AVLTree(BinarySearchTree):
+    """An AVLTree is a binary search tree that rebalances itself with
+    rotations after each insertion, so its height is always O(log n) and
+    contains, search and insert take O(log n) time in the worst case."""
+
+    def __repr__(self):
+        """Return a string representation of this AVL tree"""
+        return 'AVLTree({} nodes)'.format(self.size)
+
+    def _build_subtree(self, items, start, stop):
+        """Return the root node of a balanced subtree containing the given
+        sorted items between the start and stop indexes, or None if empty"""
+        if start >= stop:
+            return None
+        middle = (start + stop) // 2
+        node = AVLNode(items[middle])
+        node.left = self._build_subtree(items, start, middle)
+        node.right = self._build_subtree(items, middle + 1, stop)
+        node.update_height()
+        node.update_size()
+        return node
+
+    def insert(self, item):
+        """Insert the given item in order into this AVL tree and rebalance.
+        Running time: O(log n) because the tree's height is O(log n) and at
+        most two rotations are needed to restore balance."""
+        # Handle the case where the tree is empty
+        if self.is_empty():
+            self.root = AVLNode(item)
+            self.size += 1
+            return
+        # Descend to where the given item belongs, remembering the path
+        path = []
+        node = self.root
+        while node is not None:
+            if item == node.data:
+                return  # This tree already contains the given item
+            path.append(node)
+            node = node.left if item < node.data else node.right
+        # Create a new node and attach it to the last node on the path
+        parent = path[-1]
+        if item < parent.data:
+            parent.left = AVLNode(item)
+        else:
+            parent.right = AVLNode(item)
+        self.size += 1
+        # Increase the subtree size of each ancestor of the new node
+        for node in path:
+            node.size += 1
+        self.retrace_up(path)
+
+    def retrace_up(self, path):
+        """Retrace the given path of nodes from the root down to the parent of
+        a new node, updating heights and rotating any unbalanced node"""
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            old_height = node._height
+            node.update_height()
+            balance = node.balance_factor()
+            if balance > 1 or balance < -1:
+                subtree = self._rebalance(node)
+                # Replace the unbalanced node with the rotated subtree root
+                if index == 0:
+                    self.root = subtree
+                elif path[index - 1].left is node:
+                    path[index - 1].left = subtree
+                else:
+                    path[index - 1].right = subtree
+                # A rotation after insertion restores the subtree's height
+                return
+            if node._height == old_height:
+                return  # Heights above this node are unchanged
+
+    def _rebalance(self, node):
+        """Rotate the given unbalanced node's subtree and return its new
+        root"""
+        if node.balance_factor() > 1:  # Left heavy
+            if node.left.balance_factor() < 0:  # Left-right case
+                node.left = self.rotate_left(node.left)
+            return self.rotate_right(node)
+        else:  # Right heavy
+            if node.right.balance_factor() > 0:  # Right-left case
+                node.right = self.rotate_right(node.right)
+            return self.rotate_left(node)
+
+    def rotate_left(self, node):
+        """Rotate the given node's right child up so the given node becomes its
+        left child, and return the new root of this subtree"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.update_height()
+        pivot.update_height()
+        # The pivot now roots the whole subtree, so it takes over its size
+        pivot.size = node.size
+        node.update_size()
+        return pivot
+
+    def rotate_right(self, node):
+        """Rotate the given node's left child up so the given node becomes its
+        right child, and return the new root of this subtree"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.update_height()
+        pivot.update_height()
+        # The pivot now roots the whole subtree, so it takes over its size
+        pivot.size = node.size
+        node.update_size()
+        return pivot
+
+
+def test_avl_tree():
+    # Insert items in sorted order, which would make a plain BST a linked list
+    items = list(range(1, 16))
+    print('items: ' + str(items))
+
+    tree = AVLTree()
+    for item in items:
+        tree.insert(item)
+        print('insert({}), size: {}, height: {}'.format(
+            item, tree.size, tree.height()))
+    print('root: ' + str(tree.root))
+    print('items in-order:    ' + str(tree.items_in_order()))
+    print('items level-order: ' + str(tree.items_level_order()))
+
+
+if __name__ == '__main__':
+    test_avl_tree()
@@ -0,0 +1,62 @@
+#!python
+
+from blocking import BlockingQueue
+from bench_timing import per_sec
+import threading
+import time
+
+
+def run(threads, count, capacity, batch):
+    """Pass count items through a blocking queue with the given capacity from
+    the given number of producer threads to as many consumer threads, moving
+    the given number of items per call, and return the items per second"""
+    q = BlockingQueue(capacity=capacity)
+    per_thread = count // threads
+
+    def produce():
+        if batch == 1:
+            for item in range(per_thread):
+                q.enqueue(item)
+        else:
+            for start in range(0, per_thread, batch):
+                q.enqueue_many(range(start, min(start + batch, per_thread)))
+
+    def consume():
+        received = 0
+        while received < per_thread:
+            if batch == 1:
+                q.dequeue()
+                received += 1
+            else:
+                # Wait for one item, then take whatever else is ready
+                q.dequeue()
+                received += 1 + len(q.drain(min(batch, per_thread - received)
+                                            - 1))
+
+    workers = ([threading.Thread(target=produce) for _ in range(threads)] +
+               [threading.Thread(target=consume) for _ in range(threads)])
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_sec(per_thread * threads, start)
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 100000
+    print('{} items'.format(count))
+    print('{:>8} {:>9} {:>6} {:>14}'.format(
+        'threads', 'capacity', 'batch', 'items/sec'))
+    for threads in [1, 2, 4, 8]:
+        for capacity in [None, 64]:
+            for batch in [1, 32]:
+                print('{:>8} {:>9} {:>6} {:>14,.0f}'.format(
+                    threads, capacity or '-', batch,
+                    run(threads, count, capacity, batch)))
+
+
+if __name__ == '__main__':
+    main()
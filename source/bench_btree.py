@@ -0,0 +1,54 @@
+#!python
+
+from btree import BTree
+from bench_timing import ops_per_sec, per_sec
+import os
+import random
+import shutil
+import tempfile
+import time
+
+
+def range_keys_per_sec(tree, count):
+    """Scan the given number of keys from the start of the given tree and
+    return the throughput in keys per second"""
+    start = time.perf_counter()
+    scanned = 0
+    for _ in tree.range():
+        scanned += 1
+        if scanned == count:
+            break
+    return per_sec(scanned, start)
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 100000
+    cache_size = int(args[1]) if len(args) >= 2 else 256
+    keys = random.sample(range(count), count)
+    directory = tempfile.mkdtemp()
+    print('{} random keys, cache of {} pages'.format(count, cache_size))
+    print('{:<7} {:>6} {:>7} {:>12} {:>12} {:>12}'.format(
+        'storage', 'order', 'height', 'insert/sec', 'search/sec',
+        'scan keys/s'))
+    try:
+        for storage in ('memory', 'file'):
+            for order in (4, 16, 64, 128):
+                path = (os.path.join(directory, 'order{}'.format(order))
+                        if storage == 'file' else None)
+                with BTree(order=order, path=path, mode='n',
+                           cache_size=cache_size) as tree:
+                    insert_rate = ops_per_sec(tree.insert, keys)
+                    search_rate = ops_per_sec(tree.search, keys)
+                    scan_rate = range_keys_per_sec(tree, count)
+                    print('{:<7} {:>6} {:>7} {:>12,.0f} {:>12,.0f} '
+                          '{:>12,.0f}'.format(storage, order, tree.height(),
+                                              insert_rate, search_rate,
+                                              scan_rate))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!python
+
+from linkedlist import LinkedList
+from deque import BlockDeque
+from queue import LinkedQueue
+from stack import LinkedStack
+from bench_memory import bytes_per_item
+from bench_timing import per_sec
+import time
+
+
+# Pairs of backend names and classes for LinkedQueue and LinkedStack
+BACKENDS = [
+    ('LinkedList', LinkedList),
+    ('BlockDeque', BlockDeque),
+]
+
+
+def queue_items_per_sec(backend, items):
+    """Enqueue then dequeue all of the given items on a queue with the given
+    backend and return the throughput in items per second"""
+    q = LinkedQueue(backend=backend)
+    start = time.perf_counter()
+    for item in items:
+        q.enqueue(item)
+    for _ in items:
+        q.dequeue()
+    return per_sec(len(items), start)
+
+
+def stack_items_per_sec(backend, items):
+    """Push then pop all of the given items on a stack with the given backend
+    and return the throughput in items per second"""
+    s = LinkedStack(backend=backend)
+    start = time.perf_counter()
+    for item in items:
+        s.push(item)
+    for _ in items:
+        s.pop()
+    return per_sec(len(items), start)
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 100000
+    items = list(range(count))
+    print('{} items'.format(count))
+    print('{:<12} {:>15} {:>15} {:>11}'.format(
+        'backend', 'queue items/s', 'stack items/s', 'bytes/item'))
+    for name, backend in BACKENDS:
+        print('{:<12} {:>15,.0f} {:>15,.0f} {:>11.1f}'.format(
+            name, queue_items_per_sec(backend, items),
+            stack_items_per_sec(backend, items),
+            bytes_per_item(backend, items)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!python
+
+from hashtable import HashTable, ProbingHashTable
+from bench_timing import ops_per_sec
+import random
+
+
+def bench_table(table, keys, missing_keys):
+    """Return a list of (operation, ops/sec) pairs measured on the given
+    table"""
+    return [
+        ('set', ops_per_sec(lambda key: table.set(key, key), keys)),
+        ('update', ops_per_sec(lambda key: table.set(key, 0), keys)),
+        ('get', ops_per_sec(table.get, keys)),
+        ('contains hit', ops_per_sec(table.contains, keys)),
+        ('contains miss', ops_per_sec(table.contains, missing_keys)),
+        ('delete', ops_per_sec(table.delete, keys)),
+    ]
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 100000
+    keys = random.sample(range(count * 10), count)
+    missing_keys = [-key - 1 for key in keys]
+    # Give both tables enough buckets up front to compare probing costs only
+    tables = [('HashTable', HashTable(count * 2)),
+              ('ProbingHashTable', ProbingHashTable(count * 2))]
+    print('{} random integer keys'.format(count))
+    print('{:<18} {:<14} {:>14}'.format('table', 'operation', 'ops/sec'))
+    for name, table in tables:
+        for operation, rate in bench_table(table, keys, missing_keys):
+            print('{:<18} {:<14} {:>14,.0f}'.format(name, operation, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!python
+
+from heap import MinHeap, PairingHeap
+from bench_timing import per_sec
+import random
+import time
+
+
+# Pairs of heap names and functions that create an empty heap
+HEAPS = [
+    ('MinHeap(arity=2)', lambda: MinHeap(arity=2)),
+    ('MinHeap(arity=4)', lambda: MinHeap(arity=4)),
+    ('MinHeap(arity=8)', lambda: MinHeap(arity=8)),
+    ('PairingHeap', PairingHeap),
+]
+
+
+def operations(count, insert_ratio):
+    """Return a list of count random operations, each a number to insert or
+    None to remove the minimum, where about insert_ratio of them are inserts.
+    The heap is never empty when a remove is reached."""
+    ops = []
+    size = 0
+    for _ in range(count):
+        if size == 0 or random.random() < insert_ratio:
+            ops.append(random.random())
+            size += 1
+        else:
+            ops.append(None)
+            size -= 1
+    return ops
+
+
+def ops_per_sec(heap, ops):
+    """Apply the given operations to the given heap and return the throughput
+    in operations per second"""
+    insert = heap.insert
+    remove_min = heap.remove_min
+    start = time.perf_counter()
+    for item in ops:
+        if item is None:
+            remove_min()
+        else:
+            insert(item)
+    return per_sec(len(ops), start)
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 100000
+    # Mixes from insert-heavy (timer queues) to balanced (schedulers)
+    mixes = [0.9, 0.75, 0.5]
+    print('{} operations'.format(count))
+    print('{:<8} {:<18} {:>14}'.format('inserts', 'heap', 'ops/sec'))
+    for insert_ratio in mixes:
+        ops = operations(count, insert_ratio)
+        for name, make_heap in HEAPS:
+            print('{:<8.0%} {:<18} {:>14,.0f}'.format(
+                insert_ratio, name, ops_per_sec(make_heap(), ops)))
+
+
+if __name__ == '__main__':
+    main()
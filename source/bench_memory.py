@@ -0,0 +1,122 @@
+#!python
+
+from linkedlist import LinkedList
+from binarysearchtree import BinarySearchTree
+from hashtable import HashTable, ProbingHashTable
+from queue import LinkedQueue, ArrayQueue
+from stack import LinkedStack, ArrayStack
+from heap import MinHeap
+import tracemalloc
+
+
+def build_linked_list(items):
+    return LinkedList(items)
+
+
+def build_binary_search_tree(items):
+    return BinarySearchTree.from_sorted(items)
+
+
+def build_hash_table(items):
+    table = HashTable()
+    table.update((item, item) for item in items)
+    return table
+
+
+def build_probing_hash_table(items):
+    table = ProbingHashTable(len(items) * 2)
+    for item in items:
+        table.set(item, item)
+    return table
+
+
+def build_linked_queue(items):
+    return LinkedQueue(items)
+
+
+def build_array_queue(items):
+    return ArrayQueue(items)
+
+
+def build_typed_array_queue(items):
+    return ArrayQueue(items, typecode='q')
+
+
+def build_linked_stack(items):
+    return LinkedStack(items)
+
+
+def build_array_stack(items):
+    return ArrayStack(items)
+
+
+def build_typed_array_stack(items):
+    return ArrayStack(items, typecode='q')
+
+
+def build_min_heap(items):
+    return MinHeap(items)
+
+
+def build_typed_min_heap(items):
+    return MinHeap(items, typecode='q')
+
+
+# Pairs of structure names and functions that build one from a list of items
+BUILDERS = [
+    ('LinkedList', build_linked_list),
+    ('BinarySearchTree', build_binary_search_tree),
+    ('HashTable', build_hash_table),
+    ('ProbingHashTable', build_probing_hash_table),
+    ('LinkedQueue', build_linked_queue),
+    ('ArrayQueue', build_array_queue),
+    ('ArrayQueue(q)', build_typed_array_queue),
+    ('LinkedStack', build_linked_stack),
+    ('ArrayStack', build_array_stack),
+    ('ArrayStack(q)', build_typed_array_stack),
+    ('MinHeap', build_min_heap),
+    ('MinHeap(q)', build_typed_min_heap),
+]
+
+
+def bytes_per_item(build, items):
+    """Return the number of bytes allocated by the given build function per
+    item, not counting the items themselves, which are allocated already"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(items)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return float(after - before) / len(items)
+
+
+def bytes_per_new_item(build, items):
+    """Return the number of bytes allocated by the given build function per
+    item, counting the items too, since each is a new number object that
+    stays allocated only if the structure keeps a reference to it. Typed
+    structures copy the numbers unboxed instead."""
+    # Add a large offset so every number is a new object, not a cached one
+    return bytes_per_item(
+        lambda items: build([item + 2 ** 40 for item in items]), items)
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    # Measure at 10^4 through 10^max_exponent items (10^7 takes minutes)
+    max_exponent = int(args[0]) if len(args) >= 1 else 5
+    print('{:<18} {:>10} {:>14} {:>14}'.format(
+        'structure', 'items', 'bytes/item', 'with items'))
+    for exponent in range(4, max_exponent + 1):
+        items = list(range(10 ** exponent))
+        for name, build in BUILDERS:
+            print('{:<18} {:>10,} {:>14.1f} {:>14.1f}'.format(
+                name, len(items), bytes_per_item(build, items),
+                bytes_per_new_item(build, items)))
+
+
+if __name__ == '__main__':
+    main()
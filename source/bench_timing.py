@@ -0,0 +1,19 @@
+#!python
+
+import time
+
+
+def per_sec(count, start):
+    """Return the throughput of the given number of operations done since
+    the given time.perf_counter() start time, in operations per second"""
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed > 0 else float('inf')
+
+
+def ops_per_sec(function, items):
+    """Call the given function on each of the given items and return the
+    throughput in operations per second"""
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    return per_sec(len(items), start)
@@ -0,0 +1,48 @@
+#!python
+
+from binarysearchtree import BinarySearchTree
+from avltree import AVLTree
+from redblacktree import RedBlackTree
+from btree import BTree
+from bench_timing import ops_per_sec
+import random
+
+
+def tree_height(tree):
+    """Return the height of the given tree without recursion, since a plain
+    binary search tree built from sorted items is too deep to recurse on"""
+    if isinstance(tree, BTree):
+        return tree.height()
+    height = -1
+    level = [tree.root] if tree.root is not None else []
+    while level:
+        height += 1
+        level = [child for node in level for child in (node.left, node.right)
+                 if child is not None]
+    return height
+
+
+def main():
+    import sys
+    args = sys.argv[1:]  # Ignore script file name
+    count = int(args[0]) if len(args) >= 1 else 2000
+    orders = [('sorted', list(range(count))),
+              ('reverse', list(range(count - 1, -1, -1))),
+              ('random', random.sample(range(count), count))]
+    tree_classes = [BinarySearchTree, AVLTree, RedBlackTree, BTree]
+    print('{} items'.format(count))
+    print('{:<9} {:<17} {:>7} {:>14} {:>14}'.format(
+        'order', 'tree', 'height', 'insert/sec', 'contains/sec'))
+    for order, items in orders:
+        for tree_class in tree_classes:
+            # Insert one at a time to measure the insertion path itself
+            tree = tree_class()
+            insert_rate = ops_per_sec(tree.insert, items)
+            contains_rate = ops_per_sec(tree.contains, items)
+            print('{:<9} {:<17} {:>7} {:>14,.0f} {:>14,.0f}'.format(
+                order, tree_class.__name__, tree_height(tree),
+                insert_rate, contains_rate))
+
+
+if __name__ == '__main__':
+    main()
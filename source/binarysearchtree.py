@@ -1,12 +1,19 @@
 #!python
 
+from queue import LinkedQueue
+
+
 class BinaryNode(object):
 
+    __slots__ = ('data', 'left', 'right', 'size')
+
     def __init__(self, data):
         """Initialize this binary node with the given data"""
         self.data = data
         self.left = None
         self.right = None
+        # Count the nodes in the subtree rooted at this node, including itself
+        self.size = 1
 
     def __repr__(self):
         """Return a string representation of this binary node"""
@@ -14,34 +21,88 @@ class BinaryNode(object):
 
     def is_leaf(self):
         """Return True if this node is a leaf (has no children)"""
-        # TODO: Check if both left child and right child have no value
-        return ... and ...
+        # Check if both left child and right child have no value
+        return self.left is None and self.right is None
 
     def is_internal(self):
         """Return True if this node is internal (has at least one child)"""
-        # TODO: Check if either left child or right child has a value
-        return ... or ...
+        # Check if either left child or right child has a value
+        return self.left is not None or self.right is not None
 
     def height(self):
         """Return the number of edges on the longest downward path from this
         node to a descendant leaf node"""
-        # TODO: Check if left child has a value and if so calculate its height
-        left_height = ... if self.left is not None else -1
-        # TODO: Check if right child has a value and if so calculate its height
-        right_height = ... if self.right is not None else -1
+        # Check if left child has a value and if so calculate its height
+        left_height = self.left.height() if self.left is not None else -1
+        # Check if right child has a value and if so calculate its height
+        right_height = self.right.height() if self.right is not None else -1
         # Return one more than the greater of the left height and right height
         return 1 + max(left_height, right_height)
 
+    def update_size(self):
+        """Recalculate this node's subtree size from its children's sizes"""
+        left_size = self.left.size if self.left is not None else 0
+        right_size = self.right.size if self.right is not None else 0
+        self.size = 1 + left_size + right_size
+
 
 class BinarySearchTree(object):
 
     def __init__(self, items=None):
-        """Initialize this binary search tree and insert the given items"""
+        """Initialize this binary search tree and insert the given items.
+        If the given items are already in sorted order, build a perfectly
+        balanced tree in O(n) time instead of inserting them one at a time,
+        which would take O(n^2) time and produce a tree of height n - 1."""
         self.root = None
         self.size = 0
         if items is not None:
-            for item in items:
-                self.insert(item)
+            items = list(items)
+            if self._is_sorted(items):
+                self._build_sorted(items)
+            else:
+                for item in items:
+                    self.insert(item)
+
+    @classmethod
+    def from_sorted(cls, items):
+        """Return a new perfectly balanced binary search tree containing the
+        given items, which must be in sorted order.
+        Running time: O(n) for n items because each item is visited once."""
+        tree = cls()
+        tree._build_sorted(list(items))
+        return tree
+
+    @staticmethod
+    def _is_sorted(items):
+        """Return True if the given list of items is in sorted order, allowing
+        duplicates, or False. Running time: O(n) for n items (early exit)."""
+        for index in range(1, len(items)):
+            if items[index] < items[index - 1]:
+                return False
+        return True
+
+    def _build_sorted(self, items):
+        """Replace this tree's nodes with a perfectly balanced tree built from
+        the given list of sorted items, skipping adjacent duplicate items."""
+        # Skip duplicates since this tree stores each item at most once
+        unique_items = [item for index, item in enumerate(items)
+                        if index == 0 or items[index - 1] != item]
+        self.root = self._build_subtree(unique_items, 0, len(unique_items))
+        self.size = len(unique_items)
+
+    def _build_subtree(self, items, start, stop):
+        """Return the root node of a balanced subtree containing the given
+        sorted items between the start and stop indexes, or None if empty.
+        Recursion depth is O(log n) because each call halves the range."""
+        if start >= stop:
+            return None
+        # Choose the middle item as the subtree root to balance both sides
+        middle = (start + stop) // 2
+        node = BinaryNode(items[middle])
+        node.left = self._build_subtree(items, start, middle)
+        node.right = self._build_subtree(items, middle + 1, stop)
+        node.update_size()
+        return node
 
     def __repr__(self):
         """Return a string representation of this binary search tree"""
@@ -68,28 +129,28 @@ class BinarySearchTree(object):
         """Return an item in this binary search tree matching the given item"""
         # Find a node with the given item, if any
         node = self._find_node(item)
-        # TODO: Return the node's data if found, or None
-        return node.data if ... else None
+        # Return the node's data if found, or None
+        return node.data if node is not None else None
 
     def _find_node(self, item):
-        """Return the node containing the given item in this binary search tree,
-        or None if the given item is not found"""
+        """Return the node containing the given item in this binary search
+        tree, or None if the given item is not found"""
         # Start with the root node
         node = self.root
         # Loop until we descend past the closest leaf node
         while node is not None:
-            # TODO: Check if the given item matches the node's data
-            if ...:
+            # Check if the given item matches the node's data
+            if item == node.data:
                 # Return the found node
                 return node
-            # TODO: Check if the given item is less than the node's data
-            elif ...:
-                # TODO: Descend to the node's left child
-                node = ...
-            # TODO: Check if the given item is greater than the node's data
-            elif ...:
-                # TODO: Descend to the node's right child
-                node = ...
+            # Check if the given item is less than the node's data
+            elif item < node.data:
+                # Descend to the node's left child
+                node = node.left
+            # Check if the given item is greater than the node's data
+            elif item > node.data:
+                # Descend to the node's right child
+                node = node.right
         # Not found
         return None
 
@@ -101,20 +162,20 @@ class BinarySearchTree(object):
         parent = None
         # Loop until we descend past the closest leaf node
         while node is not None:
-            # TODO: Check if the given item matches the node's data
-            if ...:
+            # Check if the given item matches the node's data
+            if item == node.data:
                 # Return the parent of the found node
                 return parent
-            # TODO: Check if the given item is less than the node's data
-            elif ...:
-                # TODO: Update the parent and descend to the node's left child
+            # Check if the given item is less than the node's data
+            elif item < node.data:
+                # Update the parent and descend to the node's left child
                 parent = node
-                node = ...
-            # TODO: Check if the given item is greater than the node's data
-            elif ...:
-                # TODO: Update the parent and descend to the node's right child
+                node = node.left
+            # Check if the given item is greater than the node's data
+            elif item > node.data:
+                # Update the parent and descend to the node's right child
                 parent = node
-                node = ...
+                node = node.right
         # Not found
         return parent
 
@@ -123,99 +184,265 @@ class BinarySearchTree(object):
         # Handle the case where the tree is empty
         if self.is_empty():
         # if self.root is None:
-            # TODO: Create a new root node
-            self.root = ...
-            # TODO: Increase the tree size
-            self.size ...
+            # Create a new root node
+            self.root = BinaryNode(item)
+            # Increase the tree size
+            self.size += 1
             return
         # Find the parent node of where the given item should be inserted
         parent = self._find_parent_node(item)
-        # TODO: Check if the given item should be inserted left of the parent node
-        if ...:
-            # TODO: Create a new node and set the parent's left child
-            parent.left = ...
-        # TODO: Check if the given item should be inserted right of the parent node
-        elif ...:
-            # TODO: Create a new node and set the parent's right child
-            parent.right = ...
-        # TODO: Increase the tree size
-        self.size ...
+        # Check if the given item is already at the root and if so skip it
+        if parent is None:
+            return
+        # Check if the given item should be inserted left of the parent node
+        if item < parent.data:
+            if parent.left is not None:
+                return  # The parent's left child already holds this item
+            # Create a new node and set the parent's left child
+            parent.left = BinaryNode(item)
+        # Check if the given item should be inserted right of the parent node
+        elif item > parent.data:
+            if parent.right is not None:
+                return  # The parent's right child already holds this item
+            # Create a new node and set the parent's right child
+            parent.right = BinaryNode(item)
+        # Increase the tree size
+        self.size += 1
+        # Increase the subtree size of each ancestor of the new node
+        node = self.root
+        while node is not parent:
+            node.size += 1
+            node = node.left if item < node.data else node.right
+        parent.size += 1
+
+    def rank(self, item):
+        """Return the number of items in this tree that are less than the
+        given item. Running time: O(h) for a tree of height h because subtree
+        sizes let us skip counting every node in a left subtree."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if item < node.data:
+                node = node.left
+            else:
+                # Count the left subtree, and this node if it is less
+                left_size = node.left.size if node.left is not None else 0
+                if item == node.data:
+                    return count + left_size
+                count += left_size + 1
+                node = node.right
+        return count
+
+    def select(self, index):
+        """Return the item with the given index in sorted order (the item
+        with rank index), or raise ValueError if the given index is out of
+        range of the tree size. Running time: O(h) for a tree of height h."""
+        if not (0 <= index < self.size):
+            raise ValueError('Tree index out of range: {}'.format(index))
+        node = self.root
+        while node is not None:
+            left_size = node.left.size if node.left is not None else 0
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.data
+            else:
+                # Skip the left subtree and this node
+                index -= left_size + 1
+                node = node.right
+
+    def floor(self, item):
+        """Return the greatest item in this tree that is less than or equal to
+        the given item, or None. Running time: O(h) for a tree of height h."""
+        result = None
+        node = self.root
+        while node is not None:
+            if item == node.data:
+                return node.data
+            elif item < node.data:
+                node = node.left
+            else:
+                # This node is a candidate, but a greater one may be right
+                result = node.data
+                node = node.right
+        return result
+
+    def ceiling(self, item):
+        """Return the least item in this tree that is greater than or equal to
+        the given item, or None. Running time: O(h) for a tree of height h."""
+        result = None
+        node = self.root
+        while node is not None:
+            if item == node.data:
+                return node.data
+            elif item > node.data:
+                node = node.right
+            else:
+                # This node is a candidate, but a lesser one may be left
+                result = node.data
+                node = node.left
+        return result
+
+    def count_range(self, low, high):
+        """Return the number of items in this tree between the given low and
+        high items, inclusive. Running time: O(h) for a tree of height h."""
+        if high < low:
+            return 0
+        count = self.rank(high) - self.rank(low)
+        # Rank counts only items less than high, so also count high itself
+        if self.contains(high):
+            count += 1
+        return count
+
+    def range(self, low, high):
+        """Generate all items in this tree between the given low and high
+        items, inclusive, in sorted order. Running time: O(h + k) to generate
+        k items because subtrees entirely outside the range are skipped."""
+        # Create a stack of nodes whose left subtree is being traversed
+        stack = []
+        node = self.root
+        while node is not None or stack:
+            # Descend left, but only remember nodes that are in range
+            while node is not None:
+                if node.data < low:
+                    # This node and its left subtree are below the range
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return  # Every remaining item is below the range
+            node = stack.pop()
+            if high < node.data:
+                return  # Every remaining item is above the range
+            yield node.data
+            node = node.right
+
+    def __iter__(self):
+        """Return a generator of all items in this tree in sorted order"""
+        return self.iter_in_order()
 
     def items_in_order(self, node=None, items=None):
         """Return a list of all items in this binary search tree found using
         in-order traversal starting at the given node after the given items"""
-        # Set up starting node and items list if not given
-        if node is None:
-            node = self.root
+        # Set up items list if not given
         if items is None:
             items = list()
-        # TODO: Traverse left subtree, if it exists
-        ...
-        # TODO: Add this node's data to the items list
-        ...
-        # TODO: Traverse right subtree, if it exists
-        ...
+        # Extend the items list without recursion, so deep trees are safe
+        items.extend(self.iter_in_order(node))
         # Return the items list to the original caller
         return items
 
     def items_pre_order(self, node=None, items=None):
         """Return a list of all items in this binary search tree found using
         pre-order traversal starting at the given node after the given items"""
-        # Set up starting node and items list if not given
-        if node is None:
-            node = self.root
         if items is None:
             items = list()
-        # TODO: Add this node's data to the items list
-        ...
-        # TODO: Traverse left subtree, if it exists
-        ...
-        # TODO: Traverse right subtree, if it exists
-        ...
-        # Return the items list to the original caller
+        items.extend(self.iter_pre_order(node))
         return items
 
     def items_post_order(self, node=None, items=None):
         """Return a list of all items in this binary search tree found using
-        post-order traversal starting at the given node after the given items"""
-        # Set up starting node and items list if not given
-        if node is None:
-            node = self.root
+        post-order traversal starting at the given node after the given
+        items"""
         if items is None:
             items = list()
-        # TODO: Traverse left subtree, if it exists
-        ...
-        # TODO: Traverse right subtree, if it exists
-        ...
-        # TODO: Add this node's data to the items list
-        ...
-        # Return the items list to the original caller
+        items.extend(self.iter_post_order(node))
         return items
 
     def items_level_order(self):
         """Return a list of all items in this binary search tree found using
         level-order traversal"""
-        # TODO: Create a queue to store nodes not yet traversed in level-order
-        queue = ...
-        # Create an items list
-        items = list()
-        # TODO: Enqueue the root node if this tree is not empty
-        if ...:
-            queue...
-        # TODO: Loop until the queue is empty
-        while ...:
-            # TODO: Dequeue the node at the front of the queue
-            node = ...
-            # TODO: Add this node's data to the items list
-            ...
-            # TODO: Enqueue this node's left child if it exists
-            if ...:
-                ...
-            # TODO: Enqueue this node's right child if it exists
-            if ...:
-                ...
-        # Return the items list
-        return items
+        return list(self.iter_level_order())
+
+    def iter_in_order(self, node=None):
+        """Generate all items in this binary search tree found using in-order
+        traversal starting at the given node, without recursion.
+        Running time: O(n) total, O(1) amortized per item.
+        Memory usage: O(h) for a stack of ancestors in a tree of height h."""
+        # Set up starting node if not given
+        if node is None:
+            node = self.root
+        # Create a stack of nodes whose left subtree is being traversed
+        stack = []
+        while node is not None or stack:
+            # Descend as far left as possible, remembering each ancestor
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            # Visit the leftmost unvisited node, then traverse its right
+            # subtree
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def iter_pre_order(self, node=None):
+        """Generate all items in this binary search tree found using pre-order
+        traversal starting at the given node, without recursion.
+        Memory usage: O(h) for a stack of right children not yet traversed."""
+        # Set up starting node if not given
+        if node is None:
+            node = self.root
+        if node is None:
+            return  # This tree is empty
+        # Create a stack of nodes not yet traversed in pre-order
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            # Push right child first so the left subtree is traversed first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_post_order(self, node=None):
+        """Generate all items in this binary search tree found using post-order
+        traversal starting at the given node, without recursion.
+        Memory usage: O(h) for a stack of ancestors in a tree of height h."""
+        # Set up starting node if not given
+        if node is None:
+            node = self.root
+        # Create a stack of nodes whose subtrees are being traversed
+        stack = []
+        # Keep track of the last node visited to know when to visit a parent
+        last_visited = None
+        while node is not None or stack:
+            # Descend as far left as possible, remembering each ancestor
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            # Traverse the right subtree first if it exists and is unvisited
+            if top.right is not None and top.right is not last_visited:
+                node = top.right
+            else:
+                # Both subtrees are done, so visit this node
+                stack.pop()
+                yield top.data
+                last_visited = top
+
+    def iter_level_order(self):
+        """Generate all items in this binary search tree found using
+        level-order traversal.
+        Memory usage: O(w) for a queue of nodes in a tree of width w."""
+        # Create a queue to store nodes not yet traversed in level-order
+        queue = LinkedQueue()
+        # Enqueue the root node if this tree is not empty
+        if not self.is_empty():
+            queue.enqueue(self.root)
+        # Loop until the queue is empty
+        while not queue.is_empty():
+            # Dequeue the node at the front of the queue
+            node = queue.dequeue()
+            # Generate this node's data
+            yield node.data
+            # Enqueue this node's left child if it exists
+            if node.left is not None:
+                queue.enqueue(node.left)
+            # Enqueue this node's right child if it exists
+            if node.right is not None:
+                queue.enqueue(node.right)
 
 
 def test_binary_search_tree():
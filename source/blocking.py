@@ -0,0 +1,236 @@
+#!python
+
+from queue import ArrayQueue
+from stack import ArrayStack
+import threading
+import time
+
+
+class BlockingContainer(object):
+    """A BlockingContainer makes a queue or stack safe to share between
+    threads. Every operation holds one lock, and threads wait on condition
+    variables for an item to remove or, if it is bounded, room to add one.
+    Subclasses choose the underlying container and which end items go in
+    and come out of."""
+
+    def __init__(self, container, iterable=None, capacity=None):
+        """Initialize this container to wrap the given empty container and
+        add the given items, if any. If capacity is given, adding an item
+        waits until there are fewer items than capacity."""
+        if capacity is not None and capacity < 1:
+            raise ValueError('Capacity must be positive: {}'.format(capacity))
+        self.container = container
+        self.capacity = capacity
+        # Both conditions share one lock, which guards the container
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        if iterable:
+            for item in iterable:
+                if not self._has_room():
+                    raise ValueError('Too many items for capacity {}'.format(
+                        capacity))
+                self._add(item)
+
+    def __repr__(self):
+        """Return a string representation of this container"""
+        return '{}({} items)'.format(type(self).__name__, self.length())
+
+    def __len__(self):
+        """Return the number of items in this container"""
+        return self.length()
+
+    def is_empty(self):
+        """Return True if this container is empty, or False otherwise"""
+        with self.lock:
+            return self.container.is_empty()
+
+    def is_full(self):
+        """Return True if this container is bounded and full, or False"""
+        with self.lock:
+            return not self._has_room()
+
+    def length(self):
+        """Return the number of items in this container"""
+        with self.lock:
+            return self.container.length()
+
+    def _has_items(self):
+        """Return True if there is an item to remove. Hold the lock."""
+        return not self.container.is_empty()
+
+    def _has_room(self):
+        """Return True if there is room to add an item. Hold the lock."""
+        return (self.capacity is None or
+                self.container.length() < self.capacity)
+
+    def _wait(self, condition, ready, block, timeout):
+        """Wait on the given condition until the given ready function returns
+        True, and return True, or return False if it is still not ready after
+        timeout seconds, or at once if block is False. Hold the lock."""
+        if ready():
+            return True
+        if not block:
+            return False
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def _put(self, item, block, timeout):
+        """Add the given item, waiting for room if this container is full, or
+        raise ValueError if there is still no room after timeout seconds"""
+        with self.lock:
+            if not self._wait(self.not_full, self._has_room, block, timeout):
+                raise ValueError('{} is full with {} items'.format(
+                    type(self).__name__, self.container.length()))
+            self._add(item)
+            self.not_empty.notify()
+
+    def _put_many(self, items, block, timeout):
+        """Add all of the given items, holding the lock for as many at a time
+        as there is room for, or raise ValueError if there is no room for the
+        rest after timeout seconds, leaving the items already added. If block
+        is False, add all of the items or, if they do not all fit, none."""
+        items = list(items)
+        deadline = (time.monotonic() + timeout if timeout is not None
+                    else None)
+        count = 0
+        with self.lock:
+            if (not block and self.capacity is not None and
+                    self.container.length() + len(items) > self.capacity):
+                raise ValueError('{} has no room for {} items'.format(
+                    type(self).__name__, len(items)))
+            while count < len(items):
+                remaining = (max(0, deadline - time.monotonic())
+                             if deadline is not None else None)
+                if not self._wait(self.not_full, self._has_room, block,
+                                  remaining):
+                    raise ValueError('{} is full after adding {} of {} items'
+                                     .format(type(self).__name__, count,
+                                             len(items)))
+                added = 0
+                while count < len(items) and self._has_room():
+                    self._add(items[count])
+                    count += 1
+                    added += 1
+                # Wake up one waiting thread for each new item
+                self.not_empty.notify(added)
+
+    def _get(self, block, timeout):
+        """Remove and return an item, waiting for one if this container is
+        empty, or raise ValueError if it is still empty after timeout
+        seconds"""
+        with self.lock:
+            if not self._wait(self.not_empty, self._has_items, block, timeout):
+                raise ValueError('{} is empty'.format(type(self).__name__))
+            item = self._remove()
+            self.not_full.notify()
+            return item
+
+    def drain(self, max_items=None):
+        """Remove and return a list of all items, or at most max_items items,
+        in the order they would be removed one at a time, without waiting"""
+        with self.lock:
+            items = []
+            while self._has_items() and (max_items is None or
+                                         len(items) < max_items):
+                items.append(self._remove())
+            if items:
+                self.not_full.notify_all()
+            return items
+
+
+class BlockingQueue(BlockingContainer):
+    """A BlockingQueue is a thread-safe first-in, first-out queue stored in a
+    circular buffer, whose dequeue can wait for an item to be enqueued."""
+
+    def __init__(self, iterable=None, capacity=None):
+        """Initialize this queue and enqueue the given items, if any"""
+        super(BlockingQueue, self).__init__(ArrayQueue(), iterable, capacity)
+
+    def front(self):
+        """Return the item at the front of this queue without removing it,
+        or None if this queue is empty"""
+        with self.lock:
+            return self.container.front()
+
+    def enqueue(self, item, block=True, timeout=None):
+        """Insert the given item at the back of this queue. If this queue is
+        full, wait until there is room, or raise ValueError after timeout
+        seconds, or at once if block is False."""
+        self._put(item, block, timeout)
+
+    def enqueue_many(self, items, block=True, timeout=None):
+        """Insert all of the given items in order at the back of this queue,
+        taking the lock once instead of once per item unless it is full.
+        If there is no room for the rest of the items after timeout seconds,
+        raise ValueError and leave the items already inserted. If block is
+        False, insert all of the items, or raise ValueError and insert none
+        if they do not all fit."""
+        self._put_many(items, block, timeout)
+
+    def dequeue(self, block=True, timeout=None):
+        """Remove and return the item at the front of this queue. If this
+        queue is empty, wait for an item, or raise ValueError after timeout
+        seconds, or at once if block is False."""
+        return self._get(block, timeout)
+
+    def _add(self, item):
+        """Enqueue the given item at the back. Hold the lock."""
+        self.container.enqueue(item)
+
+    def _remove(self):
+        """Dequeue the item at the front. Hold the lock."""
+        return self.container.dequeue()
+
+
+class BlockingStack(BlockingContainer):
+    """A BlockingStack is a thread-safe last-in, first-out stack stored in a
+    dynamic array, whose pop can wait for an item to be pushed."""
+
+    def __init__(self, iterable=None, capacity=None):
+        """Initialize this stack and push the given items, if any"""
+        super(BlockingStack, self).__init__(ArrayStack(), iterable, capacity)
+
+    def peek(self):
+        """Return the item on the top of this stack without removing it,
+        or None if this stack is empty"""
+        with self.lock:
+            return self.container.peek()
+
+    def push(self, item, block=True, timeout=None):
+        """Insert the given item on the top of this stack. If this stack is
+        full, wait until there is room, or raise ValueError after timeout
+        seconds, or at once if block is False."""
+        self._put(item, block, timeout)
+
+    def push_many(self, items, block=True, timeout=None):
+        """Insert all of the given items in order on the top of this stack,
+        taking the lock once instead of once per item unless it is full.
+        If there is no room for the rest of the items after timeout seconds,
+        raise ValueError and leave the items already pushed. If block is
+        False, push all of the items, or raise ValueError and push none if
+        they do not all fit."""
+        self._put_many(items, block, timeout)
+
+    def pop(self, block=True, timeout=None):
+        """Remove and return the item on the top of this stack. If this
+        stack is empty, wait for an item, or raise ValueError after timeout
+        seconds, or at once if block is False."""
+        return self._get(block, timeout)
+
+    def _add(self, item):
+        """Push the given item on the top. Hold the lock."""
+        self.container.push(item)
+
+    def _remove(self):
+        """Pop the item on the top. Hold the lock."""
+        return self.container.pop()
@@ -0,0 +1,720 @@
+#!python
+
+from cache import Cache
+import bisect
+import io
+import os
+import struct
+
+
+class BTreeNode(object):
+
+    __slots__ = ('page', 'leaf', 'keys', 'values', 'children', 'next')
+
+    def __init__(self, leaf, keys=None, values=None, children=None,
+                 next_page=None):
+        """Initialize this node as a leaf with the given sorted keys and their
+        values, or as an internal node with the given sorted separator keys
+        and the page numbers of its children, one more than its keys"""
+        self.page = None  # Page number assigned by the tree's pager
+        self.leaf = leaf
+        self.keys = keys if keys is not None else []
+        self.values = values if leaf and values is not None else (
+            [] if leaf else None)
+        self.children = children if not leaf and children is not None else (
+            None if leaf else [])
+        # Page number of the next leaf in key order, linking all leaves
+        self.next = next_page
+
+    def __repr__(self):
+        """Return a string representation of this node"""
+        kind = 'leaf' if self.leaf else 'internal'
+        return 'BTreeNode({} page {}, keys={!r})'.format(kind, self.page,
+                                                         self.keys)
+
+
+class MemoryPager(object):
+    """A MemoryPager keeps the nodes of a B-tree in memory, in a list indexed
+    by page number, so the tree's code is the same in memory and on disk."""
+
+    def __init__(self):
+        """Initialize this pager with no nodes"""
+        self.nodes = []
+        self.free_pages = []  # Page numbers of freed nodes, to reuse
+        self.root = None  # Page number of the root node, set by the tree
+        self.size = 0  # Number of keys in the tree, set by the tree
+
+    def read(self, page):
+        """Return the node with the given page number"""
+        return self.nodes[page]
+
+    def allocate(self, node):
+        """Assign the given new node a page number and store it"""
+        if self.free_pages:
+            node.page = self.free_pages.pop()
+            self.nodes[node.page] = node
+        else:
+            node.page = len(self.nodes)
+            self.nodes.append(node)
+
+    def write(self, node):
+        """Store the changes to the given node, which are already in memory"""
+        pass
+
+    def free(self, node):
+        """Free the given node's page so it can be reused"""
+        self.nodes[node.page] = None
+        self.free_pages.append(node.page)
+
+    def check_writable(self):
+        """Do nothing, since a tree in memory can always be changed"""
+        pass
+
+    def check_entry(self, key, value):
+        """Do nothing, since nodes in memory have no size limit"""
+        pass
+
+    def commit(self):
+        """Save the tree's root and size, which are already in memory"""
+        pass
+
+    def flush(self):
+        """Save all changes, which are already in memory"""
+        pass
+
+    def close(self):
+        """Do nothing, since there is no file to close"""
+        pass
+
+
+# The first page of a B-tree file is a header of magic bytes, format
+# version, page size, node order, root page number, number of keys, number
+# of pages and the first free page number (0 if there are none)
+_HEADER = struct.Struct('<8sIIIQQQQ')
+_MAGIC = b'BTREE001'
+_VERSION = 1
+# Each node page starts with whether it is a leaf, its number of keys and
+# the page number of the next leaf (0 if none), followed by a column of its
+# keys, then a column of a leaf's values or an internal node's child page
+# numbers
+_NODE = struct.Struct('<BHQ')
+_PAGE_NUMBER = struct.Struct('<Q')
+
+# Each key and value in a page is a type tag followed by its data, so
+# reading a page only ever creates these types, and never runs any code
+_NONE = 0
+_BOOL = 1
+_INT = 2
+_FLOAT = 3
+_BYTES = 4
+_TEXT = 5
+_TAG = struct.Struct('<B')
+_BOOL_DATA = struct.Struct('<BB')
+_INT_DATA = struct.Struct('<Bq')
+_FLOAT_DATA = struct.Struct('<Bd')
+_LENGTH_DATA = struct.Struct('<BI')  # Followed by that many bytes
+
+# A column of keys or values starts with a tag saying whether they are all
+# ints, packed together without tags, or all None, which takes no more
+# bytes, both of which are much faster to read and write, or are each
+# encoded with their own tag
+_MIXED_COLUMN = 0
+_INT_COLUMN = 1
+_NONE_COLUMN = 2
+
+try:
+    _INTEGER_TYPES = (int, long)
+except NameError:  # Python 3 has only int
+    _INTEGER_TYPES = (int,)
+_TEXT_TYPE = type(u'')
+_NONE_TYPES = set([type(None)])
+
+
+def _encode(item):
+    """Return the given key or value encoded as bytes, or raise TypeError if
+    it is not None, a bool, an int, a float, a byte string or text"""
+    if item is None:
+        return _TAG.pack(_NONE)
+    if isinstance(item, bool):
+        return _BOOL_DATA.pack(_BOOL, item)
+    if isinstance(item, _INTEGER_TYPES):
+        try:
+            return _INT_DATA.pack(_INT, item)
+        except struct.error:
+            raise ValueError('Integer does not fit in 64 bits: {}'.format(
+                item))
+    if isinstance(item, float):
+        return _FLOAT_DATA.pack(_FLOAT, item)
+    if isinstance(item, bytes):
+        return _LENGTH_DATA.pack(_BYTES, len(item)) + item
+    if isinstance(item, _TEXT_TYPE):
+        data = item.encode('utf-8')
+        return _LENGTH_DATA.pack(_TEXT, len(data)) + data
+    raise TypeError('B-tree files can only store None, bool, int, float, '
+                    'bytes and text, not {}'.format(type(item).__name__))
+
+
+def _decode(data, offset):
+    """Return the key or value encoded in the given bytes at the given offset
+    and the offset after it, or raise ValueError if it is not valid"""
+    tag = _TAG.unpack_from(data, offset)[0]
+    if tag == _NONE:
+        return None, offset + _TAG.size
+    if tag == _BOOL:
+        return (bool(_BOOL_DATA.unpack_from(data, offset)[1]),
+                offset + _BOOL_DATA.size)
+    if tag == _INT:
+        return _INT_DATA.unpack_from(data, offset)[1], offset + _INT_DATA.size
+    if tag == _FLOAT:
+        return (_FLOAT_DATA.unpack_from(data, offset)[1],
+                offset + _FLOAT_DATA.size)
+    if tag == _BYTES or tag == _TEXT:
+        length = _LENGTH_DATA.unpack_from(data, offset)[1]
+        start = offset + _LENGTH_DATA.size
+        if start + length > len(data):
+            raise ValueError('Data runs past the end of the page')
+        item = data[start:start + length]
+        return item.decode('utf-8') if tag == _TEXT else item, start + length
+    raise ValueError('Unknown type tag: {}'.format(tag))
+
+
+def _encode_column(items):
+    """Return the given list of keys or values encoded as bytes"""
+    # Compare exact types, since a bool is an int but must stay a bool
+    types = set(map(type, items))
+    if types == _NONE_TYPES:
+        return _TAG.pack(_NONE_COLUMN)
+    if types and types.issubset(_INTEGER_TYPES):
+        try:
+            return _TAG.pack(_INT_COLUMN) + struct.pack(
+                '<{}q'.format(len(items)), *items)
+        except struct.error:
+            pass  # An int does not fit in 64 bits, which _encode reports
+    return _TAG.pack(_MIXED_COLUMN) + b''.join(map(_encode, items))
+
+
+def _decode_column(data, offset, count):
+    """Return a list of the given number of keys or values encoded in the
+    given bytes at the given offset and the offset after them"""
+    tag = _TAG.unpack_from(data, offset)[0]
+    offset += _TAG.size
+    if tag == _INT_COLUMN:
+        items = list(struct.unpack_from('<{}q'.format(count), data, offset))
+        return items, offset + 8 * count
+    if tag == _NONE_COLUMN:
+        return [None] * count, offset
+    if tag != _MIXED_COLUMN:
+        raise ValueError('Unknown column tag: {}'.format(tag))
+    items = []
+    for _ in range(count):
+        item, offset = _decode(data, offset)
+        items.append(item)
+    return items, offset
+
+
+class FilePager(object):
+    """A FilePager stores the nodes of a B-tree in fixed-size pages of a file,
+    and keeps the most recently used nodes in an LRU cache, so lookups near
+    the root never read the file. Every changed node is written to its page
+    right away (write-through), so evicting a cached node never loses data,
+    and the header is written after every insert or delete, so the file is
+    complete even if it is never closed. An operation cut short by a crash
+    can still leave the file inconsistent; it is not crash-safe like
+    DiskHashTable. Keys and values are encoded with a fixed format, so only
+    None, bools, ints, floats, byte strings and text can be stored."""
+
+    def __init__(self, path, mode='c', order=64, page_size=4096,
+                 cache_size=256):
+        """Open the B-tree file at the given path in the given mode: 'r' to
+        read an existing tree, 'w' to read and write an existing tree, 'c' to
+        also create it if it does not exist, or 'n' to always create a new,
+        empty tree. A new tree uses the given order and page size; an
+        existing tree uses those it was created with."""
+        if mode not in ('r', 'w', 'c', 'n'):
+            raise ValueError('Invalid mode: {!r}'.format(mode))
+        self.path = path
+        self.writable = mode != 'r'
+        self.cache = Cache(max_entries=cache_size)
+        if mode == 'n' or (mode == 'c' and not os.path.exists(path)):
+            self.page_size = page_size
+            self.order = order
+            self._check_layout()
+            self.file = io.open(path, 'w+b')
+            self.root = None
+            self.size = 0
+            self.page_count = 1  # The header page
+            self.free_page = 0
+            self.flush()
+        else:
+            self.file = io.open(path, 'r+b' if self.writable else 'rb')
+            header = self.file.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:8] != _MAGIC:
+                self.file.close()
+                raise ValueError('Not a B-tree file: {!r}'.format(path))
+            (_, version, self.page_size, self.order, root, self.size,
+             self.page_count, self.free_page) = _HEADER.unpack(header)
+            try:
+                self._check_layout()
+            except ValueError:
+                self.file.close()
+                raise
+            # Page 0 is the header, so a root of 0 means the tree is empty
+            self.root = root or None
+
+    def _check_layout(self):
+        """Set the number of bytes each key and value may use together so a
+        full node always fits in a page, or raise ValueError if a page is too
+        small to hold a full node of int keys and values"""
+        # An internal node has one more child page number than keys, and a
+        # leaf has a column tag before its keys and another before its values
+        self.max_entry_size = ((self.page_size - _NODE.size - 2 * _TAG.size -
+                                self.order * _PAGE_NUMBER.size) //
+                               max(self.order - 1, 1))
+        if self.order < 3 or self.max_entry_size < 2 * _INT_DATA.size:
+            raise ValueError('Page size {} is too small for order {}'.format(
+                self.page_size, self.order))
+
+    def check_writable(self):
+        """Raise ValueError if this file is open for reading only"""
+        if not self.writable:
+            raise ValueError('B-tree is open for reading only')
+
+    def check_entry(self, key, value):
+        """Raise TypeError if the given key or value cannot be stored, or
+        ValueError if together they are larger than each entry may be, or if
+        this file is open for reading only, before any node is changed"""
+        self.check_writable()
+        size = len(_encode(key)) + len(_encode(value))
+        if size > self.max_entry_size:
+            raise ValueError('Key and value of {} bytes are larger than the '
+                             '{} bytes a page of {} bytes has room for at '
+                             'order {}'.format(size, self.max_entry_size,
+                                               self.page_size, self.order))
+
+    def read(self, page):
+        """Return the node stored in the given page, from the cache if it is
+        there, or else from the file, or raise ValueError if it is corrupt"""
+        try:
+            return self.cache.get(page)
+        except KeyError:
+            pass
+        self.file.seek(page * self.page_size)
+        data = self.file.read(self.page_size)
+        try:
+            node = self._decode_node(data)
+        except (struct.error, ValueError) as error:
+            raise ValueError('Corrupt B-tree page {} in {!r}: {}'.format(
+                page, self.path, error))
+        node.page = page
+        self.cache.set(page, node)
+        return node
+
+    def _decode_node(self, data):
+        """Return the node encoded in the given page of bytes"""
+        leaf, count, next_page = _NODE.unpack_from(data)
+        keys, offset = _decode_column(data, _NODE.size, count)
+        if leaf:
+            values = _decode_column(data, offset, count)[0]
+            return BTreeNode(True, keys, values, next_page=next_page or None)
+        children = list(struct.unpack_from('<{}Q'.format(count + 1), data,
+                                           offset))
+        for child in children:
+            if not 0 < child < self.page_count:
+                raise ValueError('Child page {} out of range'.format(child))
+        return BTreeNode(False, keys, children=children)
+
+    def allocate(self, node):
+        """Assign the given new node a page number, reusing a free page if
+        there is one, and write it"""
+        if self.free_page:
+            node.page = self.free_page
+            # Each free page stores the number of the next free page
+            self.file.seek(node.page * self.page_size)
+            self.free_page = _PAGE_NUMBER.unpack(
+                self.file.read(_PAGE_NUMBER.size))[0]
+        else:
+            node.page = self.page_count
+            self.page_count += 1
+        self.write(node)
+
+    def write(self, node):
+        """Write the given node to its page. The tree checks each key and
+        value with check_entry first, so a full node always fits."""
+        self.check_writable()
+        parts = [_NODE.pack(node.leaf, len(node.keys), node.next or 0),
+                 _encode_column(node.keys)]
+        if node.leaf:
+            parts.append(_encode_column(node.values))
+        else:
+            parts.append(struct.pack('<{}Q'.format(len(node.children)),
+                                     *node.children))
+        self.file.seek(node.page * self.page_size)
+        self.file.write(b''.join(parts).ljust(self.page_size, b'\0'))
+        self.cache.set(node.page, node)
+
+    def free(self, node):
+        """Add the given node's page to the list of free pages"""
+        try:
+            self.cache.delete(node.page)
+        except KeyError:
+            pass
+        self.file.seek(node.page * self.page_size)
+        self.file.write(_PAGE_NUMBER.pack(self.free_page))
+        self.free_page = node.page
+
+    def _write_header(self):
+        """Write the header with the tree's root, size and free pages"""
+        self.file.seek(0)
+        self.file.write(_HEADER.pack(
+            _MAGIC, _VERSION, self.page_size, self.order, self.root or 0,
+            self.size, self.page_count, self.free_page).ljust(
+                self.page_size, b'\0'))
+
+    def commit(self):
+        """Write the header and hand all written pages to the operating
+        system, after an insert or delete, so another process or a reopen
+        sees the change even if this file is never closed"""
+        self._write_header()
+        self.file.flush()
+
+    def flush(self):
+        """Write the header and all changed pages to disk"""
+        if not self.writable:
+            return
+        self.commit()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        """Flush and close the file"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class BTree(object):
+    """A BTree is a B+ tree: a balanced search tree that maps sorted keys to
+    values. Each node holds up to order - 1 keys, so the tree's height is
+    O(log n) with base order/2 instead of 2, which keeps it to 3 or 4 levels
+    for millions of keys. Values are only stored in the leaves, which are
+    linked in key order so range scans never go back up the tree.
+    Nodes are kept in memory, or in pages of a file with a page cache if a
+    path is given, so the tree can be much larger than memory. In a file,
+    keys and values must be None, bools, ints, floats, bytes or text, and
+    each key and value together must fit in the pager's max_entry_size,
+    about page_size / order bytes, so that a full node fits in a page."""
+
+    def __init__(self, items=None, order=64, path=None, mode='c',
+                 page_size=4096, cache_size=256):
+        """Initialize this B-tree and insert the given (key, value) pairs, if
+        any. If a path is given, open the tree stored in that file in the
+        given mode ('r', 'w', 'c' or 'n'), using the given page size and
+        caching up to cache_size nodes in memory."""
+        if order < 3:
+            raise ValueError('B-tree order must be at least 3: {}'.format(
+                order))
+        if path is None:
+            self.pager = MemoryPager()
+            self.order = order
+        else:
+            self.pager = FilePager(path, mode, order, page_size, cache_size)
+            self.order = self.pager.order
+        self.max_keys = self.order - 1
+        # Every node except the root has at least this many keys
+        self.min_keys = (self.order - 1) // 2
+        if items is not None:
+            for key, value in items:
+                self.insert(key, value)
+
+    def __repr__(self):
+        """Return a string representation of this B-tree"""
+        return 'BTree({} keys, order {})'.format(self.size, self.order)
+
+    def __len__(self):
+        """Return the number of keys in this B-tree"""
+        return self.pager.size
+
+    def __iter__(self):
+        """Return a generator of the keys in this B-tree in order"""
+        for key, _ in self.range():
+            yield key
+
+    def __enter__(self):
+        """Return this tree to use in a with statement"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close this tree at the end of a with statement"""
+        self.close()
+
+    @property
+    def size(self):
+        """The number of keys in this B-tree"""
+        return self.pager.size
+
+    def is_empty(self):
+        """Return True if this B-tree is empty, or False otherwise"""
+        return self.pager.root is None
+
+    def height(self):
+        """Return the number of edges from the root to the leaves, which are
+        all at the same depth. Running time: O(log n)"""
+        if self.pager.root is None:
+            return -1
+        height = 0
+        node = self.pager.read(self.pager.root)
+        while not node.leaf:
+            node = self.pager.read(node.children[0])
+            height += 1
+        return height
+
+    def flush(self):
+        """Write all changes to disk, if this tree is stored in a file"""
+        self.pager.flush()
+
+    def close(self):
+        """Write all changes to disk and close the file, if any"""
+        self.pager.close()
+
+    def _find_leaf(self, key):
+        """Return the leaf where the given key is or belongs and the path of
+        (internal node, child index) pairs from the root down to it"""
+        path = []
+        node = self.pager.read(self.pager.root)
+        while not node.leaf:
+            # Keys equal to a separator are in the right subtree
+            index = bisect.bisect_right(node.keys, key)
+            path.append((node, index))
+            node = self.pager.read(node.children[index])
+        return node, path
+
+    def contains(self, key):
+        """Return True if this B-tree contains the given key, or False"""
+        if self.pager.root is None:
+            return False
+        leaf = self._find_leaf(key)[0]
+        index = bisect.bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+
+    def search(self, key):
+        """Return the value associated with the given key, or None if this
+        B-tree does not contain it. Running time: O(log n) comparisons, and
+        one node read per level."""
+        if self.pager.root is None:
+            return None
+        leaf = self._find_leaf(key)[0]
+        index = bisect.bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return None
+
+    def insert(self, key, value=None):
+        """Insert the given key with the given value into this B-tree, or
+        update its value if the key is already in this tree.
+        Running time: O(log n), splitting full nodes on the way back up."""
+        # Check the key and value fit in a page before changing any node
+        self.pager.check_entry(key, value)
+        self._insert(key, value)
+        self.pager.commit()
+
+    def _insert(self, key, value):
+        """Insert the given key with the given value, or update its value"""
+        pager = self.pager
+        if pager.root is None:
+            root = BTreeNode(True, [key], [value])
+            pager.allocate(root)
+            pager.root = root.page
+            pager.size = 1
+            return
+        leaf, path = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.values[index] = value
+            pager.write(leaf)
+            return
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, value)
+        pager.size += 1
+        node = leaf
+        # Split full nodes from the leaf up, inserting separators into parents
+        while len(node.keys) > self.max_keys:
+            separator, right = self._split(node)
+            if path:
+                parent, child_index = path.pop()
+                parent.keys.insert(child_index, separator)
+                parent.children.insert(child_index + 1, right.page)
+                node = parent
+            else:
+                # The root split, so the tree grows one level taller
+                root = BTreeNode(False, [separator],
+                                 children=[node.page, right.page])
+                pager.allocate(root)
+                pager.root = root.page
+                return
+        pager.write(node)
+
+    def _split(self, node):
+        """Move the upper half of the given full node's keys into a new right
+        sibling, write both nodes, and return the separator key to insert
+        into the parent and the new sibling"""
+        middle = len(node.keys) // 2
+        if node.leaf:
+            # Leaves keep every key, so the separator is copied up
+            right = BTreeNode(True, node.keys[middle:], node.values[middle:],
+                              next_page=node.next)
+            separator = right.keys[0]
+            del node.keys[middle:]
+            del node.values[middle:]
+        else:
+            # Internal nodes move the middle key up to the parent
+            right = BTreeNode(False, node.keys[middle + 1:],
+                              children=node.children[middle + 1:])
+            separator = node.keys[middle]
+            del node.keys[middle:]
+            del node.children[middle + 1:]
+        self.pager.allocate(right)
+        if node.leaf:
+            node.next = right.page
+        self.pager.write(node)
+        return separator, right
+
+    def delete(self, key):
+        """Delete the given key and its value from this B-tree, or raise
+        ValueError if it is not in this tree. Running time: O(log n),
+        borrowing from or merging with siblings on the way back up."""
+        self.pager.check_writable()
+        self._delete(key)
+        self.pager.commit()
+
+    def _delete(self, key):
+        """Delete the given key and its value, or raise ValueError"""
+        pager = self.pager
+        if pager.root is None:
+            raise ValueError('Key not found: {!r}'.format(key))
+        leaf, path = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            raise ValueError('Key not found: {!r}'.format(key))
+        del leaf.keys[index]
+        del leaf.values[index]
+        pager.size -= 1
+        node = leaf
+        while path and len(node.keys) < self.min_keys:
+            parent, child_index = path.pop()
+            self._fix_underflow(parent, child_index, node)
+            node = parent
+        if not path and not node.keys:
+            # The root is empty: an empty leaf or an internal node left with
+            # only one child, so the tree shrinks one level shorter
+            if node.leaf:
+                pager.root = None
+            else:
+                pager.root = node.children[0]
+            pager.free(node)
+        else:
+            pager.write(node)
+
+    def _fix_underflow(self, parent, index, node):
+        """Restore the minimum number of keys in the given node, which is the
+        given parent's child at the given index, by borrowing a key from a
+        sibling with keys to spare, or else merging with a sibling"""
+        pager = self.pager
+        left = pager.read(parent.children[index - 1]) if index > 0 else None
+        right = (pager.read(parent.children[index + 1])
+                 if index + 1 < len(parent.children) else None)
+        if left is not None and len(left.keys) > self.min_keys:
+            # Rotate the left sibling's last key through the parent
+            if node.leaf:
+                node.keys.insert(0, left.keys.pop())
+                node.values.insert(0, left.values.pop())
+                parent.keys[index - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[index - 1])
+                node.children.insert(0, left.children.pop())
+                parent.keys[index - 1] = left.keys.pop()
+            pager.write(left)
+            pager.write(node)
+        elif right is not None and len(right.keys) > self.min_keys:
+            # Rotate the right sibling's first key through the parent
+            if node.leaf:
+                node.keys.append(right.keys.pop(0))
+                node.values.append(right.values.pop(0))
+                parent.keys[index] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[index])
+                node.children.append(right.children.pop(0))
+                parent.keys[index] = right.keys.pop(0)
+            pager.write(right)
+            pager.write(node)
+        elif left is not None:
+            self._merge(parent, index - 1, left, node)
+        else:
+            self._merge(parent, index, node, right)
+
+    def _merge(self, parent, index, left, right):
+        """Merge the given right node into its left sibling, which is the
+        given parent's child at the given index, and free the right node"""
+        if left.leaf:
+            left.keys.extend(right.keys)
+            left.values.extend(right.values)
+            left.next = right.next
+        else:
+            # Pull the separator down between the two nodes' keys
+            left.keys.append(parent.keys[index])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+        del parent.keys[index]
+        del parent.children[index + 1]
+        self.pager.write(left)
+        self.pager.free(right)
+
+    def range(self, low=None, high=None):
+        """Return a generator of the (key, value) pairs in this B-tree with
+        keys between the given low and high keys, inclusive, in order, or all
+        pairs if no bounds are given. Running time: O(log n + k) for k pairs,
+        following the links between leaves."""
+        if self.pager.root is None:
+            return
+        if low is None:
+            node = self.pager.read(self.pager.root)
+            while not node.leaf:
+                node = self.pager.read(node.children[0])
+            index = 0
+        else:
+            node = self._find_leaf(low)[0]
+            index = bisect.bisect_left(node.keys, low)
+        while True:
+            keys = node.keys
+            values = node.values
+            while index < len(keys):
+                if high is not None and high < keys[index]:
+                    return
+                yield keys[index], values[index]
+                index += 1
+            if node.next is None:
+                return
+            node = self.pager.read(node.next)
+            index = 0
+
+    def keys(self):
+        """Return a list of all keys in this B-tree in order"""
+        return [key for key, _ in self.range()]
+
+    def items(self):
+        """Return a list of all (key, value) pairs in this B-tree in order"""
+        return list(self.range())
+
+
+def test_b_tree():
+    tree = BTree(order=4)
+    for key in range(1, 16):
+        tree.insert(key, str(key))
+        print('insert({}), size: {}, height: {}'.format(
+            key, tree.size, tree.height()))
+    print('range(5, 9): ' + str(list(tree.range(5, 9))))
+    for key in range(1, 16, 2):
+        tree.delete(key)
+    print('after deleting odd keys: ' + str(tree.keys()))
+
+
+if __name__ == '__main__':
+    test_b_tree()
@@ -0,0 +1,303 @@
+#!python
+
+from hashtable import HashTable
+from linkedlist import DoublyLinkedList
+import functools
+import sys
+import time
+
+
+# Default for get's default argument, meaning raise KeyError if not found
+_NO_DEFAULT = object()
+# Returned by get to memoized functions when their arguments are not cached
+_MISSING = object()
+# Separates positional from keyword arguments in memoized functions' keys
+_KWD_MARK = object()
+
+
+class CacheEntry(object):
+
+    __slots__ = ('key', 'value', 'size', 'expires', 'frequency')
+
+    def __init__(self, key, value, size=0, expires=None):
+        """Initialize this cache entry with the given key, value, size in
+        bytes and expiration time (or None if it never expires)"""
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.frequency = 1  # Count number of times this entry was used
+
+    def __repr__(self):
+        """Return a string representation of this cache entry"""
+        return 'CacheEntry({!r}: {!r})'.format(self.key, self.value)
+
+
+class Cache(object):
+    """A Cache is a bounded map that evicts its least recently used entry
+    (LRU) when it is full. A hash table maps each key to its entry's node in
+    a doubly linked list ordered from most to least recently used, so get,
+    set, delete and eviction are all O(1) time on average."""
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=None, clock=time.monotonic):
+        """Initialize this cache with the given limits, if any: the maximum
+        number of entries, the maximum total size in bytes of all values as
+        measured by the given sizeof function (sys.getsizeof by default), and
+        the default time to live in seconds as measured by the given clock"""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof if sizeof is not None else sys.getsizeof
+        self.clock = clock
+        # Map each key to the linked list node that holds its entry
+        self.table = HashTable()
+        # Order entries from most recently used (head) to least (tail)
+        self.order = DoublyLinkedList()
+        self.bytes = 0  # Total size of all values in bytes
+        self.hits = 0  # Count number of gets that found a live entry
+        self.misses = 0  # Count number of gets that did not
+        self.evictions = 0  # Count number of entries evicted to make room
+        self.expirations = 0  # Count number of entries removed after ttl
+
+    def __repr__(self):
+        """Return a string representation of this cache"""
+        return '{}({} entries)'.format(type(self).__name__, self.length())
+
+    def __len__(self):
+        """Return the number of entries in this cache"""
+        return self.table.size
+
+    def length(self):
+        """Return the number of entries in this cache, including any expired
+        entries that have not been removed yet"""
+        return self.table.size
+
+    def stats(self):
+        """Return a dictionary of this cache's counters and current usage"""
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expirations': self.expirations,
+                'entries': self.table.size, 'bytes': self.bytes}
+
+    def _is_expired(self, entry):
+        """Return True if the given entry's time to live has passed"""
+        return entry.expires is not None and self.clock() >= entry.expires
+
+    def _live_node(self, key):
+        """Return the node holding the given key's entry, or None if the key
+        is not in this cache. Removes the entry if it has expired."""
+        node = self.table.get(key, None)
+        if node is None:
+            return None
+        if self._is_expired(node.data):
+            self._remove(node)
+            self.expirations += 1
+            return None
+        return node
+
+    def contains(self, key):
+        """Return True if this cache contains a live entry with the given key,
+        or False, without counting a hit or miss or marking it as used"""
+        return self._live_node(key) is not None
+
+    def get(self, key, default=_NO_DEFAULT):
+        """Return the value associated with the given key and mark it as used.
+        If the key is not in this cache or has expired, return the given
+        default, or raise KeyError if no default is given."""
+        node = self._live_node(key)
+        if node is None:
+            self.misses += 1
+            if default is not _NO_DEFAULT:
+                return default
+            raise KeyError('Key not found: {}'.format(key))
+        self.hits += 1
+        self._touch(node)
+        return node.data.value
+
+    def set(self, key, value, ttl=None):
+        """Insert or update the given key with its associated value, expiring
+        after the given time to live in seconds (or this cache's default ttl),
+        evicting entries as needed to stay within this cache's limits.
+        A value larger than max_bytes on its own is not cached at all.
+        Updating a key keeps its entry's usage history and marks it as used."""
+        entry = None
+        node = self.table.get(key, None)
+        if node is not None:
+            # Take the old entry out while making room, so it is never the
+            # one evicted, and reuse it unless it has expired
+            self._remove(node)
+            if not self._is_expired(node.data):
+                entry = node.data
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if ttl is None:
+            ttl = self.ttl
+        expires = self.clock() + ttl if ttl is not None else None
+        # Evict before inserting so the new entry is never the one evicted
+        self._make_room(size)
+        if entry is None:
+            self.table.set(key, self._insert(CacheEntry(key, value, size,
+                                                        expires)))
+        else:
+            entry.value = value
+            entry.size = size
+            entry.expires = expires
+            node = self._insert(entry)
+            self.table.set(key, node)
+            self._touch(node)
+        self.bytes += size
+
+    def delete(self, key):
+        """Delete the given key and its associated value, or raise KeyError"""
+        self._remove(self.table.get(key))
+
+    def clear(self):
+        """Delete all entries in this cache, but keep its counters"""
+        for node in self.table.values():
+            self._remove(node)
+
+    def expire(self):
+        """Remove all expired entries, which are otherwise only removed when
+        they are looked up. Running time: O(n) for n entries."""
+        for node in self.table.values():
+            if self._is_expired(node.data):
+                self._remove(node)
+                self.expirations += 1
+
+    def _make_room(self, size):
+        """Evict entries until one more entry of the given size fits"""
+        while self.table.size > 0 and (
+                (self.max_entries is not None and
+                 self.table.size >= self.max_entries) or
+                (self.max_bytes is not None and
+                 self.bytes + size > self.max_bytes)):
+            self._remove(self._victim())
+            self.evictions += 1
+
+    def _remove(self, node):
+        """Remove the given node's entry from this cache"""
+        entry = node.data
+        self.table.delete(entry.key)
+        self._unlink(node)
+        self.bytes -= entry.size
+
+    def _insert(self, entry):
+        """Add the given entry to the usage order and return its node"""
+        return self.order.prepend(entry)
+
+    def _touch(self, node):
+        """Mark the given node's entry as the most recently used"""
+        self.order.move_to_front(node)
+
+    def _unlink(self, node):
+        """Remove the given node from the usage order"""
+        self.order.remove_node(node)
+
+    def _victim(self):
+        """Return the node of the entry to evict next: the least recently
+        used"""
+        return self.order.tail
+
+
+class LFUCache(Cache):
+    """An LFUCache is a bounded map that evicts its least frequently used
+    entry when it is full, breaking ties by evicting the least recently used.
+    Entries are kept in one doubly linked list per use count, so marking an
+    entry as used moves it to the next count's list in O(1) time."""
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=None, clock=time.monotonic):
+        """Initialize this cache with the given limits, if any"""
+        super(LFUCache, self).__init__(max_entries, max_bytes, ttl, sizeof,
+                                       clock)
+        # Map each use count to a list of entries used that many times,
+        # ordered from most recently used (head) to least (tail)
+        self.frequency_lists = HashTable()
+        self.min_frequency = 0  # Least use count of any entry
+
+    def _frequency_list(self, frequency):
+        """Return the list of entries with the given use count, creating it if
+        it does not exist yet"""
+        try:
+            return self.frequency_lists.get(frequency)
+        except KeyError:
+            entries = DoublyLinkedList()
+            self.frequency_lists.set(frequency, entries)
+            return entries
+
+    def _insert(self, entry):
+        """Add the given entry to the list for its use count, which is 1 for
+        a new entry"""
+        if self.table.size == 0 or entry.frequency < self.min_frequency:
+            self.min_frequency = entry.frequency
+        return self._frequency_list(entry.frequency).prepend(entry)
+
+    def _touch(self, node):
+        """Move the given node's entry to the list for its next use count"""
+        entry = node.data
+        self._unlink(node)
+        if (entry.frequency == self.min_frequency and
+                not self.frequency_lists.contains(entry.frequency)):
+            self.min_frequency += 1
+        entry.frequency += 1
+        # Point the key at the entry's new node in the next count's list
+        self.table.set(entry.key, self._frequency_list(entry.frequency)
+                       .prepend(entry))
+
+    def _unlink(self, node):
+        """Remove the given node from its use count's list, and remove that
+        list if it is now empty"""
+        frequency = node.data.frequency
+        entries = self.frequency_lists.get(frequency)
+        entries.remove_node(node)
+        if entries.is_empty():
+            self.frequency_lists.delete(frequency)
+
+    def _victim(self):
+        """Return the node of the entry to evict next: the least recently used
+        of the least frequently used entries"""
+        if not self.frequency_lists.contains(self.min_frequency):
+            # Entries were deleted directly, so find the least use count left
+            self.min_frequency = min(self.frequency_lists.keys())
+        return self.frequency_lists.get(self.min_frequency).tail
+
+
+def memoize(cache=None, **options):
+    """Return a decorator that caches a function's results by its arguments in
+    the given cache, or a new Cache created with the given options, such as
+    max_entries. The decorated function's cache is its cache attribute.
+    All arguments must be hashable."""
+    if cache is None:
+        cache = Cache(**options)
+
+    def decorator(function):
+        @functools.wraps(function)
+        def memoized(*args, **kwargs):
+            key = (args if not kwargs else
+                   args + (_KWD_MARK,) + tuple(sorted(kwargs.items())))
+            # Look up with a default so a miss does not raise and catch a
+            # KeyError, since misses are as common as hits in many uses
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.set(key, result)
+            return result
+        memoized.cache = cache
+        return memoized
+    return decorator
+
+
+def test_cache():
+    cache = Cache(max_entries=2)
+    print('cache: ' + str(cache))
+    cache.set('A', 1)
+    cache.set('B', 2)
+    print('get(A): ' + str(cache.get('A')))
+    cache.set('C', 3)  # Should evict B, the least recently used
+    print('set(C, 3), contains(B): ' + str(cache.contains('B')))
+    print('stats: ' + str(cache.stats()))
+
+
+if __name__ == '__main__':
+    test_cache()
@@ -0,0 +1,158 @@
+#!python
+
+
+class Block(object):
+
+    __slots__ = ('data', 'prev', 'next')
+
+    def __init__(self, length):
+        """Initialize this block with the given number of empty slots"""
+        self.data = [None] * length
+        self.prev = None
+        self.next = None
+
+    def __repr__(self):
+        """Return a string representation of this block"""
+        return 'Block({} slots)'.format(len(self.data))
+
+
+class BlockDeque(object):
+    """A BlockDeque is a double-ended queue that stores its items in
+    fixed-size arrays (blocks) linked together in a doubly linked list, like
+    CPython's collections.deque. Adding or removing an item at either end is
+    O(1) time, and only allocates or frees a block once every block_length
+    items, instead of allocating one node object per item."""
+
+    # Number of item slots in each block
+    block_length = 64
+
+    def __init__(self, iterable=None):
+        """Initialize this deque and append the given items, if any"""
+        # Start with one block and the ends centered in it, so it can grow
+        # in either direction before another block is needed
+        block = Block(self.block_length)
+        self.left_block = block  # Block holding the leftmost (head) item
+        self.right_block = block  # Block holding the rightmost (tail) item
+        self.left_index = self.block_length // 2  # Index of the head item
+        self.right_index = self.left_index - 1  # Index of the tail item
+        self.size = 0  # Count number of items in all blocks
+        if iterable:
+            for item in iterable:
+                self.append(item)
+
+    def __repr__(self):
+        """Return a string representation of this deque"""
+        return 'BlockDeque({!r})'.format(self.items())
+
+    def __len__(self):
+        """Return the number of items in this deque"""
+        return self.size
+
+    def __iter__(self):
+        """Return a generator of the items in this deque from head to tail"""
+        block = self.left_block
+        index = self.left_index
+        for _ in range(self.size):
+            if index == self.block_length:
+                block = block.next
+                index = 0
+            yield block.data[index]
+            index += 1
+
+    def items(self):
+        """Return a list of all items in this deque from head to tail"""
+        return list(self)
+
+    def is_empty(self):
+        """Return True if this deque is empty, or False otherwise"""
+        return self.size == 0
+
+    def length(self):
+        """Return the number of items in this deque"""
+        return self.size
+
+    def first(self):
+        """Return the item at the head of this deque, or None if it is empty"""
+        if self.size == 0:
+            return None
+        return self.left_block.data[self.left_index]
+
+    def last(self):
+        """Return the item at the tail of this deque, or None if it is empty"""
+        if self.size == 0:
+            return None
+        return self.right_block.data[self.right_index]
+
+    def append(self, item):
+        """Insert the given item at the tail of this deque.
+        Running time: O(1), allocating a new block if the tail block is full"""
+        if self.right_index == self.block_length - 1:
+            block = Block(self.block_length)
+            block.prev = self.right_block
+            self.right_block.next = block
+            self.right_block = block
+            self.right_index = -1
+        self.right_index += 1
+        self.right_block.data[self.right_index] = item
+        self.size += 1
+
+    def prepend(self, item):
+        """Insert the given item at the head of this deque.
+        Running time: O(1), allocating a new block if the head block is full"""
+        if self.left_index == 0:
+            block = Block(self.block_length)
+            block.next = self.left_block
+            self.left_block.prev = block
+            self.left_block = block
+            self.left_index = self.block_length
+        self.left_index -= 1
+        self.left_block.data[self.left_index] = item
+        self.size += 1
+
+    def pop_head(self):
+        """Remove and return the item at the head of this deque, or raise
+        ValueError if it is empty. Running time: O(1), freeing the head block
+        once its last item is removed"""
+        if self.size == 0:
+            raise ValueError('Deque is empty and has no head item')
+        block = self.left_block
+        item = block.data[self.left_index]
+        # Clear the slot so the block does not keep the item alive
+        block.data[self.left_index] = None
+        self.left_index += 1
+        self.size -= 1
+        if self.size == 0:
+            self._recenter()
+        elif self.left_index == self.block_length:
+            # The head block is empty, so unlink it and move to the next
+            self.left_block = block.next
+            self.left_block.prev = None
+            self.left_index = 0
+        return item
+
+    def pop_tail(self):
+        """Remove and return the item at the tail of this deque, or raise
+        ValueError if it is empty. Running time: O(1), freeing the tail block
+        once its last item is removed"""
+        if self.size == 0:
+            raise ValueError('Deque is empty and has no tail item')
+        block = self.right_block
+        item = block.data[self.right_index]
+        # Clear the slot so the block does not keep the item alive
+        block.data[self.right_index] = None
+        self.right_index -= 1
+        self.size -= 1
+        if self.size == 0:
+            self._recenter()
+        elif self.right_index == -1:
+            # The tail block is empty, so unlink it and move to the previous
+            self.right_block = block.prev
+            self.right_block.next = None
+            self.right_index = self.block_length - 1
+        return item
+
+    def _recenter(self):
+        """Center the ends of this empty deque in its only block again, so it
+        can grow in either direction before another block is needed"""
+        self.left_index = self.block_length // 2
+        self.right_index = self.left_index - 1
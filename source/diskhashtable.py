@@ -0,0 +1,435 @@
+#!python
+
+import io
+import mmap
+import os
+import struct
+import zlib
+
+# The index file starts with a header of magic bytes, format version, flags,
+# capacity (number of slots), number of entries, number of used slots
+# (entries plus tombstones) and the next sequence number
+_HEADER = struct.Struct('<8sIIQQQQ')
+_HEADER_SIZE = 64
+_MAGIC = b'DISKHASH'
+_VERSION = 1
+# Flag set while the file is open for writing, so a crash can be detected
+_DIRTY = 1
+
+# Each slot has a fixed size: a state, the key's hash, the key and value
+# lengths, the offset of the key and value in the overflow file if they do
+# not fit inline, and a sequence number that orders writes for recovery,
+# followed by an inline area for a short key and value
+_SLOT = struct.Struct('<BxxxIIIQQ')
+_SLOT_SIZE = 64
+_INLINE_SIZE = _SLOT_SIZE - _SLOT.size
+
+# Slot states; only the state byte is written last, to commit a slot
+_EMPTY = 0
+_INLINE = 1
+_OVERFLOW = 2
+_DELETED = 3
+
+# Replace the destination file atomically, even on Windows if possible
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _hash(key):
+    """Return a 32-bit hash of the given bytes that is the same in every
+    process, unlike the built-in hash function, which is salted"""
+    return zlib.crc32(key) & 0xFFFFFFFF
+
+
+class DiskHashTable(object):
+    """A DiskHashTable is a hash table of byte string keys and values stored
+    in files, so it can be larger than memory and reopened instantly.
+    An index file of fixed-size slots, probed linearly, is memory-mapped, so
+    the operating system only reads the pages that lookups touch. A key and
+    value that fit in a slot are stored inline; longer ones are appended to
+    a separate overflow file, which is never overwritten. The overflow file
+    is append-only and never compacted: updating or deleting a long entry
+    leaves its old bytes behind, even across resizes, so a table with heavy
+    churn of long entries should be rebuilt by copying its items into a new
+    table.
+
+    Writes are crash-safe: a slot is only ever written while it is empty or
+    a tombstone, and its state byte is written last, so a slot is either
+    fully written or not there at all. Updating a key writes a new slot and
+    then deletes the old one. If the process crashes in between, the next
+    open for writing finds the dirty flag and keeps the newest entry."""
+
+    def __init__(self, path, mode='c', init_size=64, max_load_factor=0.75,
+                 sync=False):
+        """Open the table stored at the given path (index) and path.overflow
+        files in the given mode: 'r' to read an existing table, 'w' to read
+        and write an existing table, 'c' to also create it if it does not
+        exist, or 'n' to always create a new, empty table. If sync is True,
+        every write is flushed to disk before the next, so it survives a
+        power failure, not only a process crash, but is much slower.
+        The max_load_factor must be less than 1 so probing always finds an
+        empty slot to stop at."""
+        if mode not in ('r', 'w', 'c', 'n'):
+            raise ValueError('Invalid mode: {!r}'.format(mode))
+        if not 0 < max_load_factor < 1:
+            raise ValueError('Max load factor must be between 0 and 1: {}'
+                             .format(max_load_factor))
+        self.path = path
+        self.writable = mode != 'r'
+        self.closed = False
+        self.max_load_factor = max_load_factor
+        self.sync = sync
+        exists = os.path.exists(path)
+        if mode == 'n' or (mode == 'c' and not exists):
+            capacity = 8
+            while capacity < init_size:
+                capacity <<= 1
+            self._create(path, capacity)
+            io.open(path + '.overflow', 'wb').close()
+        elif not exists:
+            raise IOError('No such table: {!r}'.format(path))
+        self.overflow = io.open(path + '.overflow',
+                                'a+b' if self.writable else 'rb')
+        self._map()
+        magic, version, flags = _HEADER.unpack_from(self.map, 0)[:3]
+        if magic != _MAGIC or version != _VERSION:
+            self._unmap()
+            self.overflow.close()
+            raise ValueError('Not a disk hash table: {!r}'.format(path))
+        if flags & _DIRTY:
+            if not self.writable:
+                self.close()
+                raise ValueError('Table was not closed; open it for writing '
+                                 'to recover: {!r}'.format(path))
+            self._recover()
+        if self.writable:
+            self._write_header(_DIRTY)
+
+    def __repr__(self):
+        """Return a string representation of this hash table"""
+        return 'DiskHashTable({!r}, {} entries)'.format(self.path, self.size)
+
+    def __len__(self):
+        """Return the number of key-value entries in this hash table"""
+        return self.size
+
+    def __enter__(self):
+        """Return this table to use in a with statement"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close this table at the end of a with statement"""
+        self.close()
+
+    def _create(self, path, capacity):
+        """Write a new, empty index file with the given number of slots"""
+        with io.open(path, 'wb') as index_file:
+            index_file.write(_HEADER.pack(_MAGIC, _VERSION, 0, capacity, 0,
+                                          0, 0).ljust(_HEADER_SIZE, b'\0'))
+            # Write empty slots in chunks so a large file is not one string
+            chunk = b'\0' * (_SLOT_SIZE * 1024)
+            remaining = capacity * _SLOT_SIZE
+            while remaining > 0:
+                index_file.write(chunk[:remaining])
+                remaining -= len(chunk)
+
+    def _map(self):
+        """Memory-map the index file and read its header"""
+        self.index_file = io.open(self.path, 'r+b' if self.writable else 'rb')
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self.map = mmap.mmap(self.index_file.fileno(), 0, access=access)
+        (_, _, _, self.capacity, self.size, self.used,
+         self.sequence) = _HEADER.unpack_from(self.map, 0)
+
+    def _unmap(self):
+        """Close the memory map and the index file"""
+        self.map.close()
+        self.index_file.close()
+
+    def _write_header(self, flags):
+        """Write this table's counters and the given flags to the header"""
+        _HEADER.pack_into(self.map, 0, _MAGIC, _VERSION, flags, self.capacity,
+                          self.size, self.used, self.sequence)
+
+    def flush(self):
+        """Write all changes to disk"""
+        if self.writable:
+            self.overflow.flush()
+            os.fsync(self.overflow.fileno())
+            self.map.flush()
+
+    def close(self):
+        """Write all changes to disk, clear the dirty flag and close the
+        files. This table cannot be used after it is closed."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.writable:
+            self.flush()
+            self._write_header(0)
+            self.map.flush()
+        self._unmap()
+        self.overflow.close()
+
+    def load_factor(self):
+        """Return the load factor, the ratio of used slots to all slots"""
+        return float(self.used) / self.capacity
+
+    def _slot(self, index):
+        """Return the state, hash, key length, value length, overflow offset
+        and sequence number of the slot at the given index"""
+        return _SLOT.unpack_from(self.map, _HEADER_SIZE + index * _SLOT_SIZE)
+
+    def _read(self, index, slot, start, length):
+        """Return the given length of bytes starting at the given position
+        within the key and value stored in the given slot"""
+        if slot[0] == _INLINE:
+            position = _HEADER_SIZE + index * _SLOT_SIZE + _SLOT.size + start
+            return self.map[position:position + length]
+        self.overflow.seek(slot[4] + start)
+        return self.overflow.read(length)
+
+    def _key(self, index, slot):
+        """Return the key stored in the given slot"""
+        return self._read(index, slot, 0, slot[2])
+
+    def _value(self, index, slot):
+        """Return the value stored in the given slot"""
+        return self._read(index, slot, slot[2], slot[3])
+
+    def _find(self, key, key_hash):
+        """Return the index of the slot holding the given key, or -1 if not
+        found, and the index of the first free slot (empty or a tombstone) in
+        the key's probe sequence, where a new entry for it can be written"""
+        mask = self.capacity - 1
+        index = key_hash & mask
+        free = -1
+        while True:
+            slot = self._slot(index)
+            state = slot[0]
+            if state == _EMPTY:
+                return -1, free if free >= 0 else index
+            if state == _DELETED:
+                if free < 0:
+                    free = index
+            elif (slot[1] == key_hash and slot[2] == len(key) and
+                    self._key(index, slot) == key):
+                return index, free
+            index = (index + 1) & mask
+
+    def _check_bytes(self, data):
+        """Raise TypeError if the given key or value is not a byte string"""
+        if not isinstance(data, bytes):
+            raise TypeError('Keys and values must be bytes: {!r}'.format(data))
+
+    def _check_writable(self):
+        """Raise ValueError if this table is open for reading only"""
+        if not self.writable:
+            raise ValueError('Table is open for reading only')
+
+    def contains(self, key):
+        """Return True if this hash table contains the given key, or False"""
+        self._check_bytes(key)
+        return self._find(key, _hash(key))[0] >= 0
+
+    def get(self, key):
+        """Return the value associated with the given key, or raise KeyError"""
+        self._check_bytes(key)
+        index = self._find(key, _hash(key))[0]
+        if index < 0:
+            raise KeyError('Key not found: {!r}'.format(key))
+        return self._value(index, self._slot(index))
+
+    def set(self, key, value):
+        """Insert or update the given key with its associated value.
+        An update writes a new slot before deleting the old one, so a crash
+        never leaves the key without a complete value."""
+        self._check_writable()
+        self._check_bytes(key)
+        self._check_bytes(value)
+        key_hash = _hash(key)
+        old_index, index = self._find(key, key_hash)
+        if old_index >= 0 and index < 0:
+            # No free slot before the old one, so look past it
+            index = old_index
+            while self._slot(index)[0] in (_INLINE, _OVERFLOW):
+                index = (index + 1) & (self.capacity - 1)
+        position = _HEADER_SIZE + index * _SLOT_SIZE
+        if len(key) + len(value) <= _INLINE_SIZE:
+            state, offset = _INLINE, 0
+            data_position = position + _SLOT.size
+            self.map[data_position:data_position + len(key) + len(value)] = (
+                key + value)
+        else:
+            state, offset = _OVERFLOW, self._append(key + value)
+        free_state = self._slot(index)[0]
+        # Write all fields but the state, then commit the slot with its state
+        _SLOT.pack_into(self.map, position, free_state, key_hash, len(key),
+                        len(value), offset, self.sequence)
+        self._commit(position, state)
+        self.sequence += 1
+        if old_index >= 0:
+            self._commit(_HEADER_SIZE + old_index * _SLOT_SIZE, _DELETED)
+        else:
+            self.size += 1
+        if free_state == _EMPTY:
+            self.used += 1
+        self._write_header(_DIRTY)
+        if self.used > self.max_load_factor * self.capacity:
+            # Size the new table by the entries, not the used slots, so
+            # slots full of tombstones are reclaimed instead of doubled
+            self._resize()
+
+    def delete(self, key):
+        """Delete the given key and its associated value, or raise KeyError"""
+        self._check_writable()
+        self._check_bytes(key)
+        index = self._find(key, _hash(key))[0]
+        if index < 0:
+            raise KeyError('Key not found: {!r}'.format(key))
+        # Leave a tombstone so probe sequences passing this slot still work
+        self._commit(_HEADER_SIZE + index * _SLOT_SIZE, _DELETED)
+        self.size -= 1
+        self._write_header(_DIRTY)
+
+    def _append(self, data):
+        """Append the given bytes to the overflow file and return their
+        offset. Data in the overflow file is never overwritten or reclaimed."""
+        self.overflow.seek(0, os.SEEK_END)
+        offset = self.overflow.tell()
+        self.overflow.write(data)
+        self.overflow.flush()
+        if self.sync:
+            os.fsync(self.overflow.fileno())
+        return offset
+
+    def _commit(self, position, state):
+        """Write the given state byte of the slot at the given position"""
+        self.map[position:position + 1] = struct.pack('<B', state)
+        if self.sync:
+            self.map.flush()
+
+    def _resize(self, new_size=None):
+        """Copy all entries into a new index file with at least the given
+        number of slots, dropping tombstones, then atomically replace the old
+        file. The new capacity may be the same as or smaller than the old one.
+        Running time: O(n) for n slots; entries in the overflow file stay."""
+        # If unspecified, choose a capacity at half the load factor threshold
+        if new_size is None:
+            new_size = int(2 * self.size / self.max_load_factor)
+        new_capacity = 8
+        while new_capacity < new_size:
+            new_capacity <<= 1
+        new_path = self.path + '.resize'
+        self._create(new_path, new_capacity)
+        with io.open(new_path, 'r+b') as new_file:
+            new_map = mmap.mmap(new_file.fileno(), 0)
+            mask = new_capacity - 1
+            occupied = bytearray(new_capacity)  # Which new slots are used
+            for index in range(self.capacity):
+                slot = self._slot(index)
+                if slot[0] != _INLINE and slot[0] != _OVERFLOW:
+                    continue
+                # Probe for a free new slot using the stored hash
+                new_index = slot[1] & mask
+                while occupied[new_index]:
+                    new_index = (new_index + 1) & mask
+                occupied[new_index] = 1
+                # Copy the whole slot, including any inline key and value
+                position = _HEADER_SIZE + index * _SLOT_SIZE
+                new_position = _HEADER_SIZE + new_index * _SLOT_SIZE
+                new_map[new_position:new_position + _SLOT_SIZE] = (
+                    self.map[position:position + _SLOT_SIZE])
+            _HEADER.pack_into(new_map, 0, _MAGIC, _VERSION, _DIRTY,
+                              new_capacity, self.size, self.size,
+                              self.sequence)
+            new_map.flush()
+            new_map.close()
+            if self.sync:
+                os.fsync(new_file.fileno())
+        self._unmap()
+        _replace(new_path, self.path)
+        self._map()
+
+    def _recover(self):
+        """Repair this table after it was not closed: delete all but the
+        newest entry of each key, and count the entries and used slots.
+        Every copy of a key lies in the same cluster of consecutive non-empty
+        slots, since each was written in that key's probe sequence, so only
+        one cluster's hashes and slot indexes are kept in memory at a time.
+        Running time: O(n) for n slots, plus reading the keys of entries
+        whose hashes collide within a cluster."""
+        mask = self.capacity - 1
+        self.size = 0
+        self.used = 0
+        # Start scanning after an empty slot so no cluster wraps around
+        start = 0
+        for index in range(self.capacity):
+            if self._slot(index)[0] == _EMPTY:
+                start = index
+                break
+        cluster = {}  # Map each hash in this cluster to its entries' slots
+        for offset in range(1, self.capacity + 1):
+            index = (start + offset) & mask
+            slot = self._slot(index)
+            if slot[0] == _EMPTY:
+                cluster = {}  # The next cluster starts after this slot
+                continue
+            self.used += 1
+            if slot[0] == _DELETED:
+                continue
+            self.sequence = max(self.sequence, slot[5] + 1)
+            entries = cluster.setdefault(slot[1], [])
+            key = self._key(index, slot) if entries else None
+            for position, other_index in enumerate(entries):
+                other_slot = self._slot(other_index)
+                if (other_slot[2] != slot[2] or
+                        self._key(other_index, other_slot) != key):
+                    continue
+                # Keep whichever copy of this key was written last
+                if other_slot[5] > slot[5]:
+                    self._commit(_HEADER_SIZE + index * _SLOT_SIZE, _DELETED)
+                else:
+                    self._commit(_HEADER_SIZE + other_index * _SLOT_SIZE,
+                                 _DELETED)
+                    entries[position] = index
+                break
+            else:
+                entries.append(index)
+                self.size += 1
+        self._write_header(_DIRTY)
+        self.map.flush()
+
+    def iter_items(self):
+        """Return a generator of all entries (key-value pairs) in this hash
+        table, reading one slot at a time instead of loading the whole file"""
+        for index in range(self.capacity):
+            slot = self._slot(index)
+            if slot[0] == _INLINE or slot[0] == _OVERFLOW:
+                yield self._key(index, slot), self._value(index, slot)
+
+    def __iter__(self):
+        """Return a generator of all keys in this hash table"""
+        for key, _ in self.iter_items():
+            yield key
+
+    def keys(self):
+        """Return a list of all keys in this hash table"""
+        return [key for key, _ in self.iter_items()]
+
+    def values(self):
+        """Return a list of all values in this hash table"""
+        return [value for _, value in self.iter_items()]
+
+    def items(self):
+        """Return a list of all entries (key-value pairs) in this hash table"""
+        return list(self.iter_items())
+
+    def length(self):
+        """Return the number of key-value entries in this hash table"""
+        return self.size
+
+
+def open(path, mode='c', **options):
+    """Open and return the disk hash table stored at the given path in the
+    given mode ('r', 'w', 'c' or 'n'), with the given options, such as sync"""
+    return DiskHashTable(path, mode, **options)
@@ -3,12 +3,30 @@
 from linkedlist import LinkedList
 
 
+# Default for get's default argument, meaning raise KeyError if not found
+_NO_DEFAULT = object()
+
+
 class HashTable(object):
 
-    def __init__(self, init_size=8):
-        """Initialize this hash table with the given initial size"""
-        self.buckets = [LinkedList() for i in range(init_size)]
+    def __init__(self, init_size=8, max_load_factor=0.75,
+                 min_load_factor=0.25, rehash_step=8):
+        """Initialize this hash table with the given initial size. The table
+        grows when the load factor exceeds max_load_factor after an insertion
+        and shrinks (never below init_size) when it drops below
+        min_load_factor after a deletion. Each resize rehashes incrementally,
+        moving rehash_step old buckets per later set or delete operation."""
+        # Buckets are created lazily, so None represents an empty bucket
+        self.buckets = [None] * init_size
         self.size = 0  # Count number of key-value entries
+        self.min_size = init_size
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.rehash_step = rehash_step
+        # Previous buckets still being rehashed after a resize, if any
+        self._old_buckets = None
+        # Index of the next old bucket to move into the current buckets
+        self._rehash_index = 0
 
     def __str__(self):
         """Return a formatted string representation of this hash table"""
@@ -19,39 +37,120 @@ class HashTable(object):
         """Return a string representation of this hash table"""
         return 'HashTable({})'.format(repr(self.items()))
 
-    def _bucket_index(self, key):
-        """Return the bucket index where the given key would be stored"""
-        return hash(key) % len(self.buckets)
+    def __len__(self):
+        """Return the number of key-value entries in this hash table"""
+        return self.size
+
+    def _bucket_index(self, key, key_hash=None):
+        """Return the bucket index where the given key would be stored,
+        using the given precomputed hash of the key, if any"""
+        if key_hash is None:
+            key_hash = hash(key)
+        return key_hash % len(self.buckets)
+
+    def _bucket(self, key_hash, create=False):
+        """Return the bucket where a key with the given hash is (or would be)
+        stored, or None if that bucket does not exist yet and create is False.
+        While rehashing, a key stays in its old bucket until it is moved."""
+        if self._old_buckets is not None:
+            old_index = key_hash % len(self._old_buckets)
+            # Check if the key's old bucket has not been moved yet
+            if old_index >= self._rehash_index:
+                buckets, index = self._old_buckets, old_index
+            else:
+                buckets, index = self.buckets, key_hash % len(self.buckets)
+        else:
+            buckets, index = self.buckets, key_hash % len(self.buckets)
+        bucket = buckets[index]
+        if bucket is None and create:
+            bucket = buckets[index] = LinkedList()
+        return bucket
+
+    def _all_buckets(self):
+        """Return a list of all existing buckets, including old buckets that
+        have not been rehashed yet"""
+        buckets = self.buckets
+        if self._old_buckets is not None:
+            buckets = self._old_buckets + buckets
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def _find_node(self, bucket, key, key_hash):
+        """Return the node in the given bucket whose entry has the given key,
+        or None if not found. Each entry is a (hash, key, value) tuple, so
+        comparing the cached hashes first skips most key comparisons."""
+        node = bucket.head
+        while node is not None:
+            entry = node.data
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return node
+            node = node.next
+        return None
 
     def load_factor(self):
         """Return the load factor, the ratio of number of entries to buckets"""
-        # TODO: Calculate load factor
-        # return ...
+        return float(self.size) / len(self.buckets)
+
+    def is_rehashing(self):
+        """Return True if an incremental rehash is in progress, or False"""
+        return self._old_buckets is not None
 
     def _resize(self, new_size=None):
-        """Resize this hash table's buckets and rehash all key-value entries.
-        Should be called automatically when load factor exceeds a threshold
-        such as 0.75 after an insertion (when set is called with a new key)."""
+        """Resize this hash table's buckets and start rehashing all key-value
+        entries. Entries are moved incrementally by _rehash during subsequent
+        set and delete operations, so this only allocates the new buckets.
+        set and delete never call this while a rehash is in progress; they
+        wait for it to finish, letting the load factor overshoot its
+        threshold for a few operations instead of pausing to move every
+        remaining entry at once.
+        Running time: O(1) amortized, plus O(new_size) for a C-level list
+        allocation instead of a full rehash of every entry, plus O(n) to
+        finish a rehash in progress when called directly (as update does)."""
         # If unspecified, choose new size dynamically based on current size
         if new_size is None:
-            new_size = self.size * 2  # Double size
-        # Option to reduce size if buckets are sparsely filled (low load factor)
-        elif new_size is 0:
-            new_size = self.size / 2  # Half size
-        # TODO: Get a list to temporarily hold all current key-value entries
-        # ...
-        # TODO: Create a new list of new_size total empty linked list buckets
-        # ...
-        # TODO: Insert each key-value entry into the new list of buckets,
-        # which will rehash them into a new bucket index based on the new size
-        # ...
+            new_size = len(self.buckets) * 2  # Double size
+        # Option to reduce size if buckets are sparsely filled (low load
+        # factor)
+        elif new_size == 0:
+            new_size = max(self.min_size, len(self.buckets) // 2)  # Half size
+        # Finish any rehash in progress so at most two bucket lists coexist
+        if self._old_buckets is not None:
+            self._rehash(len(self._old_buckets))
+        # Keep the current buckets around until all entries have been moved
+        self._old_buckets = self.buckets
+        self._rehash_index = 0
+        # Create a new list of new_size total (lazily created) empty buckets
+        self.buckets = [None] * new_size
+
+    def _rehash(self, count):
+        """Move all entries in up to the given number of old buckets into the
+        current buckets, and finish rehashing once no old buckets remain.
+        Running time: O(count) on average for a bounded load factor."""
+        old_buckets = self._old_buckets
+        stop = min(len(old_buckets), self._rehash_index + count)
+        for index in range(self._rehash_index, stop):
+            bucket = old_buckets[index]
+            if bucket is None:
+                continue
+            # Insert each entry into its new bucket using its cached hash
+            for entry in bucket.items():
+                new_index = entry[0] % len(self.buckets)
+                new_bucket = self.buckets[new_index]
+                if new_bucket is None:
+                    new_bucket = self.buckets[new_index] = LinkedList()
+                new_bucket.append(entry)
+            old_buckets[index] = None
+        self._rehash_index = stop
+        if stop == len(old_buckets):
+            # Every old bucket has been moved, so release them
+            self._old_buckets = None
+            self._rehash_index = 0
 
     def keys(self):
         """Return a list of all keys in this hash table"""
         # Collect all keys in each of the buckets
         all_keys = []
-        for bucket in self.buckets:
-            for key, value in bucket.items():
+        for bucket in self._all_buckets():
+            for key_hash, key, value in bucket.items():
                 all_keys.append(key)
         return all_keys
 
@@ -59,8 +158,8 @@ class HashTable(object):
         """Return a list of all values in this hash table"""
         # Collect all values in each of the buckets
         all_values = []
-        for bucket in self.buckets:
-            for key, value in bucket.items():
+        for bucket in self._all_buckets():
+            for key_hash, key, value in bucket.items():
                 all_values.append(value)
         return all_values
 
@@ -68,75 +167,559 @@ class HashTable(object):
         """Return a list of all entries (key-value pairs) in this hash table"""
         # Collect all pairs of key-value entries in each of the buckets
         all_items = []
-        for bucket in self.buckets:
-            all_items.extend(bucket.items())
+        for bucket in self._all_buckets():
+            for key_hash, key, value in bucket.items():
+                all_items.append((key, value))
         return all_items
 
     def length(self):
-        """Return the number of key-value entries by traversing its buckets"""
-        # Count number of key-value entries in each of the buckets
-        item_count = 0
-        for bucket in self.buckets:
-            item_count += bucket.length()
-        return item_count
-        # Equivalent to this list comprehension:
-        return sum(bucket.length() for bucket in self.buckets)
+        """Return the number of key-value entries in this hash table.
+        Running time: O(1) because size is updated on every set and delete."""
+        return self.size
 
     def contains(self, key):
         """Return True if this hash table contains the given key, or False"""
+        key_hash = hash(key)
         # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
+        bucket = self._bucket(key_hash)
+        if bucket is None:
+            return False
         # Check if an entry with the given key exists in that bucket
-        entry = bucket.find(lambda (k, v): k == key)
-        return entry is not None  # True or False
+        node = self._find_node(bucket, key, key_hash)
+        return node is not None  # True or False
 
-    def get(self, key):
-        """Return the value associated with the given key, or raise KeyError"""
+    def get(self, key, default=_NO_DEFAULT):
+        """Return the value associated with the given key, or the given
+        default if it is not found, or raise KeyError if no default is given"""
+        key_hash = hash(key)
         # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
+        bucket = self._bucket(key_hash)
         # Find the entry with the given key in that bucket, if one exists
-        entry = bucket.find(lambda (k, v): k == key)
-        if entry is not None:  # Found
+        if bucket is not None:
+            node = self._find_node(bucket, key, key_hash)
+        else:
+            node = None
+        if node is not None:  # Found
             # Return the given key's associated value
-            assert isinstance(entry, tuple)
-            assert len(entry) == 2
-            return entry[1]
+            return node.data[2]
+        elif default is not _NO_DEFAULT:  # Not found
+            return default
         else:  # Not found
             raise KeyError('Key not found: {}'.format(key))
 
     def set(self, key, value):
         """Insert or update the given key with its associated value"""
+        # Move a few more old buckets if a rehash is in progress
+        if self._old_buckets is not None:
+            self._rehash(self.rehash_step)
+        key_hash = hash(key)
         # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
-        # Find the entry with the given key in that bucket, if one exists
+        bucket = self._bucket(key_hash, create=True)
         # Check if an entry with the given key exists in that bucket
-        entry = bucket.find(lambda (k, v): k == key)
-        if entry is not None:  # Found
-            # In this case, the given key's value is being updated
-            # Remove the old key-value entry from the bucket first
-            bucket.delete(entry)
-        # Insert the new key-value entry into the bucket in either case
-        bucket.append((key, value))
-        # TODO: Check if the load factor exceeds a threshold such as 0.75
-        # ...
-        # TODO: If so, automatically resize to reduce the load factor
-        # ...
+        node = self._find_node(bucket, key, key_hash)
+        if node is not None:  # Found
+            # In this case, the given key's value is being updated in place
+            node.data = (key_hash, key, value)
+            return
+        # In this case, a new key-value entry is being added
+        bucket.append((key_hash, key, value))
+        self.size += 1
+        # Check if the load factor exceeds the threshold after an insertion,
+        # but let a rehash in progress finish in steps before resizing again
+        if (self.load_factor() > self.max_load_factor and
+                self._old_buckets is None):
+            # If so, automatically resize to reduce the load factor
+            self._resize()
+
+    def update(self, iterable):
+        """Insert or update all key-value entries in the given iterable of
+        (key, value) pairs. The buckets are resized at most once up front to
+        fit every entry, so no resizes happen while inserting them.
+        Running time: O(n + m) for n existing and m given entries."""
+        entries = list(iterable)
+        # Choose enough buckets to stay under the load factor threshold
+        # even if every given key is new
+        new_size = len(self.buckets)
+        while (self.size + len(entries)) > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size > len(self.buckets):
+            self._resize(new_size)
+        # Finish rehashing now, since this bulk load is not latency sensitive
+        if self._old_buckets is not None:
+            self._rehash(len(self._old_buckets))
+        for key, value in entries:
+            self.set(key, value)
 
     def delete(self, key):
         """Delete the given key and its associated value, or raise KeyError"""
+        # Move a few more old buckets if a rehash is in progress
+        if self._old_buckets is not None:
+            self._rehash(self.rehash_step)
+        key_hash = hash(key)
         # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
-        # Find the entry with the given key in that bucket, if one exists
-        entry = bucket.find(lambda (k, v): k == key)
-        if entry is not None:  # Found
+        bucket = self._bucket(key_hash)
+        # Find the node with the given key in that bucket, if one exists,
+        # and the node before it so it can be unlinked without searching again
+        previous = None
+        node = bucket.head if bucket is not None else None
+        while node is not None:
+            entry = node.data
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                break
+            previous = node
+            node = node.next
+        if node is not None:  # Found
             # Remove the key-value entry from the bucket
-            bucket.delete(entry)
+            bucket.delete_after(previous)
+            self.size -= 1
         else:  # Not found
             raise KeyError('Key not found: {}'.format(key))
+        # Check if the load factor fell below the threshold after a deletion,
+        # but let a rehash in progress finish in steps before resizing again
+        if (len(self.buckets) > self.min_size and
+                self.load_factor() < self.min_load_factor and
+                self._old_buckets is None):
+            # If so, automatically resize to save memory
+            self._resize(0)
+
+
+# Sentinel markers for the state of each slot in a ProbingHashTable
+_EMPTY = object()  # Slot has never held an entry, so probing can stop here
+_DELETED = object()  # Slot held an entry that was deleted (a tombstone)
+
+
+class ProbingHashTable(object):
+    """A ProbingHashTable resolves collisions with linear probing (open
+    addressing) instead of separate chaining. Entries are stored in three flat
+    parallel arrays of hashes, keys and values, so no bucket, node or tuple
+    objects are allocated per entry and probing touches only list slots."""
+
+    def __init__(self, init_size=8, max_load_factor=0.75):
+        """Initialize this hash table with the given initial size. The
+        max_load_factor must be less than 1 so probing always finds an empty
+        slot to stop at."""
+        if not 0 < max_load_factor < 1:
+            raise ValueError('Max load factor must be between 0 and 1: {}'
+                             .format(max_load_factor))
+        # Round capacity up to a power of two so slot indexes can be masked
+        capacity = 8
+        while capacity < init_size:
+            capacity <<= 1
+        self.max_load_factor = max_load_factor
+        self._hashes = [None] * capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self.size = 0  # Count number of key-value entries
+        self._used = 0  # Count number of entries plus tombstones
+
+    def __str__(self):
+        """Return a formatted string representation of this hash table"""
+        items = ['{}: {}'.format(repr(k), repr(v)) for k, v in self.items()]
+        return '{' + ', '.join(items) + '}'
+
+    def __repr__(self):
+        """Return a string representation of this hash table"""
+        return 'ProbingHashTable({})'.format(repr(self.items()))
+
+    def __len__(self):
+        """Return the number of key-value entries in this hash table"""
+        return self.size
+
+    def capacity(self):
+        """Return the number of slots in this hash table's arrays"""
+        return len(self._keys)
+
+    def load_factor(self):
+        """Return the load factor, the ratio of number of entries to slots"""
+        return float(self.size) / len(self._keys)
+
+    def _find_slot(self, key, key_hash):
+        """Return the slot index holding the given key, or else the index of
+        the first free slot (tombstone or empty) where it could be inserted.
+        Running time: O(1) expected when the load factor is bounded."""
+        keys = self._keys
+        hashes = self._hashes
+        mask = len(keys) - 1
+        index = key_hash & mask
+        free_index = None
+        # Linear probing: scan consecutive slots until an empty one is found
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                # Key is absent; prefer reusing the first tombstone we passed
+                return index if free_index is None else free_index
+            if slot_key is _DELETED:
+                if free_index is None:
+                    free_index = index
+            # Compare cached hashes first to skip most key comparisons
+            elif hashes[index] == key_hash and (slot_key is key or
+                                                slot_key == key):
+                return index
+            index = (index + 1) & mask
+
+    def _resize(self, new_size=None):
+        """Resize this hash table's arrays and reinsert all key-value entries,
+        discarding tombstones. Uses the cached hashes, so keys are not
+        rehashed.
+        Running time: O(n) for n slots, amortized O(1) per insertion."""
+        # If unspecified, choose a capacity at half the load factor threshold
+        if new_size is None:
+            new_size = int(2 * self.size / self.max_load_factor)
+        capacity = 8
+        while capacity < new_size:
+            capacity <<= 1
+        old_hashes = self._hashes
+        old_keys = self._keys
+        old_values = self._values
+        self._hashes = hashes = [None] * capacity
+        self._keys = keys = [_EMPTY] * capacity
+        self._values = values = [None] * capacity
+        self._used = self.size
+        mask = capacity - 1
+        for old_index, key in enumerate(old_keys):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            key_hash = old_hashes[old_index]
+            # No tombstones or duplicates exist yet, so take the first empty
+            index = key_hash & mask
+            while keys[index] is not _EMPTY:
+                index = (index + 1) & mask
+            hashes[index] = key_hash
+            keys[index] = key
+            values[index] = old_values[old_index]
+
+    def keys(self):
+        """Return a list of all keys in this hash table"""
+        return [key for key in self._keys
+                if key is not _EMPTY and key is not _DELETED]
+
+    def values(self):
+        """Return a list of all values in this hash table"""
+        return [value for key, value in zip(self._keys, self._values)
+                if key is not _EMPTY and key is not _DELETED]
+
+    def items(self):
+        """Return a list of all entries (key-value pairs) in this hash table"""
+        return [(key, value) for key, value in zip(self._keys, self._values)
+                if key is not _EMPTY and key is not _DELETED]
+
+    def length(self):
+        """Return the number of key-value entries in this hash table"""
+        return self.size
+
+    def contains(self, key):
+        """Return True if this hash table contains the given key, or False"""
+        index = self._find_slot(key, hash(key))
+        slot_key = self._keys[index]
+        return slot_key is not _EMPTY and slot_key is not _DELETED
+
+    def get(self, key, default=_NO_DEFAULT):
+        """Return the value associated with the given key, or the given
+        default if it is not found, or raise KeyError if no default is given"""
+        index = self._find_slot(key, hash(key))
+        slot_key = self._keys[index]
+        if slot_key is _EMPTY or slot_key is _DELETED:  # Not found
+            if default is not _NO_DEFAULT:
+                return default
+            raise KeyError('Key not found: {}'.format(key))
+        return self._values[index]
+
+    def set(self, key, value):
+        """Insert or update the given key with its associated value"""
+        key_hash = hash(key)
+        index = self._find_slot(key, key_hash)
+        slot_key = self._keys[index]
+        if slot_key is not _EMPTY and slot_key is not _DELETED:  # Found
+            # In this case, the given key's value is being updated in place
+            self._values[index] = value
+            return
+        if slot_key is _EMPTY:
+            # Only filling a never-used slot lengthens future probe sequences
+            self._used += 1
+        self._hashes[index] = key_hash
+        self._keys[index] = key
+        self._values[index] = value
+        self.size += 1
+        # Resize when entries plus tombstones exceed the load factor threshold
+        if self._used > self.max_load_factor * len(self._keys):
+            self._resize()
+
+    def delete(self, key):
+        """Delete the given key and its associated value, or raise KeyError"""
+        index = self._find_slot(key, hash(key))
+        slot_key = self._keys[index]
+        if slot_key is _EMPTY or slot_key is _DELETED:  # Not found
+            raise KeyError('Key not found: {}'.format(key))
+        # Leave a tombstone so probe sequences passing this slot still work
+        self._hashes[index] = None
+        self._keys[index] = _DELETED
+        self._values[index] = None
+        self.size -= 1
+
+
+def _bit_count(bits):
+    """Return the number of 1 bits in the given nonnegative integer"""
+    return bin(bits).count('1')
+
+
+class BitmapNode(object):
+    """A BitmapNode is an immutable node of a hash array mapped trie with up
+    to 32 children, one for each 5-bit chunk of a key's hash at this node's
+    depth. Only existing children are stored, in a compact tuple, and a
+    32-bit bitmap records which chunks they belong to. Each entry is either
+    a (hash, key, value) tuple or a child node."""
+
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        """Initialize this node with the given bitmap and tuple of entries"""
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def __repr__(self):
+        """Return a string representation of this node"""
+        return 'BitmapNode({} entries)'.format(len(self.entries))
+
+    def find(self, key_hash, key, shift):
+        """Return the value associated with the given key, or raise KeyError"""
+        bit = 1 << ((key_hash >> shift) & 31)
+        if self.bitmap & bit:
+            # Count lower bits to find the entry's index in the compact tuple
+            entry = self.entries[_bit_count(self.bitmap & (bit - 1))]
+            if type(entry) is not tuple:
+                return entry.find(key_hash, key, shift + 5)
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry[2]
+        raise KeyError('Key not found: {}'.format(key))
+
+    def assoc(self, key_hash, key, value, shift):
+        """Return a new node with the given key associated with the given
+        value, and True if the key is new or False if it was updated.
+        Running time: O(log n) to copy the nodes on the path to the key;
+        all other nodes are shared with this node."""
+        bit = 1 << ((key_hash >> shift) & 31)
+        index = _bit_count(self.bitmap & (bit - 1))
+        entries = self.entries
+        if not self.bitmap & bit:
+            # Insert a new entry in order in a copy of the entries
+            return BitmapNode(self.bitmap | bit, entries[:index] +
+                              ((key_hash, key, value),) +
+                              entries[index:]), True
+        entry = entries[index]
+        if type(entry) is not tuple:
+            child, added = entry.assoc(key_hash, key, value, shift + 5)
+        elif entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+            child, added = (key_hash, key, value), False
+        else:
+            # Two keys share this chunk, so push both down into a new child
+            child, added = _make_node(entry, (key_hash, key, value),
+                                      shift + 5), True
+        return BitmapNode(self.bitmap, entries[:index] + (child,) +
+                          entries[index + 1:]), added
+
+    def dissoc(self, key_hash, key, shift):
+        """Return a new node without the given key, or raise KeyError"""
+        bit = 1 << ((key_hash >> shift) & 31)
+        if not self.bitmap & bit:
+            raise KeyError('Key not found: {}'.format(key))
+        index = _bit_count(self.bitmap & (bit - 1))
+        entries = self.entries
+        entry = entries[index]
+        if type(entry) is not tuple:
+            child = entry.dissoc(key_hash, key, shift + 5)
+            # Inline a child left with a single key-value entry
+            if len(child.entries) == 1 and type(child.entries[0]) is tuple:
+                child = child.entries[0]
+            return BitmapNode(self.bitmap, entries[:index] + (child,) +
+                              entries[index + 1:])
+        if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+            return BitmapNode(self.bitmap ^ bit,
+                              entries[:index] + entries[index + 1:])
+        raise KeyError('Key not found: {}'.format(key))
+
+    def iter_entries(self):
+        """Return a generator of all (hash, key, value) entries in this node"""
+        for entry in self.entries:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                for child_entry in entry.iter_entries():
+                    yield child_entry
+
+
+class CollisionNode(object):
+    """A CollisionNode is an immutable node of a hash array mapped trie that
+    holds (hash, key, value) entries for different keys with equal hashes."""
+
+    __slots__ = ('key_hash', 'entries')
+
+    def __init__(self, key_hash, entries):
+        """Initialize this node with the given shared hash and entries"""
+        self.key_hash = key_hash
+        self.entries = entries
+
+    def __repr__(self):
+        """Return a string representation of this node"""
+        return 'CollisionNode({} entries)'.format(len(self.entries))
+
+    def _index(self, key):
+        """Return the index of the entry with the given key, or -1"""
+        for index, entry in enumerate(self.entries):
+            if entry[1] is key or entry[1] == key:
+                return index
+        return -1
+
+    def find(self, key_hash, key, shift):
+        """Return the value associated with the given key, or raise KeyError"""
+        index = self._index(key) if key_hash == self.key_hash else -1
+        if index < 0:
+            raise KeyError('Key not found: {}'.format(key))
+        return self.entries[index][2]
+
+    def assoc(self, key_hash, key, value, shift):
+        """Return a new node with the given key associated with the given
+        value, and True if the key is new or False if it was updated"""
+        if key_hash != self.key_hash:
+            # Nest this node in a bitmap node to branch on the new key's hash
+            node = BitmapNode(1 << ((self.key_hash >> shift) & 31), (self,))
+            return node.assoc(key_hash, key, value, shift)
+        entry = (key_hash, key, value)
+        index = self._index(key)
+        if index < 0:
+            return CollisionNode(key_hash, self.entries + (entry,)), True
+        return CollisionNode(key_hash, self.entries[:index] + (entry,) +
+                             self.entries[index + 1:]), False
+
+    def dissoc(self, key_hash, key, shift):
+        """Return a new node without the given key, or raise KeyError"""
+        index = self._index(key) if key_hash == self.key_hash else -1
+        if index < 0:
+            raise KeyError('Key not found: {}'.format(key))
+        return CollisionNode(key_hash, self.entries[:index] +
+                             self.entries[index + 1:])
+
+    def iter_entries(self):
+        """Return a generator of all (hash, key, value) entries in this node"""
+        return iter(self.entries)
+
+
+def _make_node(entry, other_entry, shift):
+    """Return a new node containing the two given entries for different keys,
+    branching on their hashes starting at the given shift"""
+    if entry[0] == other_entry[0]:
+        return CollisionNode(entry[0], (entry, other_entry))
+    chunk = (entry[0] >> shift) & 31
+    other_chunk = (other_entry[0] >> shift) & 31
+    if chunk == other_chunk:
+        # Both hashes share this chunk too, so branch one level deeper
+        return BitmapNode(1 << chunk,
+                          (_make_node(entry, other_entry, shift + 5),))
+    if other_chunk < chunk:
+        entry, other_entry = other_entry, entry
+    return BitmapNode((1 << chunk) | (1 << other_chunk), (entry, other_entry))
+
+
+class PersistentHashMap(object):
+    """A PersistentHashMap is an immutable hash table stored as a hash array
+    mapped trie (HAMT) that branches 32 ways on 5 bits of each key's hash at
+    a time. Instead of changing this map, set and delete return a new map
+    that shares all but the O(log n) nodes on the path to the key, so every
+    version stays valid and taking a snapshot is free."""
+
+    __slots__ = ('root', 'size')
+
+    def __init__(self, iterable=None):
+        """Initialize this map with the given key-value pairs, if any"""
+        self.root = _EMPTY_NODE
+        self.size = 0  # Count number of key-value entries
+        if iterable:
+            # Building this new map in place is safe before anyone sees it
+            for key, value in iterable:
+                key_hash = hash(key)
+                self.root, added = self.root.assoc(key_hash, key, value, 0)
+                if added:
+                    self.size += 1
+
+    @classmethod
+    def _from_root(cls, root, size):
+        """Return a new map with the given root node and number of entries"""
+        new_map = cls()
+        new_map.root = root
+        new_map.size = size
+        return new_map
+
+    def __str__(self):
+        """Return a formatted string representation of this map"""
+        items = ['{}: {}'.format(repr(k), repr(v)) for k, v in self.items()]
+        return '{' + ', '.join(items) + '}'
+
+    def __repr__(self):
+        """Return a string representation of this map"""
+        return 'PersistentHashMap({})'.format(repr(self.items()))
+
+    def __len__(self):
+        """Return the number of key-value entries in this map"""
+        return self.size
+
+    def __iter__(self):
+        """Return a generator of the keys in this map"""
+        for entry in self.root.iter_entries():
+            yield entry[1]
+
+    def keys(self):
+        """Return a list of all keys in this map"""
+        return [entry[1] for entry in self.root.iter_entries()]
+
+    def values(self):
+        """Return a list of all values in this map"""
+        return [entry[2] for entry in self.root.iter_entries()]
+
+    def items(self):
+        """Return a list of all entries (key-value pairs) in this map"""
+        return [(entry[1], entry[2]) for entry in self.root.iter_entries()]
+
+    def length(self):
+        """Return the number of key-value entries in this map"""
+        return self.size
+
+    def contains(self, key):
+        """Return True if this map contains the given key, or False"""
+        try:
+            self.root.find(hash(key), key, 0)
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key):
+        """Return the value associated with the given key, or raise KeyError.
+        Running time: O(log n), at most 13 levels for 64-bit hashes."""
+        return self.root.find(hash(key), key, 0)
+
+    def set(self, key, value):
+        """Return a new map with the given key associated with the given value.
+        This map is unchanged. Running time: O(log n)"""
+        root, added = self.root.assoc(hash(key), key, value, 0)
+        return self._from_root(root, self.size + 1 if added else self.size)
+
+    def update(self, iterable):
+        """Return a new map with all of the given key-value pairs set"""
+        root = self.root
+        size = self.size
+        for key, value in iterable:
+            root, added = root.assoc(hash(key), key, value, 0)
+            if added:
+                size += 1
+        return self._from_root(root, size)
+
+    def delete(self, key):
+        """Return a new map without the given key, or raise KeyError.
+        This map is unchanged. Running time: O(log n)"""
+        root = self.root.dissoc(hash(key), key, 0)
+        return self._from_root(root, self.size - 1)
+
+
+# The root node of every empty map, which is never changed
+_EMPTY_NODE = BitmapNode(0, ())
 
 
 def test_hash_table():
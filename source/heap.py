@@ -1,17 +1,45 @@
 #!python
 
+import array
+import operator
+
+
 class MinHeap(object):
     """A MinHeap is an unordered collection with access to its minimum item,
     and provides efficient methods for insertion and removal of its minimum.
-    Items are stored in a dynamic array representing an implicit binary tree."""
+    Items are stored in a dynamic array representing an implicit d-ary tree,
+    where each node has up to arity children (2 for a binary heap). A higher
+    arity makes the tree shallower, so insert compares fewer items while
+    remove_min compares more children per level.
+    Items can be ordered by the value of a key function, which is computed
+    once per item and cached in a parallel array of keys, and in reverse to
+    make a max heap, whose "minimum" is then its maximum item.
+    Numbers can be stored unboxed in an array.array with the given typecode,
+    such as 'q' for 64-bit integers or 'd' for floats, instead of a list."""
 
-    def __init__(self, items=None):
-        """Initialize this heap and insert the given items, if any."""
-        # Initialize an empty list to store the items
-        self.items = []
-        if items:
-            for item in items:
-                self.insert(item)
+    def __init__(self, items=None, arity=2, key=None, reverse=False,
+                 typecode=None):
+        """Initialize this heap and insert the given items, if any.
+        Running time: O(n) for n given items using bottom-up heapify instead
+        of O(n log n) for inserting each item one at a time."""
+        if arity < 2:
+            raise ValueError('Heap arity must be at least 2: {}'.format(arity))
+        # Number of children of each node in the implicit tree
+        self.arity = arity
+        self.key = key
+        self.reverse = reverse
+        # Compare with > instead of < to order the heap by maximum
+        self._less = operator.gt if reverse else operator.lt
+        self.typecode = typecode
+        # Initialize a list or typed array to store the items
+        if typecode is not None:
+            self.items = array.array(typecode, items if items else [])
+        else:
+            self.items = list(items) if items else []
+        # Cache each item's key at the same index in a parallel list, if any
+        self.keys = [key(item) for item in self.items] if key else None
+        if len(self.items) > 1:
+            self._heapify()
 
     def __repr__(self):
         """Return a string representation of this heap."""
@@ -19,8 +47,7 @@ class MinHeap(object):
 
     def is_empty(self):
         """Return True if this heap is empty, or False otherwise."""
-        # TODO: Check if empty based on how many items are in the list
-        ...
+        return len(self.items) == 0
 
     def size(self):
         """Return the number of items in this heap."""
@@ -38,12 +65,16 @@ class MinHeap(object):
             raise ValueError('Heap is empty and has no minimum item')
         if self.size() == 1:
             # Remove and return the only item
+            if self.keys is not None:
+                self.keys.pop()
             return self.items.pop()
         assert self.size() > 1
         min_item = self.items[0]
         # Move the last item to the root and bubble down to the leaves
         last_item = self.items.pop()
         self.items[0] = last_item
+        if self.keys is not None:
+            self.keys[0] = self.keys.pop()
         if self.size() > 1:
             self._bubble_down(0)
         return min_item
@@ -56,6 +87,8 @@ class MinHeap(object):
         min_item = self.items[0]
         # Replace the root and bubble down to the leaves
         self.items[0] = item
+        if self.keys is not None:
+            self.keys[0] = self.key(item)
         if self.size() > 1:
             self._bubble_down(0)
         return min_item
@@ -64,42 +97,159 @@ class MinHeap(object):
         """Insert the given item into this heap."""
         # Insert the item at the end and bubble up to the root
         self.items.append(item)
+        if self.keys is not None:
+            self.keys.append(self.key(item))
         if self.size() > 1:
             self._bubble_up(self._last_index())
 
+    def buffer(self):
+        """Return a memoryview of the items in this typed heap in heap order
+        (not sorted) without copying them. The heap cannot grow or shrink
+        until the view is released. Requires Python 3."""
+        if self.typecode is None:
+            raise TypeError('Only a heap with a typecode has a buffer')
+        return memoryview(self.items)
+
+    def insert_many(self, items):
+        """Insert all of the given items into this heap.
+        Running time: O(k log(n + k)) for k items bubbled up one at a time, or
+        O(n + k) to heapify all n + k items again if k is larger than n."""
+        start = len(self.items)
+        self.items.extend(items)
+        if self.keys is not None:
+            key = self.key
+            self.keys.extend(key(item) for item in self.items[start:])
+        if len(self.items) - start > start:
+            # Most items are new, so rebuilding the whole heap is cheaper
+            if len(self.items) > 1:
+                self._heapify()
+        else:
+            for index in range(start, len(self.items)):
+                self._bubble_up(index)
+
+    def pop_many(self, count):
+        """Remove and return a list of the given number of minimum items in
+        sorted order, or all items if this heap has fewer than that."""
+        items = self.items
+        keys = self.keys
+        result = []
+        for _ in range(min(count, len(items))):
+            result.append(items[0])
+            # Move the last item to the root and bubble down to the leaves
+            last_item = items.pop()
+            last_key = keys.pop() if keys is not None else None
+            if items:
+                items[0] = last_item
+                if keys is not None:
+                    keys[0] = last_key
+                self._bubble_down(0)
+        return result
+
     def _bubble_up(self, index):
         """Ensure the heap-ordering property is true above the given index,
-        swapping out of order items, or until the root node is reached."""
-        if index == 0:
-            return  # This index is the root node
-        if not (0 <= index <= self._last_index()):
+        moving parent items down into the hole left by the given item, until
+        the root node is reached."""
+        items = self.items
+        if not (0 <= index < len(items)):
             raise IndexError('Invalid index: {}'.format(index))
-        item = self.items[index]
-        # TODO: Swap this item with parent item if values are out of order
-        parent_index = self._parent_index(index)
-        parent_item = self.items[parent_index]
-        ...
-        # TODO: Then bubble up again if necessary
-        ...
+        arity = self.arity
+        item = items[index]
+        keys = self.keys
+        if keys is None and not self.reverse:
+            # Compare items directly with < in the common case, which is
+            # faster than calling a comparison function
+            while index > 0:
+                parent_index = (index - 1) // arity
+                parent_item = items[parent_index]
+                if not item < parent_item:
+                    break
+                items[index] = parent_item
+                index = parent_index
+            items[index] = item
+            return
+        # Compare cached keys if any, or else the items themselves
+        less = self._less
+        order = keys if keys is not None else items
+        item_key = order[index]
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_key = order[parent_index]
+            if not less(item_key, parent_key):
+                break
+            items[index] = items[parent_index]
+            if keys is not None:
+                keys[index] = parent_key
+            index = parent_index
+        items[index] = item
+        if keys is not None:
+            keys[index] = item_key
 
     def _bubble_down(self, index):
         """Ensure the heap-ordering property is true below the given index,
-        swapping out of order items, or until a leaf node is reached."""
-        if not (0 <= index <= self._last_index()):
+        moving the least child item up into the hole left by the given item,
+        until a leaf node is reached."""
+        items = self.items
+        last_index = len(items) - 1
+        if not (0 <= index <= last_index):
             raise IndexError('Invalid index: {}'.format(index))
-        left_index = self._left_child_index(index)
-        right_index = self._right_child_index(index)
-        if left_index > self._last_index():
-            return  # This index is a leaf node (does not have any children)
-        item = self.items[index]
-        # TODO: Determine which child item to compare this node's item to
-        child_index = 0
-        ...
-        # TODO: Swap this item with a child item if values are out of order
-        child_item = self.items[child_index]
-        ...
-        # TODO: Then bubble down again if necessary
-        ...
+        arity = self.arity
+        item = items[index]
+        keys = self.keys
+        if keys is None and not self.reverse:
+            # Compare items directly with < in the common case
+            while True:
+                child_index = arity * index + 1
+                if child_index > last_index:
+                    break  # This index is a leaf node
+                # Find the least child, of which the rightmost may be missing
+                child_item = items[child_index]
+                for sibling_index in range(child_index + 1,
+                                           min(child_index + arity,
+                                               last_index + 1)):
+                    sibling_item = items[sibling_index]
+                    if sibling_item < child_item:
+                        child_index = sibling_index
+                        child_item = sibling_item
+                if not child_item < item:
+                    break
+                items[index] = child_item
+                index = child_index
+            items[index] = item
+            return
+        # Compare cached keys if any, or else the items themselves
+        less = self._less
+        order = keys if keys is not None else items
+        item_key = order[index]
+        while True:
+            child_index = arity * index + 1
+            if child_index > last_index:
+                break  # This index is a leaf node
+            # Find the least child, of which the rightmost may be missing
+            child_key = order[child_index]
+            for sibling_index in range(child_index + 1,
+                                       min(child_index + arity,
+                                           last_index + 1)):
+                sibling_key = order[sibling_index]
+                if less(sibling_key, child_key):
+                    child_index = sibling_index
+                    child_key = sibling_key
+            if not less(child_key, item_key):
+                break
+            items[index] = items[child_index]
+            if keys is not None:
+                keys[index] = child_key
+            index = child_index
+        items[index] = item
+        if keys is not None:
+            keys[index] = item_key
+
+    def _heapify(self):
+        """Rearrange the items in place to satisfy the heap-ordering property
+        by bubbling down every non-leaf index from the last one to the root.
+        Running time: O(n) because most items are near the leaves and only
+        bubble down a few levels."""
+        for index in range(self._parent_index(self._last_index()), -1, -1):
+            self._bubble_down(index)
 
     def _last_index(self):
         """Return the last valid index in the underlying array of items."""
@@ -109,12 +259,343 @@ class MinHeap(object):
         """Return the parent index of the item at the given index."""
         if index < 1:
             raise IndexError('Heap index {} has no parent index'.format(index))
-        return (index - 1) >> 1
+        return (index - 1) // self.arity
 
     def _left_child_index(self, index):
-        """Return the left child index of the item at the given index."""
-        return (index << 1) + 1
+        """Return the first (left) child index of the item at the index."""
+        return self.arity * index + 1
 
     def _right_child_index(self, index):
-        """Return the right child index of the item at the given index."""
-        return (index << 1) + 2
+        """Return the last (right) child index of the item at the index."""
+        return self.arity * index + self.arity
+
+
+def nsmallest(count, iterable):
+    """Return a list of the given number of smallest items from the given
+    iterable in sorted order, keeping only that many items in memory.
+    Running time: O(n log k) for n items and count k, but most items are
+    only compared once with the largest of the k smallest items so far."""
+    if count <= 0:
+        return []
+    iterator = iter(iterable)
+    # Keep the smallest items in a max heap so the largest is replaced first
+    heap = MinHeap((item for _, item in zip(range(count), iterator)),
+                   reverse=True)
+    if heap.is_empty():
+        return []
+    largest = heap.items[0]
+    for item in iterator:
+        if item < largest:
+            heap.replace_min(item)
+            largest = heap.items[0]
+    return sorted(heap.items)
+
+
+def nlargest(count, iterable):
+    """Return a list of the given number of largest items from the given
+    iterable in reverse sorted order, keeping only that many items in memory.
+    Running time: O(n log k) for n items and count k."""
+    if count <= 0:
+        return []
+    iterator = iter(iterable)
+    # Keep the largest items in a min heap so the smallest is replaced first
+    heap = MinHeap(item for _, item in zip(range(count), iterator))
+    if heap.is_empty():
+        return []
+    smallest = heap.items[0]
+    for item in iterator:
+        if smallest < item:
+            heap.replace_min(item)
+            smallest = heap.items[0]
+    return sorted(heap.items, reverse=True)
+
+
+def merge(iterables, key=None, unique=False):
+    """Lazily merge the given sorted iterables, such as iterators or open
+    files, and yield their items in one sorted stream, comparing the value of
+    the given key function for each item if any. Equal items are yielded in
+    the order of the iterables they came from, or only the first of each run
+    of equal items is yielded if unique is True.
+    Running time: O(n log k) for n items in k iterables, which are advanced
+    one item at a time so only O(k) items are in memory at once."""
+    heap = MinHeap()
+    # Each heap entry is a list of the current item's key, its iterable's
+    # index to break ties so items are never compared, the item itself, and
+    # the function that advances its iterable
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.insert([item if key is None else key(item), index, item,
+                         iterator])
+            break  # Only the first item, the rest are read lazily
+    last_key = None
+    while not heap.is_empty():
+        entry = heap.items[0]
+        item_key, item = entry[0], entry[2]
+        if not (unique and last_key is not None and item_key == last_key[0]):
+            # Wrap the last key so that a key of None can be deduplicated too
+            last_key = (item_key,)
+            yield item
+        # Advance the winning iterable, reusing its entry in place
+        for next_item in entry[3]:
+            entry[0] = next_item if key is None else key(next_item)
+            entry[2] = next_item
+            heap.replace_min(entry)
+            break
+        else:
+            heap.remove_min()  # This iterable is exhausted
+
+
+class PairingNode(object):
+
+    __slots__ = ('data', 'child', 'sibling')
+
+    def __init__(self, data):
+        """Initialize this pairing heap node with the given data."""
+        self.data = data
+        self.child = None  # Leftmost child, the head of a list of children
+        self.sibling = None  # Next sibling to the right in the parent's list
+
+    def __repr__(self):
+        """Return a string representation of this pairing heap node."""
+        return 'PairingNode({!r})'.format(self.data)
+
+
+class PairingHeap(object):
+    """A PairingHeap is a min heap stored as a tree of nodes with any number
+    of children, where each node's item is not greater than its children's.
+    Insert and meld link two trees in O(1) time, and remove_min pairs up the
+    root's children in two passes in O(log n) amortized time, so it has the
+    same interface as MinHeap but favors insert-heavy workloads."""
+
+    def __init__(self, items=None):
+        """Initialize this heap and insert the given items, if any."""
+        self.root = None  # Node with the minimum item, or None if empty
+        self.count = 0  # Number of items in this heap
+        if items is not None:
+            for item in items:
+                self.insert(item)
+
+    def __repr__(self):
+        """Return a string representation of this heap."""
+        return 'PairingHeap({} items)'.format(self.count)
+
+    def is_empty(self):
+        """Return True if this heap is empty, or False otherwise."""
+        return self.root is None
+
+    def size(self):
+        """Return the number of items in this heap."""
+        return self.count
+
+    def get_min(self):
+        """Return the minimum item at the root of this heap."""
+        if self.root is None:
+            raise ValueError('Heap is empty and has no minimum item')
+        return self.root.data
+
+    def insert(self, item):
+        """Insert the given item into this heap.
+        Running time: O(1) because the new node is linked with the root."""
+        node = PairingNode(item)
+        self.root = node if self.root is None else self._link(self.root, node)
+        self.count += 1
+
+    def remove_min(self):
+        """Remove and return the minimum item at the root of this heap.
+        Running time: O(log n) amortized to pair up the root's children."""
+        if self.root is None:
+            raise ValueError('Heap is empty and has no minimum item')
+        min_item = self.root.data
+        self.root = self._merge_pairs(self.root.child)
+        self.count -= 1
+        return min_item
+
+    def replace_min(self, item):
+        """Remove and return the minimum item at the root of this heap,
+        and insert the given item into this heap."""
+        min_item = self.remove_min()
+        self.insert(item)
+        return min_item
+
+    def meld(self, other):
+        """Move all items from the given pairing heap into this heap, leaving
+        the other heap empty. Running time: O(1) to link the two roots."""
+        if other.root is not None:
+            if self.root is None:
+                self.root = other.root
+            else:
+                self.root = self._link(self.root, other.root)
+            self.count += other.count
+        other.root = None
+        other.count = 0
+
+    def _link(self, first, second):
+        """Make the given root node with the greater item the leftmost child
+        of the other, and return the root of the combined tree."""
+        if second.data < first.data:
+            first, second = second, first
+        second.sibling = first.child
+        first.child = second
+        return first
+
+    def _merge_pairs(self, node):
+        """Combine the given list of sibling trees into one tree and return its
+        root, or None if there are no trees. The first pass links siblings in
+        pairs from left to right, and the second links each pair into the
+        result from right to left, which keeps the tree shallow."""
+        pairs = []
+        while node is not None:
+            second = node.sibling
+            if second is None:
+                pairs.append(node)
+                break
+            next_node = second.sibling
+            node.sibling = second.sibling = None
+            pairs.append(self._link(node, second))
+            node = next_node
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+
+class PriorityHeap(object):
+    """A PriorityHeap is a min heap of items ordered by separate priorities,
+    breaking ties between equal priorities in first-in, first-out order.
+    Priorities, insertion sequence numbers and items are stored in three
+    parallel arrays, so no tuple is allocated per item and comparisons only
+    touch priorities and sequence numbers, never the items themselves."""
+
+    def __init__(self):
+        """Initialize this heap with no items."""
+        self.priorities = []  # Priority of the item at each index
+        self.sequences = []  # Insertion sequence number at each index
+        self.items = []  # Items in heap order
+        self.counter = 0  # Sequence number of the next inserted item
+
+    def __repr__(self):
+        """Return a string representation of this heap."""
+        return 'PriorityHeap({} items)'.format(len(self.items))
+
+    def is_empty(self):
+        """Return True if this heap is empty, or False otherwise."""
+        return len(self.items) == 0
+
+    def size(self):
+        """Return the number of items in this heap."""
+        return len(self.items)
+
+    def get_min(self):
+        """Return the item with the minimum priority at the root of this heap,
+        or the earliest inserted of those with equal minimum priority."""
+        if len(self.items) < 1:
+            raise ValueError('Heap is empty and has no minimum item')
+        return self.items[0]
+
+    def get_min_priority(self):
+        """Return the minimum priority at the root of this heap."""
+        if len(self.items) < 1:
+            raise ValueError('Heap is empty and has no minimum item')
+        return self.priorities[0]
+
+    def insert(self, item, priority):
+        """Insert the given item into this heap with the given priority."""
+        self.priorities.append(priority)
+        self.sequences.append(self.counter)
+        self.items.append(item)
+        self.counter += 1
+        self._bubble_up(len(self.items) - 1)
+
+    def remove_min(self):
+        """Remove and return the minimum item at the root of this heap."""
+        if len(self.items) < 1:
+            raise ValueError('Heap is empty and has no minimum item')
+        min_item = self.items[0]
+        # Move the last entry to the root and bubble down to the leaves
+        priority = self.priorities.pop()
+        sequence = self.sequences.pop()
+        item = self.items.pop()
+        if self.items:
+            self.priorities[0] = priority
+            self.sequences[0] = sequence
+            self.items[0] = item
+            self._bubble_down(0)
+        return min_item
+
+    def replace_min(self, item, priority):
+        """Remove and return the minimum item at the root of this heap,
+        and insert the given item with the given priority into this heap."""
+        if len(self.items) < 1:
+            raise ValueError('Heap is empty and has no minimum item')
+        min_item = self.items[0]
+        # Replace the root and bubble down to the leaves
+        self.priorities[0] = priority
+        self.sequences[0] = self.counter
+        self.items[0] = item
+        self.counter += 1
+        self._bubble_down(0)
+        return min_item
+
+    def _bubble_up(self, index):
+        """Ensure the heap-ordering property is true above the given index,
+        moving parent entries down into the hole left by the given entry."""
+        priorities = self.priorities
+        sequences = self.sequences
+        items = self.items
+        priority = priorities[index]
+        sequence = sequences[index]
+        item = items[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent_priority = priorities[parent_index]
+            # Entries are ordered by priority, then by sequence number
+            if not (priority < parent_priority or
+                    (priority == parent_priority and
+                     sequence < sequences[parent_index])):
+                break
+            priorities[index] = parent_priority
+            sequences[index] = sequences[parent_index]
+            items[index] = items[parent_index]
+            index = parent_index
+        priorities[index] = priority
+        sequences[index] = sequence
+        items[index] = item
+
+    def _bubble_down(self, index):
+        """Ensure the heap-ordering property is true below the given index,
+        moving child entries up into the hole left by the given entry."""
+        priorities = self.priorities
+        sequences = self.sequences
+        items = self.items
+        priority = priorities[index]
+        sequence = sequences[index]
+        item = items[index]
+        last_index = len(items) - 1
+        while True:
+            child_index = (index << 1) + 1
+            if child_index > last_index:
+                break  # This index is a leaf node
+            # Choose the lesser child, ordered by priority then sequence
+            right_index = child_index + 1
+            if right_index <= last_index:
+                left_priority = priorities[child_index]
+                right_priority = priorities[right_index]
+                if (right_priority < left_priority or
+                        (right_priority == left_priority and
+                         sequences[right_index] < sequences[child_index])):
+                    child_index = right_index
+            child_priority = priorities[child_index]
+            if not (child_priority < priority or
+                    (child_priority == priority and
+                     sequences[child_index] < sequence)):
+                break
+            priorities[index] = child_priority
+            sequences[index] = sequences[child_index]
+            items[index] = items[child_index]
+            index = child_index
+        priorities[index] = priority
+        sequences[index] = sequence
+        items[index] = item
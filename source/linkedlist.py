@@ -2,6 +2,9 @@
 
 class Node(object):
 
+    # Store attributes in fixed slots instead of a per-instance dictionary
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         """Initialize this node with the given data"""
         self.data = data
@@ -14,11 +17,18 @@ class Node(object):
 
 class LinkedList(object):
 
+    # Hash tables create one linked list per bucket, so avoid a dictionary
+    __slots__ = ('head', 'tail', 'size', '_finger_index', '_finger_node')
+
     def __init__(self, iterable=None):
         """Initialize this linked list; append the given items, if any"""
         self.head = None
         self.tail = None
         self.size = 0
+        # Remember the last node found by index (the "finger") and its index,
+        # so sequential index accesses continue from there instead of head
+        self._finger_index = 0
+        self._finger_node = None
         if iterable:
             for item in iterable:
                 self.append(item)
@@ -53,20 +63,20 @@ class LinkedList(object):
         """Return True if this linked list is empty, or False"""
         return self.head is None
 
+    def __len__(self):
+        """Return the number of items in this linked list"""
+        return self.size
+
     def length(self):
-        """Return the length of this linked list by traversing its nodes"""
-        # Node counter initialized to zero
-        node_count = 0
-        # Start at the head node
-        current = self.head
-        # Loop until the current node is None, which is one node past the tail
-        while current is not None:
-            # Count one for this node
-            node_count += 1
-            # Skip to the next node
-            current = current.next
-        # Now node_count contains the number of nodes
-        return node_count
+        """Return the length of this linked list.
+        Running time: O(1) because size is updated on every insertion and
+        deletion, so we never need to traverse the nodes to count them."""
+        return self.size
+
+    def first(self):
+        """Return the item at the head of this linked list, or None if it is
+        empty. Running time: O(1)"""
+        return self.head.data if self.head is not None else None
 
     def get_at_index(self, index):
         """Return the item at the given index in this linked list, or
@@ -74,15 +84,119 @@ class LinkedList(object):
         # Check if the given index is out of range and if so raise an error
         if not (0 <= index < self.size):
             raise ValueError('List index out of range: {}'.format(index))
-        # TODO: Find the node at the given index and return the node's data
+        # Find the node at the given index and return the node's data
+        return self._node_at_index(index).data
+
+    def _node_at_index(self, index):
+        """Return the node at the given valid index in this linked list.
+        Best case running time: O(1) if the index is the tail's index or at
+        or just after the index of the last node found (the finger), so
+        looping through indexes in order is O(1) amortized per index.
+        Worst case running time: O(n) if the index is before the finger."""
+        if index == self.size - 1:
+            node = self.tail
+        else:
+            # Start at the finger if it is at or before the given index
+            if self._finger_node is not None and self._finger_index <= index:
+                node = self._finger_node
+                current_index = self._finger_index
+            else:
+                node = self.head
+                current_index = 0
+            # Skip ahead to the node at the given index
+            while current_index < index:
+                node = node.next
+                current_index += 1
+        # Move the finger to the node that was found
+        self._finger_index = index
+        self._finger_node = node
+        return node
 
     def insert_at_index(self, index, item):
         """Insert the given item at the given index in this linked list, or
-        raise ValueError if the given index is out of range of the list size"""
+        raise ValueError if the given index is out of range of the list size.
+        Running time: O(1) at the head or tail or just after the finger,
+        otherwise O(n) to find the node before the given index."""
         # Check if the given index is out of range and if so raise an error
         if not (0 <= index <= self.size):
             raise ValueError('List index out of range: {}'.format(index))
-        # TODO: Find the node before the given index and insert the item after
+        if index == 0:
+            self.prepend(item)
+        elif index == self.size:
+            self.append(item)
+        else:
+            # Find the node before the given index and insert the item after
+            previous = self._node_at_index(index - 1)
+            new_node = Node(item)
+            new_node.next = previous.next
+            previous.next = new_node
+            self.size += 1
+
+    def delete_at_index(self, index):
+        """Delete and return the item at the given index in this linked list,
+        or raise ValueError if the given index is out of range of the list
+        size. Running time: O(1) at the head or just after the finger,
+        otherwise O(n) to find the node before the given index."""
+        # Check if the given index is out of range and if so raise an error
+        if not (0 <= index < self.size):
+            raise ValueError('List index out of range: {}'.format(index))
+        if index == 0:
+            return self.pop_head()
+        # Find the node before the given index and unlink the node after it
+        previous = self._node_at_index(index - 1)
+        node = previous.next
+        previous.next = node.next
+        if node is self.tail:
+            self.tail = previous
+        self.size -= 1
+        return node.data
+
+    def pop_head(self):
+        """Delete and return the item at the head of this linked list, or
+        raise ValueError if this linked list is empty.
+        Running time: O(1) because the head node is unlinked directly."""
+        if self.head is None:
+            raise ValueError('List is empty')
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        node.next = None
+        self.size -= 1
+        # Every node after the old head is now one index closer to the head
+        if self._finger_node is node:
+            self._finger_node = None
+        else:
+            self._finger_index -= 1
+        return node.data
+
+    def delete_after(self, previous):
+        """Delete and return the item in the node after the given node, or at
+        the head if the given node is None, so a caller that already found a
+        node while tracking the one before it can unlink it directly.
+        Running time: O(1) because no nodes are searched."""
+        if previous is None:
+            return self.pop_head()
+        node = previous.next
+        if node is None:
+            raise ValueError('No node after: {}'.format(previous))
+        previous.next = node.next
+        node.next = None
+        if node is self.tail:
+            self.tail = previous
+        self.size -= 1
+        # Forget the finger since indexes after the deleted node change
+        self._finger_node = None
+        return node.data
+
+    def pop_tail(self):
+        """Delete and return the item at the tail of this linked list, or
+        raise ValueError if this linked list is empty.
+        Running time: O(n) to find the node before the tail, since nodes only
+        link forward, unless the finger is already at that node."""
+        if self.tail is None:
+            raise ValueError('List is empty')
+        return self.delete_at_index(self.size - 1)
 
     def append(self, item):
         """Insert the given item at the tail of this linked list"""
@@ -97,6 +211,8 @@ class LinkedList(object):
             self.tail.next = new_node
         # Update tail to new node regardless
         self.tail = new_node
+        # Count one more item
+        self.size += 1
 
     def prepend(self, item):
         """Insert the given item at the head of this linked list"""
@@ -111,6 +227,10 @@ class LinkedList(object):
             new_node.next = self.head
         # Update head to new node regardless
         self.head = new_node
+        # Count one more item
+        self.size += 1
+        # The finger's node is now one index further from the head
+        self._finger_index += 1
 
     def delete(self, item):
         """Delete the given item from this linked list, or raise ValueError"""
@@ -132,6 +252,8 @@ class LinkedList(object):
                 current = current.next
         # Check if we found the given item or we never did and reached the tail
         if found:
+            # Forget the finger since indexes after the found node change
+            self._finger_node = None
             # Check if we found a node in the middle of this linked list
             if current is not self.head and current is not self.tail:
                 # Update the previous node to skip around the found node
@@ -152,6 +274,8 @@ class LinkedList(object):
                     previous.next = None
                 # Update tail to the previous node regardless
                 self.tail = previous
+            # Count one less item
+            self.size -= 1
         else:
             # Otherwise raise an error to tell the user that delete has failed
             raise ValueError('Item not found: {}'.format(item))
@@ -175,6 +299,201 @@ class LinkedList(object):
         return None  # Constant time to return None
 
 
+class DoublyNode(object):
+
+    __slots__ = ('data', 'prev', 'next')
+
+    def __init__(self, data):
+        """Initialize this node with the given data"""
+        self.data = data
+        self.prev = None
+        self.next = None
+
+    def __repr__(self):
+        """Return a string representation of this node"""
+        return 'DoublyNode({})'.format(repr(self.data))
+
+
+class DoublyLinkedList(object):
+    """A DoublyLinkedList links each node to both its previous and next node,
+    arranged in a circle through a sentinel node that holds no item, so the
+    sentinel's next node is the head and its previous node is the tail.
+    The sentinel removes all empty-list and end-of-list special cases, and
+    the backward links make it O(1) to remove the tail or any node given its
+    handle (the node returned when its item was inserted)."""
+
+    __slots__ = ('sentinel', 'size')
+
+    def __init__(self, iterable=None):
+        """Initialize this linked list; append the given items, if any"""
+        # Create a sentinel node linked to itself, representing an empty list
+        self.sentinel = DoublyNode(None)
+        self.sentinel.prev = self.sentinel
+        self.sentinel.next = self.sentinel
+        self.size = 0
+        if iterable:
+            for item in iterable:
+                self.append(item)
+
+    def __str__(self):
+        """Return a formatted string representation of this linked list"""
+        items = ['({})'.format(repr(item)) for item in self.items()]
+        return '[{}]'.format(' <-> '.join(items))
+
+    def __repr__(self):
+        """Return a string representation of this linked list"""
+        return 'DoublyLinkedList({})'.format(repr(self.items()))
+
+    def __len__(self):
+        """Return the number of items in this linked list"""
+        return self.size
+
+    @property
+    def head(self):
+        """The first node in this linked list, or None if it is empty"""
+        node = self.sentinel.next
+        return node if node is not self.sentinel else None
+
+    @property
+    def tail(self):
+        """The last node in this linked list, or None if it is empty"""
+        node = self.sentinel.prev
+        return node if node is not self.sentinel else None
+
+    def items(self):
+        """Return a list of all items in this linked list.
+        Running time: Theta(n) for n items in the list."""
+        result = []
+        node = self.sentinel.next
+        while node is not self.sentinel:
+            result.append(node.data)
+            node = node.next
+        return result
+
+    def is_empty(self):
+        """Return True if this linked list is empty, or False"""
+        return self.size == 0
+
+    def length(self):
+        """Return the length of this linked list. Running time: O(1)"""
+        return self.size
+
+    def _link_after(self, previous, new_node):
+        """Link the given new node right after the given previous node"""
+        new_node.prev = previous
+        new_node.next = previous.next
+        previous.next.prev = new_node
+        previous.next = new_node
+        self.size += 1
+        return new_node
+
+    def _unlink(self, node):
+        """Unlink the given node from its neighbors and detach it"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = None
+        node.next = None
+        self.size -= 1
+
+    def _check_linked(self, node):
+        """Raise ValueError if the given node handle is not linked in a list"""
+        if node is self.sentinel or node.prev is None:
+            raise ValueError('Node is not in this list: {}'.format(node))
+
+    def append(self, item):
+        """Insert the given item at the tail of this linked list and return
+        its node handle. Running time: O(1)"""
+        return self._link_after(self.sentinel.prev, DoublyNode(item))
+
+    def prepend(self, item):
+        """Insert the given item at the head of this linked list and return
+        its node handle. Running time: O(1)"""
+        return self._link_after(self.sentinel, DoublyNode(item))
+
+    def insert_after(self, node, item):
+        """Insert the given item right after the given node handle and return
+        the new item's node handle. Running time: O(1)"""
+        self._check_linked(node)
+        return self._link_after(node, DoublyNode(item))
+
+    def insert_before(self, node, item):
+        """Insert the given item right before the given node handle and return
+        the new item's node handle. Running time: O(1)"""
+        self._check_linked(node)
+        return self._link_after(node.prev, DoublyNode(item))
+
+    def remove_node(self, node):
+        """Remove the given node handle from this linked list and return its
+        item, or raise ValueError if the node is not linked in a list.
+        Running time: O(1) because the node links to both its neighbors.
+        The node must belong to this list; that is not checked because it
+        would take O(n) time."""
+        self._check_linked(node)
+        self._unlink(node)
+        return node.data
+
+    def move_to_front(self, node):
+        """Move the given node handle to the head of this linked list.
+        Running time: O(1)"""
+        self._check_linked(node)
+        if node is not self.sentinel.next:
+            # Unlink the node and relink it after the sentinel
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            node.prev = self.sentinel
+            node.next = self.sentinel.next
+            self.sentinel.next.prev = node
+            self.sentinel.next = node
+
+    def move_to_back(self, node):
+        """Move the given node handle to the tail of this linked list.
+        Running time: O(1)"""
+        self._check_linked(node)
+        if node is not self.sentinel.prev:
+            # Unlink the node and relink it before the sentinel
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            node.next = self.sentinel
+            node.prev = self.sentinel.prev
+            self.sentinel.prev.next = node
+            self.sentinel.prev = node
+
+    def pop_head(self):
+        """Delete and return the item at the head of this linked list, or
+        raise ValueError if this linked list is empty. Running time: O(1)"""
+        if self.size == 0:
+            raise ValueError('List is empty')
+        return self.remove_node(self.sentinel.next)
+
+    def pop_tail(self):
+        """Delete and return the item at the tail of this linked list, or
+        raise ValueError if this linked list is empty. Running time: O(1)"""
+        if self.size == 0:
+            raise ValueError('List is empty')
+        return self.remove_node(self.sentinel.prev)
+
+    def delete(self, item):
+        """Delete the given item from this linked list, or raise ValueError.
+        Running time: O(n) to find the node, then O(1) to remove it."""
+        node = self.sentinel.next
+        while node is not self.sentinel:
+            if node.data == item:
+                self._unlink(node)
+                return
+            node = node.next
+        raise ValueError('Item not found: {}'.format(item))
+
+    def find(self, quality):
+        """Return an item from this linked list satisfying the given quality.
+        Running time: O(n) if the item is near the tail or not present."""
+        node = self.sentinel.next
+        while node is not self.sentinel:
+            if quality(node.data):
+                return node.data
+            node = node.next
+        return None
+
+
 def test_linked_list():
     ll = LinkedList()
     print(ll)
@@ -1,18 +1,34 @@
 #!python
 
-from heap import MinHeap
+from heap import MinHeap, PriorityHeap
 
 
 class PriorityQueue(object):
 
-    def __init__(self):
-        """Initialize this priority queue."""
-        # Initialize a new binary min heap to store the items
-        self.heap = MinHeap()
+    def __init__(self, stable=False, heap=None):
+        """Initialize this priority queue. If stable is True, items with equal
+        priorities are dequeued in the order they were enqueued, and items are
+        never compared to each other, so they need not be comparable.
+        Otherwise (priority, item) pairs are stored in the given empty heap,
+        such as MinHeap(arity=4) or PairingHeap(), or a binary MinHeap."""
+        self.stable = stable
+        if stable:
+            if heap is not None:
+                raise ValueError('Stable priority queue uses its own heap')
+            # Initialize a new heap of parallel priority and item arrays
+            self.heap = PriorityHeap()
+        elif heap is not None:
+            if not heap.is_empty():
+                raise ValueError('Priority queue heap must be empty')
+            self.heap = heap
+        else:
+            # Initialize a new binary min heap to store (priority, item) pairs
+            self.heap = MinHeap()
 
     def __repr__(self):
         """Return a string representation of this priority queue."""
-        return 'PriorityQueue({} items, front={})'.format(self.size(), self.front())
+        return 'PriorityQueue({} items, front={})'.format(self.length(),
+                                                         self.front())
 
     def is_empty(self):
         """Return True if this priority queue is empty, or False otherwise."""
@@ -25,32 +41,227 @@ class PriorityQueue(object):
     def enqueue(self, item, priority):
         """Insert the given item into this priority queue in order according to
         the given priority."""
-        # TODO: Insert given item into heap
-        ...
+        if self.stable:
+            self.heap.insert(item, priority)
+        else:
+            # Insert given item into heap, ordered by its priority first
+            self.heap.insert((priority, item))
 
     def front(self):
         """Return the item at the front of this priority queue without removing
         it, or None if this priority queue is empty."""
-        if self.size() < 1:
+        if self.length() < 1:
             return None
         else:
-            # TODO: Return min item from heap, if any
-            ...
+            # Return min item from heap, if any
+            if self.stable:
+                return self.heap.get_min()
+            return self.heap.get_min()[1]
 
     def dequeue(self):
         """Remove and return the item at the front of this priority queue,
         or raise ValueError if this priority queue is empty."""
-        if self.size() < 1:
+        if self.length() < 1:
             raise ValueError('Priority queue is empty and has no front item')
         else:
-            # TODO: Remove and return min item from heap, if any
-            ...
+            # Remove and return min item from heap, if any
+            if self.stable:
+                return self.heap.remove_min()
+            return self.heap.remove_min()[1]
 
     def push_pop(self, item, priority):
         """Remove and return the item at the front of this priority queue,
         and insert the given item in order according to the given priority."""
-        if self.size() < 1:
+        if self.length() < 1:
             raise ValueError('Priority queue is empty and has no front item')
         else:
-            # TODO: Replace and return min item from heap, if any
-            ...
+            # Replace and return min item from heap, if any
+            if self.stable:
+                return self.heap.replace_min(item, priority)
+            return self.heap.replace_min((priority, item))[1]
+
+
+class IndexedPriorityQueue(object):
+    """An IndexedPriorityQueue is a priority queue of unique, hashable items
+    that can change an item's priority or remove any item in O(log n) time.
+    Items and their priorities are stored in parallel arrays representing an
+    implicit binary min heap ordered by priority only, and a position map
+    records each item's index in those arrays. The position map is updated
+    whenever an item moves while bubbling up or down, so any item can be
+    found in O(1) time instead of O(n) time."""
+
+    def __init__(self, iterable=None):
+        """Initialize this priority queue and enqueue the given pairs of items
+        and priorities, if any"""
+        self.items = []  # Items in heap order
+        self.priorities = []  # Priority of the item at each index
+        self.positions = {}  # Map each item to its index in the arrays
+        if iterable:
+            for item, priority in iterable:
+                self.enqueue(item, priority)
+
+    def __repr__(self):
+        """Return a string representation of this priority queue."""
+        return 'IndexedPriorityQueue({} items, front={})'.format(
+            self.length(), self.front())
+
+    def is_empty(self):
+        """Return True if this priority queue is empty, or False otherwise."""
+        return len(self.items) == 0
+
+    def length(self):
+        """Return the number of items in this priority queue."""
+        return len(self.items)
+
+    def contains(self, item):
+        """Return True if the given item is in this priority queue, or False.
+        Running time: O(1) using the position map."""
+        return item in self.positions
+
+    def priority(self, item):
+        """Return the priority of the given item, or raise ValueError if the
+        given item is not in this priority queue."""
+        return self.priorities[self._position(item)]
+
+    def _position(self, item):
+        """Return the index of the given item, or raise ValueError"""
+        try:
+            return self.positions[item]
+        except KeyError:
+            raise ValueError('Item not found: {}'.format(item))
+
+    def enqueue(self, item, priority):
+        """Insert the given item into this priority queue in order according to
+        the given priority, or raise ValueError if the item is already in
+        this priority queue. Running time: O(log n)"""
+        if item in self.positions:
+            raise ValueError('Item already in priority queue: {}'.format(item))
+        # Insert the item at the end and bubble up to the root
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.positions[item] = len(self.items) - 1
+        self._bubble_up(len(self.items) - 1)
+
+    def front(self):
+        """Return the item at the front of this priority queue without removing
+        it, or None if this priority queue is empty."""
+        if len(self.items) < 1:
+            return None
+        return self.items[0]
+
+    def dequeue(self):
+        """Remove and return the item at the front of this priority queue,
+        or raise ValueError if this priority queue is empty."""
+        if len(self.items) < 1:
+            raise ValueError('Priority queue is empty and has no front item')
+        item = self.items[0]
+        self._remove_at(0)
+        return item
+
+    def push_pop(self, item, priority):
+        """Remove and return the item at the front of this priority queue,
+        and insert the given item in order according to the given priority.
+        The given item may be the front item itself, to reinsert it with a
+        new priority, but not any other item in this priority queue."""
+        if len(self.items) < 1:
+            raise ValueError('Priority queue is empty and has no front item')
+        if item in self.positions and self.positions[item] != 0:
+            raise ValueError('Item already in priority queue: {}'.format(item))
+        min_item = self.items[0]
+        del self.positions[min_item]
+        # Replace the root and bubble down to the leaves
+        self.items[0] = item
+        self.priorities[0] = priority
+        self.positions[item] = 0
+        self._bubble_down(0)
+        return min_item
+
+    def update_priority(self, item, priority):
+        """Change the priority of the given item, or raise ValueError if the
+        given item is not in this priority queue. Running time: O(log n)"""
+        index = self._position(item)
+        old_priority = self.priorities[index]
+        self.priorities[index] = priority
+        # A lower priority moves the item up, a higher one moves it down
+        if priority < old_priority:
+            self._bubble_up(index)
+        else:
+            self._bubble_down(index)
+
+    def remove(self, item):
+        """Remove the given item and return its priority, or raise ValueError
+        if the given item is not in this priority queue.
+        Running time: O(log n)"""
+        index = self._position(item)
+        priority = self.priorities[index]
+        self._remove_at(index)
+        return priority
+
+    def _remove_at(self, index):
+        """Remove the item at the given index and restore heap ordering"""
+        del self.positions[self.items[index]]
+        # Move the last item into the hole left at the given index
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        if index == len(self.items):
+            return  # The removed item was the last item
+        self.items[index] = last_item
+        self.priorities[index] = last_priority
+        self.positions[last_item] = index
+        # The moved item may belong above or below the given index
+        if index > 0 and last_priority < self.priorities[(index - 1) >> 1]:
+            self._bubble_up(index)
+        else:
+            self._bubble_down(index)
+
+    def _bubble_up(self, index):
+        """Ensure the heap-ordering property is true above the given index,
+        moving parent items down into the hole left by the given item (and
+        updating their positions) until the root node is reached."""
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        item = items[index]
+        priority = priorities[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            if not priority < priorities[parent_index]:
+                break
+            # Move the parent item down into the hole
+            items[index] = items[parent_index]
+            priorities[index] = priorities[parent_index]
+            positions[items[index]] = index
+            index = parent_index
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+    def _bubble_down(self, index):
+        """Ensure the heap-ordering property is true below the given index,
+        moving child items up into the hole left by the given item (and
+        updating their positions) until a leaf node is reached."""
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        item = items[index]
+        priority = priorities[index]
+        last_index = len(items) - 1
+        while True:
+            child_index = (index << 1) + 1
+            if child_index > last_index:
+                break  # This index is a leaf node
+            # Compare with the lesser of the two children
+            right_index = child_index + 1
+            if (right_index <= last_index and
+                    priorities[right_index] < priorities[child_index]):
+                child_index = right_index
+            if not priorities[child_index] < priority:
+                break
+            # Move the child item up into the hole
+            items[index] = items[child_index]
+            priorities[index] = priorities[child_index]
+            positions[items[index]] = index
+            index = child_index
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
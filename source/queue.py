@@ -1,19 +1,20 @@
 #!python
 
 from linkedlist import LinkedList
+import array
 
 
 # implement LinkedQueue below, then change the assignment at the bottom
 # to use this Queue implementation to verify it passes all tests
 class LinkedQueue(object):
 
-    def __init__(self, iterable=None):
-        """Initialize this queue and enqueue the given items, if any"""
-        # Initialize a new linked list to store the items
-        self.list = LinkedList()
-        if iterable:
-            for item in iterable:
-                self.enqueue(item)
+    def __init__(self, iterable=None, backend=LinkedList):
+        """Initialize this queue and enqueue the given items, if any.
+        The backend is the class that stores the items: LinkedList, or any
+        class with append, pop_head and first methods, such as BlockDeque."""
+        # Initialize a new linked list to store the items, in the same order
+        # the items would be enqueued since the front of the queue is the head
+        self.list = backend(iterable)
 
     def __repr__(self):
         """Return a string representation of this queue"""
@@ -21,40 +22,59 @@ class LinkedQueue(object):
 
     def is_empty(self):
         """Return True if this queue is empty, or False otherwise"""
-        # TODO: Check if empty
-        pass
+        return self.list.is_empty()
 
     def length(self):
         """Return the number of items in this queue"""
-        # TODO: Count number of items
-        pass
+        return self.list.length()
 
     def enqueue(self, item):
         """Insert the given item at the back of this queue"""
-        # TODO: Insert given item
-        pass
+        self.list.append(item)
 
     def front(self):
         """Return the item at the front of this queue without removing it,
         or None if this queue is empty"""
-        # TODO: Return front item, if any
-        pass
+        return self.list.first()
 
     def dequeue(self):
         """Remove and return the item at the front of this queue,
         or raise ValueError if this queue is empty"""
-        # TODO: Remove and return front item, if any
-        pass
+        if self.list.is_empty():
+            raise ValueError('Queue is empty and has no front item')
+        # Removing the head item is constant time
+        return self.list.pop_head()
 
 
 # implement ArrayQueue below, then change the assignment at the bottom
 # to use this Queue implementation to verify it passes all tests
 class ArrayQueue(object):
-
-    def __init__(self, iterable=None):
-        """Initialize this queue and enqueue the given items, if any"""
-        # Initialize a new dynamic array to store the items
-        self.list = list()
+    """An ArrayQueue stores its items in a circular buffer: a preallocated
+    array with a head index and an item count, wrapping around the end of the
+    array. So enqueue, front and dequeue are all O(1) (amortized for enqueue
+    when the array grows) instead of O(n) for removing from a list's front."""
+
+    # Initial number of slots in the array when no capacity is given
+    min_capacity = 8
+
+    def __init__(self, iterable=None, capacity=None, overwrite=False,
+                 typecode=None):
+        """Initialize this queue and enqueue the given items, if any.
+        If capacity is given, this queue is bounded and never grows: when it
+        is full, enqueue raises ValueError, or if overwrite is True, discards
+        the front item to make room for the new item at the back.
+        If typecode is given, such as 'q' for 64-bit integers or 'd' for
+        floats, items are stored unboxed in an array.array of that type."""
+        if capacity is not None and capacity < 1:
+            raise ValueError('Queue capacity must be positive: {}'.format(
+                capacity))
+        self.capacity = capacity
+        self.overwrite = overwrite
+        self.typecode = typecode
+        # Initialize a new fixed-size array to store the items
+        self.list = self._new_array(capacity or self.min_capacity)
+        self.head = 0  # Index of the front item in the array
+        self.size = 0  # Count number of items in the array
         if iterable:
             for item in iterable:
                 self.enqueue(item)
@@ -65,30 +85,93 @@ class ArrayQueue(object):
 
     def is_empty(self):
         """Return True if this queue is empty, or False otherwise"""
-        # TODO: Check if empty
-        pass
+        return self.size == 0
+
+    def is_full(self):
+        """Return True if this queue is bounded and full, or False otherwise"""
+        return self.capacity is not None and self.size == self.capacity
 
     def length(self):
         """Return the number of items in this queue"""
-        # TODO: Count number of items
-        pass
+        return self.size
+
+    def _new_array(self, capacity):
+        """Return a new array with the given number of empty slots, which are
+        None in a list, or 0 in a typed array"""
+        if self.typecode is None:
+            return [None] * capacity
+        return array.array(self.typecode, [0]) * capacity
+
+    def buffer(self):
+        """Return a memoryview of the items in this typed queue from front to
+        back without copying them, after moving them to the start of the
+        array if they wrap around its end, so the view is in queue order and
+        not storage order. The view shows the array at the time of the call:
+        later dequeues zero its front items, items enqueued later are not in
+        it, and an enqueue or dequeue that resizes the queue moves the items
+        to a new array that the view does not see. Requires Python 3."""
+        if self.typecode is None:
+            raise TypeError('Only a queue with a typecode has a buffer')
+        if self.head + self.size > len(self.list):
+            self._resize(len(self.list))
+        return memoryview(self.list)[self.head:self.head + self.size]
+
+    def _resize(self, new_capacity):
+        """Copy the items into a new array of the given capacity, compacting
+        them so the front item is at index 0. Running time: O(n) for n items,
+        but amortized O(1) per enqueue or dequeue because the capacity only
+        doubles when full and halves when a quarter full."""
+        old_list = self.list
+        old_capacity = len(old_list)
+        new_list = self._new_array(new_capacity)
+        for index in range(self.size):
+            new_list[index] = old_list[(self.head + index) % old_capacity]
+        self.list = new_list
+        self.head = 0
 
     def enqueue(self, item):
         """Insert the given item at the back of this queue"""
-        # TODO: Insert given item
-        pass
+        capacity = len(self.list)
+        if self.size == capacity:
+            if self.capacity is None:
+                # Double the array so enqueue stays amortized constant time
+                self._resize(capacity * 2)
+                capacity *= 2
+            elif self.overwrite:
+                # Discard the front item by moving the head past it
+                self.list[self.head] = item
+                self.head = (self.head + 1) % capacity
+                return
+            else:
+                raise ValueError('Queue is full with {} items'.format(
+                    self.size))
+        # Store the item in the slot after the back item, wrapping around
+        self.list[(self.head + self.size) % capacity] = item
+        self.size += 1
 
     def front(self):
         """Return the item at the front of this queue without removing it,
         or None if this queue is empty"""
-        # TODO: Return front item, if any
-        pass
+        if self.size == 0:
+            return None
+        return self.list[self.head]
 
     def dequeue(self):
         """Remove and return the item at the front of this queue,
         or raise ValueError if this queue is empty"""
-        # TODO: Remove and return front item, if any
-        pass
+        if self.size == 0:
+            raise ValueError('Queue is empty and has no front item')
+        item = self.list[self.head]
+        # Clear the slot so the array does not keep the item alive
+        self.list[self.head] = None if self.typecode is None else 0
+        self.head = (self.head + 1) % len(self.list)
+        self.size -= 1
+        # Halve an unbounded array when it is only a quarter full
+        capacity = len(self.list)
+        if (self.capacity is None and capacity > self.min_capacity and
+                self.size <= capacity // 4):
+            self._resize(capacity // 2)
+        return item
 
 
 # implement LinkedQueue and ArrayQueue above, then change the assignment below
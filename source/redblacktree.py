@@ -0,0 +1,181 @@
+#!python
+
+from binarysearchtree import BinaryNode, BinarySearchTree
+
+
+class RedBlackNode(BinaryNode):
+
+    # Add a slot for the color to the slots of BinaryNode
+    __slots__ = ('red',)
+
+    def __init__(self, data, red=True):
+        """Initialize this red-black node with the given data and color"""
+        super(RedBlackNode, self).__init__(data)
+        # New nodes are red so inserting them never changes black heights
+        self.red = red
+
+    def __repr__(self):
+        """Return a string representation of this red-black node"""
+        color = 'red' if self.red else 'black'
+        return 'RedBlackNode({}, {})'.format(repr(self.data), color)
+
+
+class RedBlackTree(BinarySearchTree):
+    """A RedBlackTree is a binary search tree that colors each node red or
+    black and recolors or rotates nodes after each insertion so no red node
+    has a red child and every path from the root down to an empty subtree
+    passes through the same number of black nodes. So its height is at most
+    2 log(n + 1) and contains, search and insert take O(log n) time in the
+    worst case, with fewer rotations per insertion than an AVL tree."""
+
+    def __repr__(self):
+        """Return a string representation of this red-black tree"""
+        return 'RedBlackTree({} nodes)'.format(self.size)
+
+    def _build_sorted(self, items):
+        """Replace this tree's nodes with a perfectly balanced tree built from
+        the given list of sorted items, skipping adjacent duplicate items"""
+        unique_items = [item for index, item in enumerate(items)
+                        if index == 0 or items[index - 1] != item]
+        # Find the depth of the deepest level, which may be incomplete
+        max_depth = -1
+        count = len(unique_items)
+        while count > 0:
+            max_depth += 1
+            count //= 2
+        self.root = self._build_colored_subtree(unique_items, 0,
+                                                len(unique_items), 0,
+                                                max_depth)
+        if self.root is not None:
+            self.root.red = False  # The root is always black
+        self.size = len(unique_items)
+
+    def _build_colored_subtree(self, items, start, stop, depth, max_depth):
+        """Return the root node of a balanced subtree containing the given
+        sorted items between the start and stop indexes, or None if empty.
+        Only nodes on the deepest level are red, so every path has the same
+        number of black nodes and no red node has a red child."""
+        if start >= stop:
+            return None
+        middle = (start + stop) // 2
+        node = RedBlackNode(items[middle], red=(depth == max_depth))
+        node.left = self._build_colored_subtree(items, start, middle,
+                                                depth + 1, max_depth)
+        node.right = self._build_colored_subtree(items, middle + 1, stop,
+                                                 depth + 1, max_depth)
+        node.update_size()
+        return node
+
+    def insert(self, item):
+        """Insert the given item in order into this red-black tree and
+        rebalance. Running time: O(log n) because the tree's height is
+        O(log n) and at most two rotations are needed to restore balance."""
+        # Handle the case where the tree is empty
+        if self.is_empty():
+            self.root = RedBlackNode(item, red=False)
+            self.size += 1
+            return
+        # Descend to where the given item belongs, remembering the path
+        path = []
+        node = self.root
+        while node is not None:
+            if item == node.data:
+                return  # This tree already contains the given item
+            path.append(node)
+            node = node.left if item < node.data else node.right
+        # Create a new red node and attach it to the last node on the path
+        node = RedBlackNode(item)
+        if item < path[-1].data:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        # Increase the subtree size of each ancestor of the new node
+        for ancestor in path:
+            ancestor.size += 1
+        path.append(node)
+        self.size += 1
+        self._fix_red_red(path)
+
+    def _fix_red_red(self, path):
+        """Restore the red-black properties along the given path of nodes from
+        the root down to a new red node, whose parent may also be red"""
+        index = len(path) - 1
+        while index >= 2 and path[index - 1].red:
+            node = path[index]
+            parent = path[index - 1]
+            # The parent is red, so it is not the root and has a parent
+            grandparent = path[index - 2]
+            if grandparent.left is parent:
+                uncle = grandparent.right
+            else:
+                uncle = grandparent.left
+            if uncle is not None and uncle.red:
+                # Recolor and continue fixing from the grandparent upward
+                parent.red = False
+                uncle.red = False
+                grandparent.red = True
+                index -= 2
+                continue
+            # Rotate the new red node's parent or itself into the grandparent
+            # position and color it black, which restores every property
+            if grandparent.left is parent:
+                if parent.right is node:  # Left-right case
+                    grandparent.left = self.rotate_left(parent)
+                subtree = self.rotate_right(grandparent)
+            else:
+                if parent.left is node:  # Right-left case
+                    grandparent.right = self.rotate_right(parent)
+                subtree = self.rotate_left(grandparent)
+            subtree.red = False
+            grandparent.red = True
+            # Replace the grandparent with the rotated subtree root
+            if index == 2:
+                self.root = subtree
+            elif path[index - 3].left is grandparent:
+                path[index - 3].left = subtree
+            else:
+                path[index - 3].right = subtree
+            break
+        # The root is always black
+        self.root.red = False
+
+    def rotate_left(self, node):
+        """Rotate the given node's right child up so the given node becomes its
+        left child, and return the new root of this subtree"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        # The pivot now roots the whole subtree, so it takes over its size
+        pivot.size = node.size
+        node.update_size()
+        return pivot
+
+    def rotate_right(self, node):
+        """Rotate the given node's left child up so the given node becomes its
+        right child, and return the new root of this subtree"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        # The pivot now roots the whole subtree, so it takes over its size
+        pivot.size = node.size
+        node.update_size()
+        return pivot
+
+
+def test_red_black_tree():
+    # Insert items in sorted order, which would make a plain BST a linked list
+    items = list(range(1, 16))
+    print('items: ' + str(items))
+
+    tree = RedBlackTree()
+    for item in items:
+        tree.insert(item)
+        print('insert({}), size: {}, height: {}'.format(
+            item, tree.size, tree.height()))
+    print('root: ' + str(tree.root))
+    print('items in-order:    ' + str(tree.items_in_order()))
+    print('items level-order: ' + str(tree.items_level_order()))
+
+
+if __name__ == '__main__':
+    test_red_black_tree()
@@ -1,19 +1,20 @@
 #!python
 
 from linkedlist import LinkedList
+import array
 
 
 # implement LinkedStack below, then change the assignment at the bottom
 # to use this Stack implementation to verify it passes all tests
 class LinkedStack(object):
 
-    def __init__(self, iterable=None):
-        """Initialize this stack and push the given items, if any"""
-        # Initialize a new linked list to store the items
-        self.list = LinkedList()
-        if iterable:
-            for item in iterable:
-                self.push(item)
+    def __init__(self, iterable=None, backend=LinkedList):
+        """Initialize this stack and push the given items, if any.
+        The backend stores the items: LinkedList, or BlockDeque to allocate
+        one array block per 64 items instead of one node per item."""
+        # Initialize a new linked list to store the items in reverse order,
+        # since the last item pushed is at the top of the stack (the head)
+        self.list = backend(reversed(list(iterable)) if iterable else None)
 
     def __repr__(self):
         """Return a string representation of this stack"""
@@ -21,40 +22,41 @@ class LinkedStack(object):
 
     def is_empty(self):
         """Return True if this stack is empty, or False otherwise"""
-        # TODO: Check if empty
-        pass
+        return self.list.is_empty()
 
     def length(self):
         """Return the number of items in this stack"""
-        # TODO: Count number of items
-        pass
+        return self.list.length()
 
     def push(self, item):
         """Insert the given item on the top of this stack"""
-        # TODO: Push given item
-        pass
+        self.list.prepend(item)
 
     def peek(self):
         """Return the item on the top of this stack without removing it,
         or None if this stack is empty"""
-        # TODO: Return top item, if any
-        pass
+        return self.list.first()
 
     def pop(self):
         """Remove and return the item on the top of this stack,
         or raise ValueError if this stack is empty"""
-        # TODO: Remove and return top item, if any
-        pass
+        if self.list.is_empty():
+            raise ValueError('Stack is empty and has no top item')
+        # Removing the head item is constant time
+        return self.list.pop_head()
 
 
 # implement ArrayStack below, then change the assignment at the bottom
 # to use this Stack implementation to verify it passes all tests
 class ArrayStack(object):
 
-    def __init__(self, iterable=None):
-        """Initialize this stack and push the given items, if any"""
+    def __init__(self, iterable=None, typecode=None):
+        """Initialize this stack and push the given items, if any.
+        If typecode is given, such as 'q' for 64-bit integers or 'd' for
+        floats, items are stored unboxed in an array.array of that type."""
+        self.typecode = typecode
         # Initialize a new dynamic array to store the items
-        self.list = list()
+        self.list = list() if typecode is None else array.array(typecode)
         if iterable:
             for item in iterable:
                 self.push(item)
@@ -65,30 +67,115 @@ class ArrayStack(object):
 
     def is_empty(self):
         """Return True if this stack is empty, or False otherwise"""
-        # TODO: Check if empty
-        pass
+        return len(self.list) == 0
 
     def length(self):
         """Return the number of items in this stack"""
-        # TODO: Count number of items
-        pass
+        return len(self.list)
 
     def push(self, item):
         """Insert the given item on the top of this stack"""
-        # TODO: Insert given item
-        pass
+        # Appending to the end of the array is amortized constant time,
+        # since the top of the stack is the last item
+        self.list.append(item)
 
     def peek(self):
         """Return the item on the top of this stack without removing it,
         or None if this stack is empty"""
-        # TODO: Return top item, if any
-        pass
+        if len(self.list) == 0:
+            return None
+        return self.list[-1]
 
     def pop(self):
         """Remove and return the item on the top of this stack,
         or raise ValueError if this stack is empty"""
-        # TODO: Remove and return top item, if any
-        pass
+        if len(self.list) == 0:
+            raise ValueError('Stack is empty and has no top item')
+        # Removing the last item is constant time
+        return self.list.pop()
+
+    def buffer(self):
+        """Return a memoryview of the items in this typed stack from bottom to
+        top without copying them. The stack cannot grow or shrink until the
+        view is released. Requires Python 3."""
+        if self.typecode is None:
+            raise TypeError('Only a stack with a typecode has a buffer')
+        return memoryview(self.list)
+
+
+class PersistentStack(object):
+    """A PersistentStack is an immutable stack stored as a singly linked list
+    of immutable (item, next cell) tuples (a cons list), so no code can
+    change a cell after it is created. Instead of changing this stack, push
+    and pop return a new stack that shares all of this stack's cells, so
+    every version stays valid and taking a snapshot is free."""
+
+    __slots__ = ('head', 'size')
+
+    def __init__(self, iterable=None):
+        """Initialize this stack and push the given items, if any"""
+        self.head = None  # Cell of the top item, or None if empty
+        self.size = 0  # Count number of items, since cells are shared
+        if iterable:
+            for item in iterable:
+                self.head = (item, self.head)
+                self.size += 1
+
+    @classmethod
+    def _from_head(cls, head, size):
+        """Return a new stack with the given top cell and number of items"""
+        stack = cls()
+        stack.head = head
+        stack.size = size
+        return stack
+
+    def __repr__(self):
+        """Return a string representation of this stack"""
+        return 'PersistentStack({} items, top={})'.format(self.size,
+                                                         self.peek())
+
+    def __len__(self):
+        """Return the number of items in this stack"""
+        return self.size
+
+    def __iter__(self):
+        """Return a generator of the items in this stack from top to bottom"""
+        cell = self.head
+        while cell is not None:
+            item, cell = cell
+            yield item
+
+    def items(self):
+        """Return a list of all items in this stack from top to bottom"""
+        return list(self)
+
+    def is_empty(self):
+        """Return True if this stack is empty, or False otherwise"""
+        return self.head is None
+
+    def length(self):
+        """Return the number of items in this stack"""
+        return self.size
+
+    def push(self, item):
+        """Return a new stack with the given item on top of this stack's items.
+        This stack is unchanged. Running time: O(1)"""
+        return self._from_head((item, self.head), self.size + 1)
+
+    def peek(self):
+        """Return the item on the top of this stack without removing it,
+        or None if this stack is empty"""
+        if self.head is None:
+            return None
+        return self.head[0]
+
+    def pop(self):
+        """Return a new stack without the item on the top of this stack,
+        or raise ValueError if this stack is empty. This stack is unchanged,
+        so use peek first to get the top item. Running time: O(1)"""
+        if self.head is None:
+            raise ValueError('Stack is empty and has no top item')
+        return self._from_head(self.head[1], self.size - 1)
 
 
 # implement LinkedStack and ArrayStack above, then change the assignment below
@@ -0,0 +1,141 @@
+#!python
+
+from asyncqueue import AsyncQueue, AsyncPriorityQueue
+import asyncio
+import unittest
+
+
+def run(coroutine):
+    """Run the given coroutine on a new event loop and return its result"""
+    return asyncio.run(coroutine)
+
+
+class TestAsyncQueue(unittest.TestCase):
+
+    def test_put_and_get(self):
+        async def main():
+            q = AsyncQueue(['A'])
+            await q.put('B')
+            q.put_nowait('C')
+            return [await q.get() for _ in range(3)]
+        assert run(main()) == ['A', 'B', 'C']
+
+    def test_get_nowait_on_empty_queue(self):
+        q = AsyncQueue()
+        with self.assertRaises(ValueError):
+            q.get_nowait()
+        with self.assertRaises(ValueError):
+            AsyncQueue(['A', 'B'], capacity=1)
+
+    def test_get_waits_for_put(self):
+        async def main():
+            q = AsyncQueue()
+            getter = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            assert not getter.done()
+            await q.put('A')
+            return await getter
+        assert run(main()) == 'A'
+
+    def test_backpressure(self):
+        async def main():
+            q = AsyncQueue(capacity=2)
+            await q.put('A')
+            await q.put('B')
+            with self.assertRaises(ValueError):
+                q.put_nowait('C')
+            putter = asyncio.ensure_future(q.put('C'))
+            await asyncio.sleep(0)
+            assert not putter.done()  # Waiting for room
+            assert await q.get() == 'A'
+            await putter
+            return [q.get_nowait(), q.get_nowait()]
+        assert run(main()) == ['B', 'C']
+
+    def test_cancelled_get_does_not_lose_items(self):
+        async def main():
+            q = AsyncQueue()
+            first = asyncio.ensure_future(q.get())
+            second = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            # Wake up the first getter, then cancel it before it runs
+            q.put_nowait('A')
+            first.cancel()
+            result = await second  # The wake up call was passed on
+            assert q.getters.is_empty()
+            return result
+        assert run(main()) == 'A'
+
+    def test_cancelled_get_leaves_no_waiter(self):
+        async def main():
+            q = AsyncQueue()
+            getter = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            getter.cancel()
+            await asyncio.sleep(0)
+            return q.getters.is_empty(), q.length()
+        assert run(main()) == (True, 0)
+
+    def test_get_batch(self):
+        async def main():
+            q = AsyncQueue(range(5))
+            first = await q.get_batch(3)
+            rest = await q.get_batch(10)  # Only takes what is ready
+            empty = await q.get_batch(10, timeout=0.01)
+
+            async def produce():
+                for item in range(10):
+                    await q.put(item)
+                    await asyncio.sleep(0)
+            producer = asyncio.ensure_future(produce())
+            batch = await q.get_batch(4, timeout=1)
+            await producer
+            return first, rest, empty, batch
+        assert run(main()) == ([0, 1, 2], [3, 4], [], [0, 1, 2, 3])
+
+    def test_cancelled_get_batch_does_not_lose_items(self):
+        async def main():
+            q = AsyncQueue(['A', 'B'])
+            getter = asyncio.ensure_future(q.get_batch(5, timeout=10))
+            await asyncio.sleep(0)
+            assert not getter.done()  # Took both items, waiting for more
+            getter.cancel()
+            batch = await getter
+            q.put_nowait('C')
+            return batch, q.get_nowait(), q.is_empty()
+        assert run(main()) == (['A', 'B'], 'C', True)
+
+    def test_producers_and_consumers(self):
+        async def main():
+            q = AsyncQueue(capacity=4)
+            results = []
+
+            async def produce(start):
+                for item in range(start, start + 100):
+                    await q.put(item)
+
+            async def consume():
+                while len(results) < 300:
+                    results.extend(await q.get_batch(8, timeout=0.1))
+            await asyncio.gather(produce(0), produce(100), produce(200),
+                                 consume(), consume())
+            return sorted(results)
+        assert run(main()) == list(range(300))
+
+
+class TestAsyncPriorityQueue(unittest.TestCase):
+
+    def test_put_and_get(self):
+        async def main():
+            q = AsyncPriorityQueue(capacity=3)
+            await q.put('B', 2)
+            await q.put('A', 1)
+            await q.put('C', 2)
+            assert q.is_full() is True
+            assert q.front() == 'A'
+            return [await q.get() for _ in range(3)]
+        assert run(main()) == ['A', 'B', 'C']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!python
+
+from avltree import AVLTree, AVLNode
+import random
+import unittest
+
+
+def assert_avl_balanced(node):
+    """Assert the given subtree is ordered and balanced with correct cached
+    heights, and return its height"""
+    if node is None:
+        return -1
+    left_height = assert_avl_balanced(node.left)
+    right_height = assert_avl_balanced(node.right)
+    if node.left is not None:
+        assert node.left.data < node.data
+    if node.right is not None:
+        assert node.right.data > node.data
+    assert abs(left_height - right_height) <= 1
+    assert node.height() == 1 + max(left_height, right_height)
+    node_count = 1
+    for child in (node.left, node.right):
+        node_count += child.size if child is not None else 0
+    assert node.size == node_count
+    return node.height()
+
+
+class TestAVLNode(unittest.TestCase):
+
+    def test_init(self):
+        node = AVLNode(123)
+        assert node.data == 123
+        assert node.left is None
+        assert node.right is None
+        assert node.height() == 0
+        assert node.balance_factor() == 0
+        assert not hasattr(node, '__dict__')  # No per-instance dictionary
+
+    def test_update_height_and_balance_factor(self):
+        node = AVLNode(2)
+        node.left = AVLNode(1)
+        node.update_height()
+        assert node.height() == 1
+        assert node.balance_factor() == 1
+        node.right = AVLNode(3)
+        node.update_height()
+        assert node.height() == 1
+        assert node.balance_factor() == 0
+
+
+class TestAVLTree(unittest.TestCase):
+
+    def test_init(self):
+        tree = AVLTree()
+        assert tree.root is None
+        assert tree.size == 0
+        assert tree.is_empty() is True
+        assert tree.height() == -1
+
+    def test_insert_sorted_items(self):
+        tree = AVLTree()
+        for item in range(1, 8):
+            tree.insert(item)
+        assert tree.size == 7
+        assert tree.height() == 2
+        assert tree.items_level_order() == [4, 2, 6, 1, 3, 5, 7]
+        assert_avl_balanced(tree.root)
+
+    def test_insert_reverse_sorted_items(self):
+        tree = AVLTree()
+        for item in range(1000, 0, -1):
+            tree.insert(item)
+        assert tree.size == 1000
+        assert tree.height() <= 14  # At most 1.44 log2(n)
+        assert tree.items_in_order() == list(range(1, 1001))
+        assert_avl_balanced(tree.root)
+
+    def test_insert_left_right_and_right_left_cases(self):
+        tree = AVLTree([3, 1, 2])  # Left-right case
+        assert tree.items_level_order() == [2, 1, 3]
+        tree = AVLTree([1, 3, 2])  # Right-left case
+        assert tree.items_level_order() == [2, 1, 3]
+
+    def test_insert_random_items(self):
+        items = random.sample(range(10000), 500)
+        tree = AVLTree(items)
+        assert tree.size == 500
+        assert_avl_balanced(tree.root)
+        assert tree.items_in_order() == sorted(items)
+        for item in items:
+            assert tree.contains(item) is True
+            assert tree.search(item) == item
+        assert tree.contains(-1) is False
+
+    def test_insert_duplicate_item(self):
+        tree = AVLTree([2, 1, 3])
+        tree.insert(1)
+        assert tree.size == 3
+        assert tree.items_in_order() == [1, 2, 3]
+
+    def test_from_sorted(self):
+        tree = AVLTree.from_sorted(range(100))
+        assert isinstance(tree, AVLTree)
+        assert isinstance(tree.root, AVLNode)
+        assert_avl_balanced(tree.root)
+        tree.insert(100)
+        tree.insert(101)
+        assert_avl_balanced(tree.root)
+        assert tree.items_in_order() == list(range(102))
+
+    def test_order_statistics(self):
+        tree = AVLTree()
+        for item in range(100):
+            tree.insert(item)
+        assert_avl_balanced(tree.root)
+        for item in range(100):
+            assert tree.rank(item) == item
+            assert tree.select(item) == item
+        assert tree.count_range(10, 19) == 10
+        assert list(tree.range(10, 19)) == list(range(10, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
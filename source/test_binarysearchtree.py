@@ -1,6 +1,8 @@
 #!python
 
 from binarysearchtree import BinarySearchTree, BinaryNode
+import itertools
+import random
 import unittest
 
 
@@ -13,6 +15,10 @@ class TestBinaryNode(unittest.TestCase):
         assert node.left is None
         assert node.right is None
 
+    def test_slots(self):
+        node = BinaryNode(123)
+        assert not hasattr(node, '__dict__')  # No per-instance dictionary
+
     def test_is_leaf(self):
         # Create node with no children
         node = BinaryNode(2)
@@ -80,6 +86,44 @@ class TestBinarySearchTree(unittest.TestCase):
         assert bst.size == 3
         assert bst.is_empty() is False
 
+    def test_init_with_sorted_list(self):
+        # Sorted items are built into a balanced tree, not a linked list
+        items = list(range(1, 16))
+        bst = BinarySearchTree(items)
+        assert bst.size == 15
+        assert bst.height() == 3
+        assert bst.root.data == 8
+        assert bst.root.left.data == 4
+        assert bst.root.right.data == 12
+        assert bst.items_in_order() == items
+
+    def test_init_with_sorted_list_with_duplicates(self):
+        # Repeated items still take the balanced build, stored once each
+        items = [item for item in range(1, 16) for _ in range(3)]
+        bst = BinarySearchTree(items)
+        assert bst.size == 15
+        assert bst.height() == 3
+        assert bst.root.data == 8
+        assert bst.items_in_order() == list(range(1, 16))
+
+    def test_from_sorted(self):
+        bst = BinarySearchTree.from_sorted([1, 2, 2, 3, 4, 5, 6, 7])
+        assert bst.size == 7  # Duplicate item is stored once
+        assert bst.height() == 2
+        assert bst.items_level_order() == [4, 2, 6, 1, 3, 5, 7]
+        bst = BinarySearchTree.from_sorted(range(1000))
+        assert bst.height() == 9
+        for item in range(1000):
+            assert bst.contains(item) is True
+        assert BinarySearchTree.from_sorted([]).is_empty() is True
+
+    def test_insert_duplicate_item(self):
+        bst = BinarySearchTree([2, 1, 3])
+        bst.insert(2)
+        bst.insert(3)
+        assert bst.size == 3
+        assert bst.items_in_order() == [1, 2, 3]
+
     def test_size(self):
         bst = BinarySearchTree()
         assert bst.size == 0
@@ -178,6 +222,100 @@ class TestBinarySearchTree(unittest.TestCase):
         bst = BinarySearchTree(items)
         assert bst.items_level_order() == [4, 2, 6, 1, 3, 5, 7]
 
+    def test_iter_traversals(self):
+        # Create a complete binary search tree of 7 items in level-order
+        items = [4, 2, 6, 1, 3, 5, 7]
+        bst = BinarySearchTree(items)
+        assert list(bst.iter_in_order()) == [1, 2, 3, 4, 5, 6, 7]
+        assert list(bst.iter_pre_order()) == [4, 2, 1, 3, 6, 5, 7]
+        assert list(bst.iter_post_order()) == [1, 3, 2, 5, 7, 6, 4]
+        assert list(bst.iter_level_order()) == [4, 2, 6, 1, 3, 5, 7]
+        assert list(bst) == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_iter_traversals_of_empty_tree(self):
+        bst = BinarySearchTree()
+        assert list(bst.iter_in_order()) == []
+        assert list(bst.iter_pre_order()) == []
+        assert list(bst.iter_post_order()) == []
+        assert list(bst.iter_level_order()) == []
+
+    def test_iter_in_order_stops_early(self):
+        bst = BinarySearchTree.from_sorted(range(1000))
+        assert list(itertools.islice(bst.iter_in_order(), 3)) == [0, 1, 2]
+
+    def test_traversals_of_deeply_skewed_tree(self):
+        # Link nodes by hand into a right-skewed tree much deeper than
+        # the recursion limit (inserting sorted items would take O(n^2))
+        count = 10000
+        bst = BinarySearchTree()
+        bst.root = node = BinaryNode(0)
+        for item in range(1, count):
+            node.right = BinaryNode(item)
+            node = node.right
+        bst.size = count
+        assert bst.items_in_order() == list(range(count))
+        assert bst.items_pre_order() == list(range(count))
+        assert bst.items_post_order() == list(range(count - 1, -1, -1))
+        assert bst.items_level_order() == list(range(count))
+
+    def test_subtree_sizes(self):
+        bst = BinarySearchTree([4, 2, 6, 1, 3, 5, 7])
+        assert bst.root.size == 7
+        assert bst.root.left.size == 3
+        assert bst.root.right.left.size == 1
+        bst.insert(8)
+        bst.insert(8)  # Duplicate item does not change sizes
+        assert bst.root.size == 8
+        assert bst.root.right.size == 4
+        assert bst.root.right.right.size == 2
+        bst = BinarySearchTree.from_sorted(range(10))
+        assert bst.root.size == 10
+
+    def test_rank_and_select(self):
+        items = random.sample(range(0, 1000, 2), 100)
+        bst = BinarySearchTree(items)
+        for index, item in enumerate(sorted(items)):
+            assert bst.rank(item) == index
+            assert bst.rank(item + 1) == index + 1  # Item not in tree
+            assert bst.select(index) == item
+        assert bst.rank(-1) == 0
+        with self.assertRaises(ValueError):
+            bst.select(100)
+        with self.assertRaises(ValueError):
+            bst.select(-1)
+
+    def test_floor_and_ceiling(self):
+        bst = BinarySearchTree([40, 20, 60, 10, 30, 50, 70])
+        assert bst.floor(30) == 30
+        assert bst.floor(35) == 30
+        assert bst.floor(5) is None
+        assert bst.floor(99) == 70
+        assert bst.ceiling(30) == 30
+        assert bst.ceiling(35) == 40
+        assert bst.ceiling(5) == 10
+        assert bst.ceiling(99) is None
+        assert BinarySearchTree().floor(1) is None
+
+    def test_count_range_and_range(self):
+        bst = BinarySearchTree([40, 20, 60, 10, 30, 50, 70])
+        assert bst.count_range(20, 50) == 4
+        assert list(bst.range(20, 50)) == [20, 30, 40, 50]
+        assert bst.count_range(15, 55) == 4
+        assert list(bst.range(15, 55)) == [20, 30, 40, 50]
+        assert bst.count_range(0, 100) == 7
+        assert list(bst.range(0, 100)) == [10, 20, 30, 40, 50, 60, 70]
+        assert bst.count_range(71, 100) == 0
+        assert list(bst.range(71, 100)) == []
+        assert bst.count_range(0, 9) == 0
+        assert list(bst.range(0, 9)) == []
+        assert bst.count_range(50, 20) == 0
+        assert list(bst.range(50, 20)) == []
+
+    def test_range_stops_early(self):
+        bst = BinarySearchTree.from_sorted(range(1000))
+        items = bst.range(500, 999)
+        assert list(itertools.islice(items, 3)) == [500, 501, 502]
+
 
 if __name__ == '__main__':
     unittest.main()
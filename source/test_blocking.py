@@ -0,0 +1,141 @@
+#!python
+
+from blocking import BlockingQueue, BlockingStack
+import threading
+import time
+import unittest
+
+
+class TestBlockingQueue(unittest.TestCase):
+
+    def test_init_with_list(self):
+        q = BlockingQueue(['A', 'B', 'C'])
+        assert q.front() == 'A'
+        assert q.length() == 3
+        assert len(q) == 3
+        with self.assertRaises(ValueError):
+            BlockingQueue(['A', 'B', 'C'], capacity=2)
+
+    def test_enqueue_and_dequeue(self):
+        q = BlockingQueue()
+        q.enqueue('A')
+        q.enqueue('B')
+        assert q.dequeue() == 'A'
+        assert q.dequeue() == 'B'
+        assert q.is_empty() is True
+        with self.assertRaises(ValueError):
+            q.dequeue(block=False)
+
+    def test_dequeue_timeout(self):
+        q = BlockingQueue()
+        start = time.time()
+        with self.assertRaises(ValueError):
+            q.dequeue(timeout=0.05)
+        assert time.time() - start >= 0.04
+
+    def test_bounded_enqueue(self):
+        q = BlockingQueue(capacity=2)
+        q.enqueue('A')
+        q.enqueue('B')
+        assert q.is_full() is True
+        with self.assertRaises(ValueError):
+            q.enqueue('C', block=False)
+        with self.assertRaises(ValueError):
+            q.enqueue('C', timeout=0.01)
+
+    def test_dequeue_waits_for_enqueue(self):
+        q = BlockingQueue()
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(q.dequeue()))
+        consumer.start()
+        time.sleep(0.01)
+        q.enqueue('A')
+        consumer.join(1)
+        assert result == ['A']
+
+    def test_enqueue_waits_for_room(self):
+        q = BlockingQueue(capacity=1)
+        q.enqueue('A')
+        producer = threading.Thread(target=q.enqueue, args=('B',))
+        producer.start()
+        time.sleep(0.01)
+        assert q.dequeue() == 'A'
+        producer.join(1)
+        assert q.dequeue() == 'B'
+
+    def test_enqueue_many_and_drain(self):
+        q = BlockingQueue(capacity=5)
+        q.enqueue_many(['A', 'B', 'C'])
+        with self.assertRaises(ValueError):
+            q.enqueue_many(['D', 'E', 'F'], block=False)
+        assert q.length() == 3  # None are added unless all of them fit
+        q.enqueue_many(['D', 'E'], block=False)
+        assert q.drain(2) == ['A', 'B']
+        assert q.drain() == ['C', 'D', 'E']
+        assert q.drain() == []
+
+    def test_enqueue_many_timeout(self):
+        q = BlockingQueue(['A'], capacity=3)
+        with self.assertRaises(ValueError):
+            q.enqueue_many(['B', 'C', 'D'], timeout=0.01)
+        assert q.drain() == ['A', 'B', 'C']  # Those that fit stay
+
+    def test_producers_and_consumers(self):
+        q = BlockingQueue(capacity=10)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for item in range(start, start + 500):
+                q.enqueue(item)
+
+        def consume():
+            items = [q.dequeue() for _ in range(500)]
+            with lock:
+                results.extend(items)
+
+        threads = ([threading.Thread(target=produce, args=(start,))
+                    for start in range(0, 2000, 500)] +
+                   [threading.Thread(target=consume) for _ in range(4)])
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        assert sorted(results) == list(range(2000))
+        assert q.is_empty() is True
+
+
+class TestBlockingStack(unittest.TestCase):
+
+    def test_push_and_pop(self):
+        s = BlockingStack(['A', 'B'])
+        s.push('C')
+        assert s.peek() == 'C'
+        assert s.pop() == 'C'
+        assert s.pop() == 'B'
+        assert s.pop() == 'A'
+        with self.assertRaises(ValueError):
+            s.pop(timeout=0.01)
+
+    def test_push_many_and_drain(self):
+        s = BlockingStack(capacity=3)
+        s.push_many(['A', 'B', 'C'])
+        with self.assertRaises(ValueError):
+            s.push('D', block=False)
+        with self.assertRaises(ValueError):
+            s.push_many(['D'], block=False)
+        assert s.drain() == ['C', 'B', 'A']
+
+    def test_pop_waits_for_push(self):
+        s = BlockingStack()
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(s.pop()))
+        consumer.start()
+        time.sleep(0.01)
+        s.push_many(['A', 'B'])
+        consumer.join(1)
+        assert result == ['B']
+
+
+if __name__ == '__main__':
+    unittest.main()
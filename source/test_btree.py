@@ -0,0 +1,291 @@
+#!python
+
+from btree import BTree
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+
+def check_invariants(tree):
+    """Check that every node of the given tree has sorted keys within the
+    bounds set by its ancestors and between the minimum and maximum number,
+    that all leaves are at the same depth, and that the leaf links visit
+    every key in order"""
+    pager = tree.pager
+    if pager.root is None:
+        assert tree.size == 0
+        return
+    leaf_depths = set()
+    leaf_pages = []
+
+    def check(page, low, high, depth):
+        node = pager.read(page)
+        assert node.keys == sorted(node.keys)
+        assert len(node.keys) <= tree.max_keys
+        if page != pager.root:
+            assert len(node.keys) >= tree.min_keys
+        for key in node.keys:
+            assert low is None or low <= key
+            assert high is None or key < high
+        if node.leaf:
+            assert len(node.values) == len(node.keys)
+            leaf_depths.add(depth)
+            leaf_pages.append(page)
+            return
+        assert len(node.children) == len(node.keys) + 1
+        bounds = [low] + node.keys + [high]
+        for index, child in enumerate(node.children):
+            check(child, bounds[index], bounds[index + 1], depth + 1)
+
+    check(pager.root, None, None, 0)
+    assert len(leaf_depths) == 1
+    # Leaves are linked in the same order a depth-first walk visits them
+    for page, next_page in zip(leaf_pages, leaf_pages[1:] + [None]):
+        assert pager.read(page).next == next_page
+    keys = tree.keys()
+    assert keys == sorted(keys)
+    assert len(keys) == tree.size
+
+
+class BTreeTest(unittest.TestCase):
+
+    def test_init(self):
+        tree = BTree()
+        assert tree.size == 0
+        assert tree.is_empty() is True
+        assert tree.height() == -1
+        assert tree.keys() == []
+        with self.assertRaises(ValueError):
+            BTree(order=2)
+
+    def test_init_with_items(self):
+        tree = BTree([(3, 'C'), (1, 'A'), (2, 'B')])
+        assert tree.size == 3
+        assert len(tree) == 3
+        assert tree.items() == [(1, 'A'), (2, 'B'), (3, 'C')]
+        assert list(tree) == [1, 2, 3]
+
+    def test_insert_and_search(self):
+        tree = BTree(order=3)
+        for key in range(100):
+            tree.insert(key, key * 10)
+            check_invariants(tree)
+        for key in range(100):
+            assert tree.contains(key) is True
+            assert tree.search(key) == key * 10
+        assert tree.contains(100) is False
+        assert tree.search(-1) is None
+        tree.insert(50, 'fifty')  # Update value
+        assert tree.search(50) == 'fifty'
+        assert tree.size == 100
+
+    def test_height(self):
+        tree = BTree(order=4)
+        tree.insert(1)
+        assert tree.height() == 0
+        for key in range(2, 5):
+            tree.insert(key)
+        assert tree.height() == 1
+        # A wide tree holds many keys in few levels
+        tree = BTree((key, None) for key in range(10000))
+        assert tree.height() <= 3
+        check_invariants(tree)
+
+    def test_range(self):
+        tree = BTree(((key, str(key)) for key in range(0, 100, 2)), order=4)
+        assert list(tree.range(10, 16)) == [(10, '10'), (12, '12'),
+                                            (14, '14'), (16, '16')]
+        assert list(tree.range(9, 15)) == [(10, '10'), (12, '12'),
+                                           (14, '14')]
+        assert [key for key, _ in tree.range(high=6)] == [0, 2, 4, 6]
+        assert [key for key, _ in tree.range(low=93)] == [94, 96, 98]
+        assert list(tree.range(200, 300)) == []
+        assert list(tree.range(11, 11)) == []
+        assert len(list(tree.range())) == 50
+
+    def test_delete(self):
+        tree = BTree(order=4)
+        for key in range(50):
+            tree.insert(key)
+        for key in range(0, 50, 3):
+            tree.delete(key)
+            check_invariants(tree)
+        assert tree.keys() == [key for key in range(50) if key % 3 != 0]
+        with self.assertRaises(ValueError):
+            tree.delete(0)  # Already deleted
+        for key in tree.keys():
+            tree.delete(key)
+            check_invariants(tree)
+        assert tree.is_empty() is True
+        with self.assertRaises(ValueError):
+            tree.delete(1)
+        tree.insert(7, 'seven')
+        assert tree.items() == [(7, 'seven')]
+
+    def test_random_operations(self):
+        random.seed(25)
+        for order in (3, 4, 5, 8):
+            tree = BTree(order=order)
+            expected = {}
+            for _ in range(1000):
+                key = random.randrange(200)
+                if key in expected and random.random() < 0.5:
+                    tree.delete(key)
+                    del expected[key]
+                else:
+                    tree.insert(key, -key)
+                    expected[key] = -key
+            check_invariants(tree)
+            assert tree.items() == sorted(expected.items())
+
+
+class BTreeFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'index')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_reopen(self):
+        with BTree(order=16, path=self.path, mode='n') as tree:
+            for key in range(1000):
+                tree.insert(key, 'value {}'.format(key))
+            check_invariants(tree)
+        with BTree(path=self.path, mode='r') as tree:
+            assert tree.order == 16  # The order it was created with
+            assert tree.size == 1000
+            assert tree.search(123) == 'value 123'
+            assert [key for key, _ in tree.range(10, 13)] == [10, 11, 12, 13]
+            check_invariants(tree)
+            with self.assertRaises(ValueError):
+                tree.insert(1000)  # Read only
+            assert tree.size == 1000
+
+    def test_small_cache(self):
+        # Most node reads miss the cache and come from the file
+        with BTree(order=8, path=self.path, cache_size=4) as tree:
+            keys = list(range(500))
+            random.seed(7)
+            random.shuffle(keys)
+            for key in keys:
+                tree.insert(key, key)
+            for key in keys[:250]:
+                tree.delete(key)
+            check_invariants(tree)
+        with BTree(path=self.path) as tree:
+            assert tree.keys() == sorted(keys[250:])
+
+    def test_reuses_free_pages(self):
+        with BTree(order=4, path=self.path, mode='n') as tree:
+            for key in range(200):
+                tree.insert(key)
+            page_count = tree.pager.page_count
+            for key in range(200):
+                tree.delete(key)
+            assert tree.is_empty() is True
+            for key in range(200):
+                tree.insert(key)
+            assert tree.pager.page_count == page_count
+            check_invariants(tree)
+
+    def test_entry_too_large_for_page(self):
+        with BTree(order=4, path=self.path, page_size=128) as tree:
+            for key in range(10):
+                tree.insert(key, 'small')
+            with self.assertRaises(ValueError):
+                tree.insert(10, 'x' * 200)
+            with self.assertRaises(ValueError):
+                tree.insert(5, 'x' * 200)  # Would update an existing key
+            # The rejected entries changed nothing
+            assert tree.size == 10
+            assert tree.contains(10) is False
+            assert tree.search(5) == 'small'
+            assert tree.keys() == list(range(10))
+            check_invariants(tree)
+        with BTree(path=self.path) as tree:
+            assert tree.keys() == list(range(10))
+        # A page too small for a full node of ints is rejected up front
+        with self.assertRaises(ValueError):
+            BTree(order=64, path=self.path, mode='n', page_size=512)
+
+    def test_long_keys_at_default_order(self):
+        with BTree(path=self.path) as tree:
+            tree.insert(b'short', 1)
+            with self.assertRaises(ValueError):
+                tree.insert(b'k' * 100, 2)
+            assert len(tree) == 1
+            assert tree.contains(b'k' * 100) is False
+        # A larger page holds longer keys at the same order
+        with BTree(path=self.path, mode='n', page_size=16384) as tree:
+            for number in range(200):
+                tree.insert(b'k' * 100 + str(number).encode('ascii'), number)
+            check_invariants(tree)
+
+    def test_key_and_value_types(self):
+        items = [(-2 ** 63, None), (-1.5, True), (0, False), (1, 2.5),
+                 (2 ** 63 - 1, b'bytes'), (3, u'text \u00e9')]
+        with BTree(items, path=self.path) as tree:
+            with self.assertRaises(TypeError):
+                tree.insert((1, 2), 'tuple key')
+            with self.assertRaises(TypeError):
+                tree.insert(4, ['list value'])
+            with self.assertRaises(ValueError):
+                tree.insert(2 ** 64, 'too large')
+            assert tree.size == len(items)
+        with BTree(path=self.path, mode='r') as tree:
+            assert tree.items() == sorted(items)
+            assert tree.search(-1.5) is True
+        # Columns of only ints or only None are packed together
+        with BTree(((key, None) for key in range(50)), order=4,
+                   path=self.path, mode='n', cache_size=1):
+            pass
+        with BTree(path=self.path, mode='r', cache_size=1) as tree:
+            assert tree.items() == [(key, None) for key in range(50)]
+
+    def test_reopen_without_close(self):
+        tree = BTree(order=4, path=self.path)
+        for key in range(100):
+            tree.insert(key, key)
+        tree.delete(50)
+        # The header is written after every change, not only on close
+        with BTree(path=self.path, mode='r') as reader:
+            assert reader.size == 99
+            assert reader.keys() == [key for key in range(100) if key != 50]
+        tree.close()
+
+    def test_read_only(self):
+        with BTree(((key, key) for key in range(10)), path=self.path):
+            pass
+        with BTree(path=self.path, mode='r') as tree:
+            with self.assertRaises(ValueError):
+                tree.delete(5)
+            assert tree.contains(5) is True
+            assert tree.size == 10
+
+    def test_corrupt_page(self):
+        with BTree(((key, key) for key in range(10)), order=4,
+                   path=self.path) as tree:
+            page_size = tree.pager.page_size
+            root = tree.pager.root
+        with open(self.path, 'r+b') as file:
+            file.seek(root * page_size + 11)
+            file.write(b'\xff' * 16)  # Not a valid type tag
+        with BTree(path=self.path, mode='r') as tree:
+            with self.assertRaises(ValueError):
+                tree.search(1)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a b-tree' * 10)
+        with self.assertRaises(ValueError):
+            BTree(path=self.path)
+        with self.assertRaises(ValueError):
+            BTree(path=self.path, mode='x')
+
+
+if __name__ == '__main__':
+    unittest.main()
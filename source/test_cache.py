@@ -0,0 +1,234 @@
+#!python
+
+from cache import Cache, LFUCache, memoize
+import unittest
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheTest(unittest.TestCase):
+
+    def test_init(self):
+        cache = Cache()
+        assert cache.length() == 0
+        assert len(cache) == 0
+        assert cache.stats()['hits'] == 0
+
+    def test_set_and_get(self):
+        cache = Cache()
+        cache.set('A', 1)
+        cache.set('B', 2)
+        assert cache.get('A') == 1
+        assert cache.get('B') == 2
+        cache.set('A', 10)  # Update value
+        assert cache.get('A') == 10
+        assert cache.length() == 2
+        with self.assertRaises(KeyError):
+            cache.get('C')  # Key does not exist
+        assert cache.get('C', 0) == 0
+        assert cache.misses == 2
+
+    def test_hits_and_misses(self):
+        cache = Cache()
+        cache.set('A', 1)
+        cache.get('A')
+        cache.get('A')
+        with self.assertRaises(KeyError):
+            cache.get('B')
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.contains('A') is True  # Does not count as a hit
+        assert cache.hits == 2
+
+    def test_evicts_least_recently_used(self):
+        cache = Cache(max_entries=3)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.set('C', 3)
+        cache.get('A')  # B is now the least recently used
+        cache.set('D', 4)
+        assert cache.contains('B') is False
+        assert cache.contains('A') is True
+        assert cache.contains('C') is True
+        assert cache.contains('D') is True
+        assert cache.length() == 3
+        assert cache.evictions == 1
+
+    def test_max_bytes(self):
+        cache = Cache(max_bytes=10, sizeof=len)
+        cache.set('A', 'aaaa')
+        cache.set('B', 'bbbb')
+        assert cache.bytes == 8
+        cache.set('C', 'cccc')  # Evicts A to fit
+        assert cache.contains('A') is False
+        assert cache.bytes == 8
+        cache.set('D', 'd' * 11)  # Too large to cache at all
+        assert cache.contains('D') is False
+        assert cache.contains('B') is True
+        cache.delete('B')
+        assert cache.bytes == 4
+        cache.set('C', 'cc')  # Update to a smaller value
+        assert cache.bytes == 2
+        cache.set('E', 'eeee')
+        cache.set('C', 'c' * 7)  # Evicts E, not C itself, to fit
+        assert cache.contains('E') is False
+        assert cache.get('C') == 'c' * 7
+        assert cache.bytes == 7
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = Cache(ttl=10, clock=clock)
+        cache.set('A', 1)
+        cache.set('B', 2, ttl=100)
+        clock.now = 9
+        assert cache.get('A') == 1
+        clock.now = 10
+        with self.assertRaises(KeyError):
+            cache.get('A')  # Expired
+        assert cache.get('B') == 2
+        assert cache.expirations == 1
+        assert cache.misses == 1
+        assert cache.length() == 1
+
+    def test_expire(self):
+        clock = FakeClock()
+        cache = Cache(ttl=5, clock=clock)
+        for key in 'ABC':
+            cache.set(key, key)
+        cache.set('D', 'D', ttl=50)
+        clock.now = 5
+        cache.expire()
+        assert cache.length() == 1
+        assert cache.expirations == 3
+
+    def test_delete_and_clear(self):
+        cache = Cache()
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.delete('A')
+        assert cache.contains('A') is False
+        with self.assertRaises(KeyError):
+            cache.delete('A')  # Key no longer exists
+        cache.clear()
+        assert cache.length() == 0
+
+
+class LFUCacheTest(unittest.TestCase):
+
+    def test_evicts_least_frequently_used(self):
+        cache = LFUCache(max_entries=3)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.set('C', 3)
+        cache.get('A')
+        cache.get('A')
+        cache.get('B')
+        cache.get('C')
+        cache.get('C')
+        cache.set('D', 4)  # B was used least often
+        assert cache.contains('B') is False
+        cache.set('E', 5)  # D was used least often
+        assert cache.contains('D') is False
+        assert cache.get('A') == 1
+        assert cache.get('C') == 3
+        assert cache.get('E') == 5
+
+    def test_update_keeps_use_count(self):
+        cache = LFUCache(max_entries=2)
+        cache.set('A', 1)
+        cache.get('A')
+        cache.get('A')
+        cache.set('A', 10)  # Rewriting a hot key does not reset its count
+        cache.set('B', 2)
+        cache.get('B')
+        cache.set('C', 3)  # B was used less often than A
+        assert cache.contains('B') is False
+        assert cache.get('A') == 10
+        assert cache.get('C') == 3
+
+    def test_ties_evict_least_recently_used(self):
+        cache = LFUCache(max_entries=2)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.set('C', 3)  # A and B were never used, and A is older
+        assert cache.contains('A') is False
+        assert cache.contains('B') is True
+        assert cache.contains('C') is True
+
+    def test_evicts_after_delete(self):
+        cache = LFUCache(max_entries=2)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.get('B')
+        cache.get('B')
+        cache.delete('A')  # Removes the only entry used once
+        cache.set('C', 3)
+        cache.get('C')
+        cache.set('D', 4)  # C was used less often than B
+        assert cache.contains('C') is False
+        assert cache.get('B') == 2
+        assert cache.get('D') == 4
+
+
+class MemoizeTest(unittest.TestCase):
+
+    def test_memoize(self):
+        calls = []
+
+        @memoize(max_entries=2)
+        def square(n):
+            calls.append(n)
+            return n * n
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        assert square.cache.hits == 1
+        assert square(4) == 16
+        assert square(5) == 25  # Evicts 3
+        assert square(3) == 9
+        assert calls == [3, 4, 5, 3]
+        assert square.cache.misses == 4
+
+    def test_memoize_with_keyword_arguments(self):
+        @memoize()
+        def power(base, exponent=2):
+            return base ** exponent
+
+        assert power(2) == 4
+        assert power(2, exponent=3) == 8
+        assert power(2, exponent=3) == 8
+        assert power.cache.length() == 2
+        assert power.__name__ == 'power'
+
+    def test_memoize_keeps_keyword_arguments_apart(self):
+        @memoize()
+        def arguments(*args, **kwargs):
+            return args, kwargs
+
+        assert arguments(1, a=2) == ((1,), {'a': 2})
+        # Same items as the call above, but all positional
+        assert arguments((1,), (('a', 2),)) == (((1,), (('a', 2),)), {})
+        assert arguments.cache.length() == 2
+
+    def test_memoize_with_cache(self):
+        cache = LFUCache(max_entries=10)
+
+        @memoize(cache)
+        def double(n):
+            return 2 * n
+
+        assert double(21) == 42
+        assert double.cache is cache
+        assert cache.contains((21,)) is True
+
+
+if __name__ == '__main__':
+    unittest.main()
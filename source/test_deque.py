@@ -0,0 +1,72 @@
+#!python
+
+from deque import BlockDeque
+import random
+import unittest
+
+
+class TestBlockDeque(unittest.TestCase):
+
+    def test_init(self):
+        d = BlockDeque()
+        assert d.length() == 0
+        assert d.is_empty() is True
+        assert d.first() is None
+        assert d.last() is None
+        assert d.items() == []
+
+    def test_init_with_list(self):
+        d = BlockDeque(['A', 'B', 'C'])
+        assert d.first() == 'A'
+        assert d.last() == 'C'
+        assert len(d) == 3
+        assert d.items() == ['A', 'B', 'C']
+
+    def test_append_and_pop_head_across_blocks(self):
+        d = BlockDeque()
+        items = list(range(5 * d.block_length + 3))
+        for item in items:
+            d.append(item)
+        assert d.items() == items
+        assert [d.pop_head() for _ in items] == items
+        assert d.is_empty() is True
+        assert d.left_block is d.right_block  # Empty blocks were freed
+        with self.assertRaises(ValueError):
+            d.pop_head()
+
+    def test_prepend_and_pop_tail_across_blocks(self):
+        d = BlockDeque()
+        items = list(range(5 * d.block_length + 3))
+        for item in items:
+            d.prepend(item)
+        assert d.items() == items[::-1]
+        assert [d.pop_tail() for _ in items] == items
+        assert d.left_block is d.right_block
+        with self.assertRaises(ValueError):
+            d.pop_tail()
+
+    def test_random_operations(self):
+        d = BlockDeque()
+        expected = []
+        for _ in range(3000):
+            choice = random.randint(0, 3)
+            item = random.randint(0, 100)
+            if choice == 0:
+                d.append(item)
+                expected.append(item)
+            elif choice == 1:
+                d.prepend(item)
+                expected.insert(0, item)
+            elif choice == 2 and expected:
+                assert d.pop_head() == expected.pop(0)
+            elif choice == 3 and expected:
+                assert d.pop_tail() == expected.pop()
+            assert d.length() == len(expected)
+            if expected:
+                assert d.first() == expected[0]
+                assert d.last() == expected[-1]
+        assert d.items() == expected
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!python
+
+import diskhashtable
+from diskhashtable import DiskHashTable
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+
+class DiskHashTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'table')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_set_and_get(self):
+        with diskhashtable.open(self.path, 'n') as ht:
+            ht.set(b'I', b'1')
+            ht.set(b'V', b'5')
+            assert ht.get(b'I') == b'1'
+            assert ht.get(b'V') == b'5'
+            ht.set(b'I', b'one')  # Update value
+            assert ht.get(b'I') == b'one'
+            assert ht.length() == 2
+            assert ht.contains(b'X') is False
+            with self.assertRaises(KeyError):
+                ht.get(b'X')
+            with self.assertRaises(TypeError):
+                ht.set(u'not bytes', b'')
+
+    def test_invalid_max_load_factor(self):
+        with self.assertRaises(ValueError):
+            DiskHashTable(self.path, 'n', max_load_factor=1.0)
+        with self.assertRaises(ValueError):
+            DiskHashTable(self.path, 'n', max_load_factor=0)
+        assert os.path.exists(self.path) is False  # Rejected before creating
+
+    def test_long_keys_and_values_overflow(self):
+        key = b'k' * 100
+        value = b'v' * 5000
+        with diskhashtable.open(self.path, 'n') as ht:
+            ht.set(key, value)
+            ht.set(b'short', value)
+            ht.set(key, b'now short')
+            assert ht.get(key) == b'now short'
+            assert ht.get(b'short') == value
+        assert os.path.getsize(self.path + '.overflow') >= 2 * len(value)
+
+    def test_delete(self):
+        with diskhashtable.open(self.path, 'n') as ht:
+            ht.set(b'I', b'1')
+            ht.set(b'V', b'5')
+            ht.delete(b'I')
+            assert ht.contains(b'I') is False
+            assert ht.length() == 1
+            with self.assertRaises(KeyError):
+                ht.delete(b'I')
+
+    def test_reopen(self):
+        with diskhashtable.open(self.path, 'c') as ht:
+            ht.set(b'I', b'1')
+            ht.set(b'L' * 50, b'50')
+        with diskhashtable.open(self.path, 'r') as ht:
+            assert ht.length() == 2
+            assert sorted(ht.items()) == [(b'I', b'1'), (b'L' * 50, b'50')]
+            with self.assertRaises(ValueError):
+                ht.set(b'X', b'10')  # Open for reading only
+        with diskhashtable.open(self.path, 'n') as ht:
+            assert ht.length() == 0
+        with self.assertRaises(IOError):
+            diskhashtable.open(self.path + '2', 'w')
+
+    def test_resize(self):
+        with DiskHashTable(self.path, 'n', init_size=8) as ht:
+            expected = {}
+            for number in range(500):
+                key = str(number).encode('ascii')
+                value = key * random.randint(1, 20)
+                ht.set(key, value)
+                expected[key] = value
+            for key in random.sample(sorted(expected), 100):
+                ht.delete(key)
+                del expected[key]
+            assert ht.capacity >= 512
+            assert ht.load_factor() <= 0.75
+            assert ht.length() == len(expected)
+        with DiskHashTable(self.path, 'w') as ht:
+            assert sorted(ht.iter_items()) == sorted(expected.items())
+            assert sorted(ht) == sorted(expected)
+
+    def test_churn_does_not_grow(self):
+        with DiskHashTable(self.path, 'n', init_size=8) as ht:
+            ht.set(b'kept', b'value')
+            for number in range(5000):
+                key = str(number).encode('ascii')
+                ht.set(key, key)
+                ht.delete(key)
+            # Rebuilds reclaim tombstones instead of doubling the capacity
+            assert ht.capacity == 8
+            assert ht.length() == 1
+            assert ht.get(b'kept') == b'value'
+        assert os.path.getsize(self.path) <= 64 + 8 * 64
+
+    def test_recover_after_crash(self):
+        ht = DiskHashTable(self.path, 'n')
+        ht.set(b'I', b'1')
+        ht.set(b'V', b'5')
+        # Simulate a crash between writing a key's new slot and deleting its
+        # old slot by restoring the old slot's state byte, then not closing
+        old_index = ht._find(b'I', diskhashtable._hash(b'I'))[0]
+        ht.set(b'I', b'one')
+        ht._commit(diskhashtable._HEADER_SIZE +
+                   old_index * diskhashtable._SLOT_SIZE, diskhashtable._INLINE)
+        ht.map.flush()
+        with self.assertRaises(ValueError):
+            DiskHashTable(self.path, 'r')  # Dirty, so recover first
+        with DiskHashTable(self.path, 'w') as recovered:
+            assert recovered.length() == 2
+            assert recovered.get(b'I') == b'one'
+            assert sorted(recovered.keys()) == [b'I', b'V']
+        ht._unmap()
+        ht.overflow.close()
+
+    def test_recover_cluster_that_wraps_around(self):
+        # Find two keys whose probe sequences both start at the last slot
+        keys = [key for key in (str(i).encode() for i in range(1000))
+                if diskhashtable._hash(key) & 7 == 7][:2]
+        ht = DiskHashTable(self.path, 'n', init_size=8)
+        ht.set(keys[0], b'old')  # In the last slot
+        ht.set(keys[1], b'other')  # Wraps around to the first slot
+        # Simulate a crash while updating the first key, whose new slot is
+        # after the wrap around, so its copies are at both ends of the file
+        old_index = ht._find(keys[0], diskhashtable._hash(keys[0]))[0]
+        ht.set(keys[0], b'new')
+        assert old_index == 7
+        assert ht._find(keys[0], diskhashtable._hash(keys[0]))[0] == 1
+        ht._commit(diskhashtable._HEADER_SIZE +
+                   old_index * diskhashtable._SLOT_SIZE, diskhashtable._INLINE)
+        ht.map.flush()
+        with DiskHashTable(self.path, 'w') as recovered:
+            assert recovered.length() == 2
+            assert recovered.used == 3  # Two entries and one tombstone
+            assert recovered.get(keys[0]) == b'new'
+            assert recovered.get(keys[1]) == b'other'
+        ht._unmap()
+        ht.overflow.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
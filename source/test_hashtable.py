@@ -1,6 +1,7 @@
 #!python
 
-from hashtable import HashTable
+from hashtable import HashTable, ProbingHashTable, PersistentHashMap
+import random
 import unittest
 
 
@@ -32,6 +33,39 @@ class HashTableTest(unittest.TestCase):
         ht.set('X', 10)
         assert ht.size == 3
 
+    def test_len(self):
+        ht = HashTable()
+        assert len(ht) == 0
+        ht.set('I', 1)
+        ht.set('V', 5)
+        ht.set('V', 5)  # Update does not change length
+        assert len(ht) == 2
+        ht.delete('I')
+        assert len(ht) == 1
+
+    def test_hash_is_cached(self):
+        hash_calls = []
+
+        class Key(object):
+            def __init__(self, name):
+                self.name = name
+
+            def __eq__(self, other):
+                return self.name == other.name
+
+            def __hash__(self):
+                hash_calls.append(self.name)
+                return hash(self.name)
+
+        ht = HashTable(2)
+        keys = [Key(name) for name in 'ABCDEFGHIJ']
+        for key in keys:
+            ht.set(key, key.name)  # Triggers several resizes
+        # Each key was hashed once when set, never again to rehash it
+        assert len(hash_calls) == len(keys)
+        for key in keys:
+            assert ht.get(key) == key.name
+
     def test_resize(self):
         ht = HashTable(2)  # Set init_size to 2
         assert ht.size == 0
@@ -54,6 +88,93 @@ class HashTableTest(unittest.TestCase):
         assert len(ht.buckets) == 8
         assert ht.load_factor() == 0.5
 
+    def test_resize_is_incremental(self):
+        ht = HashTable(4, rehash_step=1)
+        for i in range(4):
+            ht.set(i, str(i))  # Fourth insertion should trigger resize
+        assert len(ht.buckets) == 8
+        assert ht.is_rehashing() is True
+        # Entries are reachable while old and new buckets coexist
+        for i in range(4):
+            assert ht.get(i) == str(i)
+        assert sorted(ht.keys()) == [0, 1, 2, 3]
+        ht.set(4, '4')  # Each set moves one more old bucket
+        ht.set(1, 'one')
+        ht.set(2, 'two')
+        assert ht.is_rehashing() is True
+        ht.set(3, 'three')
+        assert ht.is_rehashing() is False
+        assert ht.length() == 5
+        assert len(ht.buckets) == 8
+        assert ht.get(0) == '0'
+        assert ht.get(1) == 'one'
+        assert ht.get(3) == 'three'
+        assert ht.get(4) == '4'
+
+    def test_resize_waits_for_rehash_in_progress(self):
+        ht = HashTable(4, rehash_step=1)
+        for i in range(4):
+            ht.set(i, i)  # Starts rehashing 4 old buckets into 8
+        for i in range(4, 7):
+            ht.set(i, i)  # Exceeds the threshold mid-rehash at 7 entries
+            assert ht.is_rehashing() is True
+            assert len(ht.buckets) == 8  # Waits instead of resizing again
+            assert ht._rehash_index == i - 3  # Moved one old bucket per set
+        ht.set(7, 7)  # Moves the last old bucket, then resizes again
+        assert ht.is_rehashing() is True
+        assert len(ht.buckets) == 16
+        assert ht._rehash_index == 0
+        for i in range(8, 100):
+            # Never moves more than one old bucket per set
+            moved = ht._rehash_index
+            old_size = len(ht.buckets)
+            ht.set(i, i)
+            if ht.is_rehashing() and len(ht.buckets) == old_size:
+                assert ht._rehash_index <= moved + 1
+        assert ht.length() == 100
+        for i in range(100):
+            assert ht.get(i) == i
+
+    def test_resize_many_entries(self):
+        ht = HashTable(2)
+        for i in range(1000):
+            ht.set(i, i * i)
+            assert ht.load_factor() <= ht.max_load_factor
+        assert ht.size == 1000
+        assert ht.length() == 1000
+        for i in range(1000):
+            assert ht.get(i) == i * i
+
+    def test_shrink_after_delete(self):
+        ht = HashTable(4)
+        for i in range(100):
+            ht.set(i, i)
+        grown_size = len(ht.buckets)
+        for i in range(95):
+            ht.delete(i)
+            assert ht.contains(i) is False
+        assert len(ht.buckets) < grown_size
+        assert len(ht.buckets) >= 4  # Never shrinks below initial size
+        assert sorted(ht.keys()) == [95, 96, 97, 98, 99]
+        for i in range(95):
+            ht.set(i, i)  # Grows again
+        assert ht.length() == 100
+
+    def test_update(self):
+        ht = HashTable(2)
+        ht.set('I', 1)
+        ht.update([('V', 5), ('X', 10), ('I', 100)])  # Includes an update
+        assert ht.size == 3
+        assert ht.get('I') == 100
+        assert ht.get('V') == 5
+        assert ht.get('X') == 10
+        ht.update((i, i * i) for i in range(1000))
+        assert ht.size == 1003
+        assert ht.is_rehashing() is False
+        assert ht.load_factor() <= ht.max_load_factor
+        for i in range(1000):
+            assert ht.get(i) == i * i
+
     def test_contains(self):
         ht = HashTable()
         ht.set('I', 1)
@@ -76,6 +197,8 @@ class HashTableTest(unittest.TestCase):
         assert ht.size == 3
         with self.assertRaises(KeyError):
             ht.get('A')  # Key does not exist
+        assert ht.get('A', None) is None
+        assert ht.get('I', None) == 1
 
     def test_set_twice_and_get(self):
         ht = HashTable()
@@ -108,6 +231,26 @@ class HashTableTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             ht.delete('A')  # Key does not exist
 
+    def test_delete_walks_bucket_once(self):
+        comparisons = []
+
+        class Key(object):
+            def __hash__(self):
+                return 0  # Every key collides in the same bucket
+
+            def __eq__(self, other):
+                comparisons.append(other)
+                return self is other
+        first, second = Key(), Key()
+        ht = HashTable()
+        ht.set(first, 1)
+        ht.set(second, 2)
+        del comparisons[:]
+        ht.delete(second)  # Compares second with first only once
+        assert len(comparisons) == 1
+        assert ht.contains(first) is True
+        assert ht.contains(second) is False
+
     def test_keys(self):
         ht = HashTable()
         assert ht.keys() == []
@@ -139,5 +282,184 @@ class HashTableTest(unittest.TestCase):
         self.assertItemsEqual(ht.items(), [('I', 1), ('V', 5), ('X', 10)])
 
 
+class ProbingHashTableTest(unittest.TestCase):
+
+    def test_init(self):
+        ht = ProbingHashTable(4)
+        assert ht.capacity() == 8  # Rounded up to the minimum capacity
+        assert ht.length() == 0
+        assert ht.size == 0
+        ht = ProbingHashTable(100)
+        assert ht.capacity() == 128  # Rounded up to a power of two
+        with self.assertRaises(ValueError):
+            ProbingHashTable(max_load_factor=1)  # Probing would never stop
+
+    def test_set_and_get(self):
+        ht = ProbingHashTable()
+        ht.set('I', 1)
+        ht.set('V', 5)
+        ht.set('X', 10)
+        assert ht.get('I') == 1
+        assert ht.get('V') == 5
+        assert ht.get('X') == 10
+        assert ht.length() == 3
+        assert ht.size == 3
+        with self.assertRaises(KeyError):
+            ht.get('A')  # Key does not exist
+        assert ht.get('A', None) is None
+        assert ht.get('I', None) == 1
+
+    def test_set_twice_and_get(self):
+        ht = ProbingHashTable()
+        ht.set('I', 1)
+        ht.set('V', 4)
+        ht.set('V', 5)  # Update value
+        assert ht.get('V') == 5
+        assert ht.size == 2  # Check size is not overcounting
+
+    def test_contains(self):
+        ht = ProbingHashTable()
+        ht.set('I', 1)
+        ht.set('V', 5)
+        assert ht.contains('I') is True
+        assert ht.contains('V') is True
+        assert ht.contains('A') is False
+
+    def test_delete(self):
+        ht = ProbingHashTable()
+        ht.set('I', 1)
+        ht.set('V', 5)
+        ht.set('X', 10)
+        ht.delete('I')
+        ht.delete('X')
+        assert ht.size == 1
+        assert ht.contains('I') is False
+        assert ht.get('V') == 5
+        with self.assertRaises(KeyError):
+            ht.delete('X')  # Key no longer exists
+        with self.assertRaises(KeyError):
+            ht.delete('A')  # Key does not exist
+
+    def test_colliding_keys_across_tombstones(self):
+        ht = ProbingHashTable(8)
+        # Integers hash to themselves, so these all probe from slot 0
+        for key in [0, 8, 16, 24]:
+            ht.set(key, str(key))
+        ht.delete(8)  # Leave a tombstone in the middle of the probe sequence
+        assert ht.get(16) == '16'
+        assert ht.get(24) == '24'
+        assert ht.contains(8) is False
+        ht.set(32, '32')  # Reuses the tombstone slot
+        assert ht.get(32) == '32'
+        assert ht.size == 4
+
+    def test_resize(self):
+        ht = ProbingHashTable(8)
+        for i in range(100):
+            ht.set(i, i * i)
+        assert ht.size == 100
+        assert ht.load_factor() <= ht.max_load_factor
+        for i in range(100):
+            assert ht.get(i) == i * i
+        for i in range(0, 100, 2):
+            ht.delete(i)
+        assert ht.size == 50
+        for i in range(100):
+            assert ht.contains(i) is (i % 2 == 1)
+
+    def test_keys_values_items(self):
+        ht = ProbingHashTable()
+        assert ht.keys() == []
+        assert ht.values() == []
+        assert ht.items() == []
+        ht.set('I', 1)
+        ht.set('V', 5)
+        ht.set('X', 10)
+        assert sorted(ht.keys()) == ['I', 'V', 'X']
+        assert sorted(ht.values()) == [1, 5, 10]
+        assert sorted(ht.items()) == [('I', 1), ('V', 5), ('X', 10)]
+
+
+class CollidingKey(object):
+    """A key whose hash is chosen, so tests can force hash collisions"""
+
+    def __init__(self, name, key_hash):
+        self.name = name
+        self.key_hash = key_hash
+
+    def __hash__(self):
+        return self.key_hash
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class PersistentHashMapTest(unittest.TestCase):
+
+    def test_init(self):
+        hm = PersistentHashMap([('I', 1), ('V', 5)])
+        assert hm.length() == 2
+        assert len(hm) == 2
+        assert hm.get('V') == 5
+        assert PersistentHashMap().length() == 0
+
+    def test_set_returns_new_version(self):
+        empty = PersistentHashMap()
+        one = empty.set('I', 1)
+        two = one.set('V', 5)
+        updated = two.set('I', 10)
+        assert empty.length() == 0
+        assert one.items() == [('I', 1)]
+        assert sorted(two.items()) == [('I', 1), ('V', 5)]
+        assert sorted(updated.items()) == [('I', 10), ('V', 5)]
+        assert updated.length() == 2
+        with self.assertRaises(KeyError):
+            one.get('V')
+
+    def test_delete_returns_new_version(self):
+        hm = PersistentHashMap([('I', 1), ('V', 5), ('X', 10)])
+        deleted = hm.delete('V')
+        assert deleted.contains('V') is False
+        assert hm.contains('V') is True
+        assert deleted.length() == 2
+        with self.assertRaises(KeyError):
+            deleted.delete('V')
+
+    def test_colliding_hashes(self):
+        keys = [CollidingKey(name, 42) for name in 'ABC']
+        keys.append(CollidingKey('D', 42 + (1 << 40)))  # Shares low bits
+        hm = PersistentHashMap((key, key.name) for key in keys)
+        assert hm.length() == 4
+        assert [hm.get(key) for key in keys] == ['A', 'B', 'C', 'D']
+        assert hm.contains(CollidingKey('E', 42)) is False
+        for key in keys:
+            hm = hm.delete(key)
+            assert hm.contains(key) is False
+        assert hm.length() == 0
+        assert hm.root.entries == ()
+
+    def test_random_versions(self):
+        versions = [PersistentHashMap()]
+        dicts = [{}]
+        for _ in range(1000):
+            key = random.randint(0, 300)
+            if key in dicts[-1] and random.random() < 0.4:
+                versions.append(versions[-1].delete(key))
+                dicts.append(dict(dicts[-1]))
+                del dicts[-1][key]
+            else:
+                value = random.random()
+                versions.append(versions[-1].set(key, value))
+                dicts.append(dict(dicts[-1]))
+                dicts[-1][key] = value
+        # Every old version still has exactly its own entries
+        for hm, expected in zip(versions[::50], dicts[::50]):
+            assert hm.length() == len(expected)
+            assert sorted(hm.items()) == sorted(expected.items())
+
+
 if __name__ == '__main__':
     unittest.main()
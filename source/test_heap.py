@@ -1,7 +1,9 @@
 #!python
 
-from heap import MinHeap
+from heap import (MinHeap, PairingHeap, PriorityHeap, nsmallest, nlargest,
+                  merge)
 import random
+import sys
 import unittest
 
 
@@ -79,6 +81,24 @@ class TestMinHeap(unittest.TestCase):
             assert sorted_items[index] == min_item
         assert heap.size() == 0
 
+    def test_init_with_items_heapifies(self):
+        items = [9, 25, 86, 3, 29, 5, 55]
+        heap = MinHeap(items)
+        assert heap.size() == len(items)
+        assert heap.items == [3, 9, 5, 25, 29, 86, 55]
+        assert items == [9, 25, 86, 3, 29, 5, 55]  # Given list is not changed
+        for item in sorted(items):
+            assert heap.remove_min() == item
+
+    def test_init_with_many_random_items(self):
+        items = random.sample(range(1000), 50)
+        heap = MinHeap(items)
+        assert heap.size() == len(items)
+        for index in range(1, heap.size()):
+            parent_index = heap._parent_index(index)
+            assert heap.items[parent_index] <= heap.items[index]
+        assert [heap.remove_min() for _ in items] == sorted(items)
+
     def test_parent_index(self):
         heap = MinHeap()
         with self.assertRaises(IndexError):
@@ -116,5 +136,218 @@ class TestMinHeap(unittest.TestCase):
         assert heap._right_child_index(6) == 14
 
 
+class TestDaryMinHeap(unittest.TestCase):
+
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            MinHeap(arity=1)
+
+    def test_child_and_parent_index(self):
+        heap = MinHeap(arity=4)
+        assert heap._left_child_index(0) == 1
+        assert heap._right_child_index(0) == 4
+        assert heap._left_child_index(1) == 5
+        assert heap._right_child_index(1) == 8
+        for index in range(1, 50):
+            parent_index = heap._parent_index(index)
+            assert (heap._left_child_index(parent_index) <= index <=
+                    heap._right_child_index(parent_index))
+
+    def test_insert_and_remove_many_random_items(self):
+        for arity in [3, 4, 8]:
+            heap = MinHeap(arity=arity)
+            items = random.sample(range(1000), 100)
+            for item in items:
+                heap.insert(item)
+            for index in range(1, heap.size()):
+                parent_index = heap._parent_index(index)
+                assert heap.items[parent_index] <= heap.items[index]
+            assert [heap.remove_min() for _ in items] == sorted(items)
+
+    def test_heapify(self):
+        items = random.sample(range(1000), 100)
+        heap = MinHeap(items, arity=4)
+        assert [heap.remove_min() for _ in items] == sorted(items)
+
+
+class TestKeyedMinHeap(unittest.TestCase):
+
+    def test_reverse(self):
+        items = random.sample(range(1000), 100)
+        heap = MinHeap(items[:50], reverse=True)
+        for item in items[50:]:
+            heap.insert(item)
+        assert heap.keys is None  # No keys are cached without a key function
+        assert heap.get_min() == max(items)
+        assert heap.pop_many(100) == sorted(items, reverse=True)
+
+    def test_key(self):
+        records = [{'name': name, 'age': age} for name, age in
+                   [('C', 30), ('A', 10), ('D', 40), ('B', 20)]]
+        heap = MinHeap(records[:2], key=lambda record: record['age'])
+        heap.insert_many(records[2:])
+        assert len(heap.keys) == len(heap.items) == 4
+        assert heap.replace_min({'name': 'E', 'age': 25})['name'] == 'A'
+        assert [heap.remove_min()['name'] for _ in range(4)] == ['B', 'E',
+                                                                 'C', 'D']
+        assert heap.keys == []
+
+    def test_key_and_reverse_with_arity(self):
+        words = ['pear', 'fig', 'banana', 'kiwi', 'apple', 'cherry', 'date']
+        heap = MinHeap(words, arity=3, key=len, reverse=True)
+        for index, word in enumerate(heap.items):
+            assert heap.keys[index] == len(word)
+        result = [len(heap.remove_min()) for _ in words]
+        assert result == sorted(map(len, words), reverse=True)
+
+
+class TestTypedMinHeap(unittest.TestCase):
+
+    def test_insert_and_remove_min(self):
+        items = random.sample(range(1000), 100)
+        heap = MinHeap(items[:50], typecode='i')
+        for item in items[50:80]:
+            heap.insert(item)
+        heap.insert_many(items[80:])
+        assert heap.items.typecode == 'i'
+        assert heap.pop_many(10) == sorted(items)[:10]
+        assert [heap.remove_min() for _ in range(90)] == sorted(items)[10:]
+
+    def test_reverse(self):
+        heap = MinHeap([0.5, 2.5, 1.5], reverse=True, typecode='d')
+        assert [heap.remove_min() for _ in range(3)] == [2.5, 1.5, 0.5]
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'arrays need Python 3 views')
+    def test_buffer(self):
+        heap = MinHeap([3, 1, 2], typecode='i')
+        assert sorted(heap.buffer().tolist()) == [1, 2, 3]
+        assert heap.buffer()[0] == 1
+        with self.assertRaises(TypeError):
+            MinHeap().buffer()
+
+
+class TestBatchOperations(unittest.TestCase):
+
+    def test_insert_many(self):
+        # Few new items are bubbled up, many new items are heapified
+        for existing, new in [(100, 10), (10, 100), (0, 5)]:
+            heap = MinHeap(random.sample(range(1000), existing))
+            items = heap.items[:] + [random.randint(0, 1000) for _ in
+                                     range(new)]
+            heap.insert_many(items[existing:])
+            assert heap.size() == existing + new
+            assert [heap.remove_min() for _ in items] == sorted(items)
+
+    def test_pop_many(self):
+        items = random.sample(range(1000), 50)
+        heap = MinHeap(items)
+        assert heap.pop_many(10) == sorted(items)[:10]
+        assert heap.size() == 40
+        assert heap.pop_many(100) == sorted(items)[10:]
+        assert heap.is_empty() is True
+        assert heap.pop_many(5) == []
+
+    def test_nsmallest_and_nlargest(self):
+        items = [random.randint(0, 100) for _ in range(500)]
+        for count in [0, 1, 10, 500, 600]:
+            assert nsmallest(count, iter(items)) == sorted(items)[:count]
+            assert nlargest(count, iter(items)) == sorted(items,
+                                                          reverse=True)[:count]
+        assert nsmallest(3, []) == []
+        assert nlargest(3, 'hello') == ['o', 'l', 'l']
+
+
+class TestMerge(unittest.TestCase):
+
+    def test_merge_sorted_iterables(self):
+        streams = [sorted(random.randint(0, 100) for _ in range(size))
+                   for size in [0, 1, 50, 200, 7]]
+        merged = merge(iter(stream) for stream in streams)
+        assert list(merged) == sorted(sum(streams, []))
+
+    def test_merge_is_lazy(self):
+        def naturals(start):
+            while True:
+                yield start
+                start += 2
+        merged = merge([naturals(0), naturals(1)])
+        assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+
+    def test_merge_with_key_is_stable(self):
+        first = [('a', 1), ('b', 2), ('c', 2)]
+        second = [('d', 0), ('e', 2)]
+        merged = merge([first, second], key=lambda pair: pair[1])
+        assert [name for name, _ in merged] == ['d', 'a', 'b', 'c', 'e']
+
+    def test_merge_unique(self):
+        merged = merge([[1, 2, 2, 5], [2, 3, 5, 5], [None]],
+                       key=lambda item: -1 if item is None else item,
+                       unique=True)
+        assert list(merged) == [None, 1, 2, 3, 5]
+        merged = merge([['A', 'b'], ['a', 'B', 'c']], key=str.lower,
+                       unique=True)
+        assert list(merged) == ['A', 'b', 'c']
+
+
+class TestPairingHeap(unittest.TestCase):
+
+    def test_empty_heap(self):
+        heap = PairingHeap()
+        assert heap.is_empty() is True
+        assert heap.size() == 0
+        with self.assertRaises(ValueError):
+            heap.get_min()
+        with self.assertRaises(ValueError):
+            heap.remove_min()
+
+    def test_insert_and_remove_many_random_items(self):
+        items = [random.randint(0, 100) for _ in range(300)]
+        heap = PairingHeap(items)
+        assert heap.size() == len(items)
+        assert heap.get_min() == min(items)
+        assert [heap.remove_min() for _ in items] == sorted(items)
+        assert heap.is_empty() is True
+
+    def test_replace_min(self):
+        heap = PairingHeap([5, 3, 8])
+        assert heap.replace_min(1) == 3
+        assert heap.replace_min(9) == 1
+        assert [heap.remove_min() for _ in range(3)] == [5, 8, 9]
+
+    def test_meld(self):
+        heap = PairingHeap([4, 8, 2])
+        other = PairingHeap([7, 1, 5])
+        heap.meld(other)
+        assert other.is_empty() is True
+        assert heap.size() == 6
+        assert [heap.remove_min() for _ in range(6)] == [1, 2, 4, 5, 7, 8]
+
+
+class TestPriorityHeap(unittest.TestCase):
+
+    def test_insert_and_remove_min(self):
+        heap = PriorityHeap()
+        heap.insert('C', 3)
+        heap.insert('A', 1)
+        heap.insert('B', 2)
+        assert heap.size() == 3
+        assert heap.get_min() == 'A'
+        assert heap.get_min_priority() == 1
+        assert [heap.remove_min() for _ in range(3)] == ['A', 'B', 'C']
+        assert heap.is_empty() is True
+        with self.assertRaises(ValueError):
+            heap.remove_min()
+
+    def test_equal_priorities_are_first_in_first_out(self):
+        heap = PriorityHeap()
+        for index in range(20):
+            heap.insert(index, index % 2)
+        evens = [heap.remove_min() for _ in range(10)]
+        assert evens == list(range(0, 20, 2))
+        assert heap.replace_min(20, 1) == 1
+        odds = [heap.remove_min() for _ in range(10)]
+        assert odds == list(range(3, 20, 2)) + [20]
+
+
 if __name__ == '__main__':
     unittest.main()
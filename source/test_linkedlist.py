@@ -1,6 +1,6 @@
 #!python
 
-from linkedlist import LinkedList, Node
+from linkedlist import LinkedList, Node, DoublyLinkedList
 import unittest
 
 
@@ -12,6 +12,10 @@ class NodeTest(unittest.TestCase):
         assert node.data is data
         assert node.next is None
 
+    def test_slots(self):
+        node = Node('ABC')
+        assert not hasattr(node, '__dict__')  # No per-instance dictionary
+
 
 class LinkedListTest(unittest.TestCase):
 
@@ -57,6 +61,18 @@ class LinkedListTest(unittest.TestCase):
         ll.append('C')
         assert ll.size == 3
 
+    def test_size_after_prepend_and_delete(self):
+        ll = LinkedList(['B', 'C'])
+        ll.prepend('A')
+        assert ll.size == 3
+        assert len(ll) == 3
+        ll.delete('B')
+        assert ll.size == 2
+        assert ll.length() == 2
+        with self.assertRaises(ValueError):
+            ll.delete('D')
+        assert ll.size == 2  # Failed delete does not change size
+
     def test_get_at_index(self):
         ll = LinkedList(['A', 'B', 'C'])
         assert ll.get_at_index(0) == 'A'
@@ -84,6 +100,77 @@ class LinkedListTest(unittest.TestCase):
             ll.insert_at_index(4, 'D')
             ll.insert_at_index(-1, 'E')
 
+    def test_get_at_index_sequentially(self):
+        ll = LinkedList(range(100))
+        for index in range(100):
+            assert ll.get_at_index(index) == index
+        for index in range(99, -1, -1):
+            assert ll.get_at_index(index) == index
+
+    def test_insert_at_index_in_middle(self):
+        ll = LinkedList(['A', 'C', 'E'])
+        ll.insert_at_index(1, 'B')
+        ll.insert_at_index(3, 'D')
+        assert ll.items() == ['A', 'B', 'C', 'D', 'E']
+        assert ll.tail.data == 'E'
+        assert ll.size == 5
+        for index, item in enumerate('ABCDE'):
+            assert ll.get_at_index(index) == item
+
+    def test_delete_at_index(self):
+        ll = LinkedList(['A', 'B', 'C', 'D'])
+        assert ll.delete_at_index(1) == 'B'
+        assert ll.items() == ['A', 'C', 'D']
+        assert ll.delete_at_index(2) == 'D'
+        assert ll.tail.data == 'C'
+        assert ll.delete_at_index(0) == 'A'
+        assert ll.head.data == 'C'
+        assert ll.size == 1
+        with self.assertRaises(ValueError):
+            ll.delete_at_index(1)
+        assert ll.delete_at_index(0) == 'C'
+        assert ll.head is None
+        assert ll.tail is None
+
+    def test_delete_after(self):
+        ll = LinkedList(['A', 'B', 'C'])
+        assert ll.delete_after(ll.head) == 'B'
+        assert ll.items() == ['A', 'C']
+        assert ll.delete_after(ll.head) == 'C'
+        assert ll.tail is ll.head
+        with self.assertRaises(ValueError):
+            ll.delete_after(ll.tail)
+        assert ll.delete_after(None) == 'A'
+        assert ll.is_empty() is True
+        assert ll.tail is None
+
+    def test_pop_head_and_pop_tail(self):
+        ll = LinkedList(['A', 'B', 'C'])
+        assert ll.pop_head() == 'A'
+        assert ll.pop_tail() == 'C'
+        assert ll.size == 1
+        assert ll.head is ll.tail
+        assert ll.pop_tail() == 'B'
+        assert ll.is_empty() is True
+        with self.assertRaises(ValueError):
+            ll.pop_head()
+        with self.assertRaises(ValueError):
+            ll.pop_tail()
+
+    def test_index_access_after_mutations(self):
+        ll = LinkedList(['B', 'C', 'D'])
+        assert ll.get_at_index(1) == 'C'  # Finger at index 1
+        ll.prepend('A')
+        assert ll.get_at_index(2) == 'C'
+        assert ll.pop_head() == 'A'
+        assert ll.get_at_index(1) == 'C'
+        ll.delete('B')
+        assert ll.get_at_index(0) == 'C'
+        assert ll.get_at_index(1) == 'D'
+        ll.insert_at_index(1, 'X')
+        assert ll.items() == ['C', 'X', 'D']
+        assert ll.get_at_index(2) == 'D'
+
     def test_append(self):
         ll = LinkedList()
         ll.append('A')
@@ -145,5 +232,112 @@ class LinkedListTest(unittest.TestCase):
         assert ll.find(lambda item: item == 'D') is None
 
 
+class DoublyLinkedListTest(unittest.TestCase):
+
+    def test_init(self):
+        ll = DoublyLinkedList()
+        assert ll.head is None
+        assert ll.tail is None
+        assert ll.size == 0
+        assert ll.is_empty() is True
+
+    def test_init_with_list(self):
+        ll = DoublyLinkedList(['A', 'B', 'C'])
+        assert ll.head.data == 'A'
+        assert ll.tail.data == 'C'
+        assert ll.items() == ['A', 'B', 'C']
+        assert ll.size == 3
+        assert len(ll) == 3
+
+    def test_append_and_prepend_return_handles(self):
+        ll = DoublyLinkedList()
+        b = ll.append('B')
+        a = ll.prepend('A')
+        c = ll.append('C')
+        assert (a.data, b.data, c.data) == ('A', 'B', 'C')
+        assert ll.head is a
+        assert ll.tail is c
+        assert a.next is b and b.prev is a
+        assert ll.items() == ['A', 'B', 'C']
+
+    def test_delete_after(self):
+        ll = LinkedList(['A', 'B', 'C'])
+        assert ll.delete_after(ll.head) == 'B'
+        assert ll.items() == ['A', 'C']
+        assert ll.delete_after(ll.head) == 'C'
+        assert ll.tail is ll.head
+        with self.assertRaises(ValueError):
+            ll.delete_after(ll.tail)
+        assert ll.delete_after(None) == 'A'
+        assert ll.is_empty() is True
+        assert ll.tail is None
+
+    def test_pop_head_and_pop_tail(self):
+        ll = DoublyLinkedList(['A', 'B', 'C'])
+        assert ll.pop_tail() == 'C'
+        assert ll.tail.data == 'B'
+        assert ll.pop_head() == 'A'
+        assert ll.head is ll.tail
+        assert ll.pop_tail() == 'B'
+        assert ll.head is None
+        assert ll.tail is None
+        with self.assertRaises(ValueError):
+            ll.pop_tail()
+        with self.assertRaises(ValueError):
+            ll.pop_head()
+
+    def test_remove_node(self):
+        ll = DoublyLinkedList()
+        a = ll.append('A')
+        b = ll.append('B')
+        c = ll.append('C')
+        assert ll.remove_node(b) == 'B'
+        assert ll.items() == ['A', 'C']
+        assert ll.size == 2
+        with self.assertRaises(ValueError):
+            ll.remove_node(b)  # Already removed
+        assert ll.remove_node(c) == 'C'
+        assert ll.tail is a
+        assert ll.remove_node(a) == 'A'
+        assert ll.is_empty() is True
+
+    def test_move_to_front_and_back(self):
+        ll = DoublyLinkedList()
+        a = ll.append('A')
+        b = ll.append('B')
+        c = ll.append('C')
+        ll.move_to_front(c)
+        assert ll.items() == ['C', 'A', 'B']
+        ll.move_to_front(c)  # Already at the front
+        assert ll.items() == ['C', 'A', 'B']
+        ll.move_to_back(c)
+        assert ll.items() == ['A', 'B', 'C']
+        ll.move_to_back(a)
+        assert ll.items() == ['B', 'C', 'A']
+        assert ll.head is b
+        assert ll.tail is a
+        assert ll.size == 3
+
+    def test_insert_before_and_after(self):
+        ll = DoublyLinkedList()
+        b = ll.append('B')
+        d = ll.insert_after(b, 'D')
+        ll.insert_before(b, 'A')
+        ll.insert_before(d, 'C')
+        ll.insert_after(d, 'E')
+        assert ll.items() == ['A', 'B', 'C', 'D', 'E']
+        assert ll.tail.data == 'E'
+        assert ll.size == 5
+
+    def test_delete_and_find(self):
+        ll = DoublyLinkedList(['A', 'B', 'C'])
+        assert ll.find(lambda item: item > 'A') == 'B'
+        ll.delete('B')
+        assert ll.items() == ['A', 'C']
+        assert ll.find(lambda item: item == 'B') is None
+        with self.assertRaises(ValueError):
+            ll.delete('B')
+
+
 if __name__ == '__main__':
     unittest.main()
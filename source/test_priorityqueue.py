@@ -0,0 +1,181 @@
+#!python
+
+from priorityqueue import PriorityQueue, IndexedPriorityQueue
+from heap import MinHeap, PairingHeap
+import random
+import unittest
+
+
+class TestPriorityQueue(unittest.TestCase):
+
+    def test_init(self):
+        pq = PriorityQueue()
+        assert pq.front() is None
+        assert pq.length() == 0
+        assert pq.is_empty() is True
+
+    def test_enqueue_and_dequeue(self):
+        pq = PriorityQueue()
+        pq.enqueue('B', 2)
+        pq.enqueue('C', 3)
+        pq.enqueue('A', 1)
+        assert pq.front() == 'A'
+        assert pq.length() == 3
+        assert pq.dequeue() == 'A'
+        assert pq.dequeue() == 'B'
+        assert pq.dequeue() == 'C'
+        assert pq.is_empty() is True
+        with self.assertRaises(ValueError):
+            pq.dequeue()
+
+    def test_push_pop(self):
+        pq = PriorityQueue()
+        pq.enqueue('B', 2)
+        pq.enqueue('C', 3)
+        assert pq.push_pop('A', 1) == 'B'
+        assert pq.dequeue() == 'A'
+        assert pq.dequeue() == 'C'
+
+    def test_stable_ties_are_fifo(self):
+        pq = PriorityQueue(stable=True)
+        for item in ['A', 'B', 'C', 'D']:
+            pq.enqueue(item, 1)
+        pq.enqueue('Z', 0)
+        pq.enqueue('E', 1)
+        assert pq.front() == 'Z'
+        assert [pq.dequeue() for _ in range(6)] == ['Z', 'A', 'B', 'C', 'D',
+                                                    'E']
+        with self.assertRaises(ValueError):
+            pq.dequeue()
+
+    def test_stable_items_need_not_be_comparable(self):
+        pq = PriorityQueue(stable=True)
+        items = [{'id': index} for index in range(5)]
+        for item in items:
+            pq.enqueue(item, 7)
+        assert pq.push_pop({'id': 5}, 7) is items[0]
+        assert [pq.dequeue()['id'] for _ in range(5)] == [1, 2, 3, 4, 5]
+
+    def test_stable_random_priorities(self):
+        pq = PriorityQueue(stable=True)
+        pairs = [(random.randint(0, 10), index) for index in range(300)]
+        for priority, index in pairs:
+            pq.enqueue(index, priority)
+        # Sorting pairs orders equal priorities by insertion index
+        assert [pq.dequeue() for _ in pairs] == [i for p, i in sorted(pairs)]
+
+    def test_heap_backends(self):
+        for heap in [MinHeap(arity=4), PairingHeap()]:
+            pq = PriorityQueue(heap=heap)
+            priorities = [random.randint(0, 1000) for _ in range(200)]
+            for index, priority in enumerate(priorities):
+                pq.enqueue(index, priority)
+            front = pq.front()
+            assert pq.push_pop(front, priorities[front]) == front
+            result = [priorities[pq.dequeue()] for _ in priorities]
+            assert result == sorted(priorities)
+
+    def test_invalid_heap_backend(self):
+        with self.assertRaises(ValueError):
+            PriorityQueue(heap=MinHeap([1]))  # Not empty
+        with self.assertRaises(ValueError):
+            PriorityQueue(stable=True, heap=PairingHeap())
+
+
+def assert_indexed_heap(pq):
+    """Assert the given queue is heap-ordered and its position map is exact"""
+    assert len(pq.positions) == len(pq.items) == len(pq.priorities)
+    for index, item in enumerate(pq.items):
+        assert pq.positions[item] == index
+        if index > 0:
+            assert pq.priorities[(index - 1) >> 1] <= pq.priorities[index]
+
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+
+    def test_init_with_pairs(self):
+        pq = IndexedPriorityQueue([('B', 2), ('A', 1), ('C', 3)])
+        assert pq.front() == 'A'
+        assert pq.length() == 3
+        assert_indexed_heap(pq)
+
+    def test_enqueue_duplicate_item(self):
+        pq = IndexedPriorityQueue()
+        pq.enqueue('A', 1)
+        with self.assertRaises(ValueError):
+            pq.enqueue('A', 2)
+
+    def test_contains_and_priority(self):
+        pq = IndexedPriorityQueue([('A', 5), ('B', 7)])
+        assert pq.contains('A') is True
+        assert pq.contains('Z') is False
+        assert pq.priority('B') == 7
+        with self.assertRaises(ValueError):
+            pq.priority('Z')
+
+    def test_update_priority(self):
+        pq = IndexedPriorityQueue([('A', 1), ('B', 2), ('C', 3), ('D', 4)])
+        pq.update_priority('D', 0)  # Decrease key
+        assert pq.front() == 'D'
+        pq.update_priority('D', 10)  # Increase key
+        assert pq.front() == 'A'
+        assert_indexed_heap(pq)
+        assert [pq.dequeue() for _ in range(4)] == ['A', 'B', 'C', 'D']
+        with self.assertRaises(ValueError):
+            pq.update_priority('A', 1)  # No longer in the queue
+
+    def test_remove(self):
+        pq = IndexedPriorityQueue([('A', 1), ('B', 2), ('C', 3), ('D', 4)])
+        assert pq.remove('B') == 2
+        assert pq.contains('B') is False
+        assert pq.remove('D') == 4  # The last item
+        assert_indexed_heap(pq)
+        assert [pq.dequeue() for _ in range(2)] == ['A', 'C']
+        with self.assertRaises(ValueError):
+            pq.remove('A')
+
+    def test_push_pop(self):
+        pq = IndexedPriorityQueue([('B', 2), ('C', 3)])
+        assert pq.push_pop('A', 1) == 'B'
+        assert pq.contains('B') is False
+        assert_indexed_heap(pq)
+        assert pq.dequeue() == 'A'
+
+    def test_push_pop_front_item(self):
+        pq = IndexedPriorityQueue([('A', 1), ('B', 2), ('C', 3)])
+        # Reinsert the front item with a new priority
+        assert pq.push_pop('A', 5) == 'A'
+        assert pq.contains('A') is True
+        assert pq.priority('A') == 5
+        assert_indexed_heap(pq)
+        with self.assertRaises(ValueError):
+            pq.push_pop('C', 1)  # Another item already in the queue
+        assert [pq.dequeue() for _ in range(3)] == ['B', 'C', 'A']
+
+    def test_items_need_not_be_comparable(self):
+        pq = IndexedPriorityQueue()
+        a, b = object(), object()
+        pq.enqueue(a, 1)
+        pq.enqueue(b, 1)  # Equal priorities never compare the items
+        assert pq.length() == 2
+
+    def test_random_operations(self):
+        pq = IndexedPriorityQueue()
+        priorities = {}
+        for item in range(200):
+            priorities[item] = random.randint(0, 100)
+            pq.enqueue(item, priorities[item])
+        for item in random.sample(range(200), 100):
+            priorities[item] = random.randint(-100, 200)
+            pq.update_priority(item, priorities[item])
+        for item in random.sample(range(200), 50):
+            assert pq.remove(item) == priorities.pop(item)
+        assert_indexed_heap(pq)
+        result = []
+        while not pq.is_empty():
+            result.append(priorities[pq.dequeue()])
+        assert result == sorted(priorities.values())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 #!python
 
-from queue import Queue
+from queue import Queue, LinkedQueue, ArrayQueue
+from deque import BlockDeque
+import sys
 import unittest
 
 
@@ -68,5 +70,125 @@ class TestQueue(unittest.TestCase):
             q.dequeue()
 
 
+class TestArrayQueue(unittest.TestCase):
+
+    def test_init_with_list(self):
+        q = ArrayQueue(['A', 'B', 'C'])
+        assert q.front() == 'A'
+        assert q.length() == 3
+        assert q.is_empty() is False
+
+    def test_enqueue_and_dequeue_wrap_around(self):
+        q = ArrayQueue()
+        capacity = len(q.list)
+        # Move the head forward so later items wrap around the array end
+        for item in range(capacity - 2):
+            q.enqueue(item)
+        for item in range(capacity - 2):
+            assert q.dequeue() == item
+        for item in range(capacity):
+            q.enqueue(item)
+        assert len(q.list) == capacity  # Wrapped around without growing
+        assert q.front() == 0
+        for item in range(capacity):
+            assert q.dequeue() == item
+        assert q.is_empty() is True
+        with self.assertRaises(ValueError):
+            q.dequeue()
+
+    def test_grow_and_shrink(self):
+        q = ArrayQueue()
+        items = list(range(1000))
+        for item in items[:3]:
+            q.enqueue(item)
+            q.dequeue()  # Leave the head in the middle of the array
+        for item in items:
+            q.enqueue(item)
+        assert q.length() == 1000
+        assert len(q.list) >= 1000
+        for item in items[:990]:
+            assert q.dequeue() == item
+        assert len(q.list) < 100  # Shrank as items were dequeued
+        assert [q.dequeue() for _ in range(10)] == items[990:]
+
+    def test_bounded_rejects_when_full(self):
+        q = ArrayQueue(capacity=2)
+        q.enqueue('A')
+        q.enqueue('B')
+        assert q.is_full() is True
+        with self.assertRaises(ValueError):
+            q.enqueue('C')
+        assert q.dequeue() == 'A'
+        assert q.is_full() is False
+        q.enqueue('C')
+        assert len(q.list) == 2  # Never grows
+        assert q.dequeue() == 'B'
+        assert q.dequeue() == 'C'
+
+    def test_bounded_overwrites_when_full(self):
+        q = ArrayQueue(['A', 'B', 'C', 'D', 'E'], capacity=3, overwrite=True)
+        assert q.length() == 3
+        assert q.front() == 'C'
+        assert q.dequeue() == 'C'
+        assert q.dequeue() == 'D'
+        assert q.dequeue() == 'E'
+        assert q.is_empty() is True
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            ArrayQueue(capacity=0)
+
+
+class TestBlockDequeBackend(unittest.TestCase):
+
+    def test_enqueue_and_dequeue(self):
+        q = LinkedQueue(['A', 'B'], backend=BlockDeque)
+        assert isinstance(q.list, BlockDeque)
+        items = list(range(200))
+        for item in items:
+            q.enqueue(item)
+        assert q.front() == 'A'
+        assert q.length() == 202
+        assert [q.dequeue() for _ in range(202)] == ['A', 'B'] + items
+        assert q.front() is None
+        with self.assertRaises(ValueError):
+            q.dequeue()
+
+
+class TestTypedArrayQueue(unittest.TestCase):
+
+    def test_enqueue_and_dequeue(self):
+        q = ArrayQueue(typecode='d')
+        items = [float(item) / 4 for item in range(100)]
+        for item in items:
+            q.enqueue(item)
+        assert q.list.typecode == 'd'
+        assert q.front() == 0.0
+        assert [q.dequeue() for _ in items] == items
+        assert q.list.typecode == 'd'  # Still typed after resizing
+        with self.assertRaises(TypeError):
+            q.enqueue('A')  # Not a number
+
+    def test_bounded_overwrite(self):
+        q = ArrayQueue([1, 2, 3, 4], capacity=3, overwrite=True, typecode='i')
+        assert [q.dequeue() for _ in range(3)] == [2, 3, 4]
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'arrays need Python 3 views')
+    def test_buffer(self):
+        q = ArrayQueue(range(6), capacity=6, typecode='i')
+        q.dequeue()
+        q.dequeue()
+        q.enqueue(6)  # Wraps around the end of the array
+        assert q.buffer().tolist() == [2, 3, 4, 5, 6]
+        q = ArrayQueue(range(4), typecode='i')
+        view = q.buffer()
+        for item in range(4, 20):
+            q.enqueue(item)  # Resizes into a new array the view does not see
+        assert view.tolist() == [0, 1, 2, 3]
+        assert q.buffer().tolist() == list(range(20))
+        with self.assertRaises(TypeError):
+            ArrayQueue().buffer()
+
+
 if __name__ == '__main__':
     unittest.main()
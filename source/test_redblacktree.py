@@ -0,0 +1,105 @@
+#!python
+
+from redblacktree import RedBlackTree, RedBlackNode
+import math
+import random
+import unittest
+
+
+def assert_red_black(node):
+    """Assert the given subtree is ordered, has no red node with a red child,
+    and has equal black heights on every path, and return its black height"""
+    if node is None:
+        return 1  # Empty subtrees count as black
+    for child in (node.left, node.right):
+        if child is not None and node.red:
+            assert not child.red
+    if node.left is not None:
+        assert node.left.data < node.data
+    if node.right is not None:
+        assert node.right.data > node.data
+    node_count = 1
+    for child in (node.left, node.right):
+        node_count += child.size if child is not None else 0
+    assert node.size == node_count
+    left_black_height = assert_red_black(node.left)
+    right_black_height = assert_red_black(node.right)
+    assert left_black_height == right_black_height
+    return left_black_height + (0 if node.red else 1)
+
+
+class TestRedBlackTree(unittest.TestCase):
+
+    def test_init(self):
+        tree = RedBlackTree()
+        assert tree.root is None
+        assert tree.size == 0
+        assert tree.is_empty() is True
+
+    def test_insert_root_is_black(self):
+        tree = RedBlackTree()
+        tree.insert(1)
+        assert isinstance(tree.root, RedBlackNode)
+        assert tree.root.red is False
+        assert not hasattr(tree.root, '__dict__')  # No per-instance dictionary
+
+    def test_insert_sorted_items(self):
+        tree = RedBlackTree()
+        for item in range(1, 1001):
+            tree.insert(item)
+            assert tree.root.red is False
+        assert tree.size == 1000
+        assert tree.height() <= 2 * math.log(1001, 2)
+        assert tree.items_in_order() == list(range(1, 1001))
+        assert_red_black(tree.root)
+
+    def test_insert_reverse_sorted_items(self):
+        tree = RedBlackTree()
+        for item in range(1000, 0, -1):
+            tree.insert(item)
+        assert tree.height() <= 2 * math.log(1001, 2)
+        assert tree.items_in_order() == list(range(1, 1001))
+        assert_red_black(tree.root)
+
+    def test_insert_random_items(self):
+        items = random.sample(range(10000), 500)
+        tree = RedBlackTree(items)
+        assert tree.size == 500
+        assert_red_black(tree.root)
+        assert tree.items_in_order() == sorted(items)
+        for item in items:
+            assert tree.contains(item) is True
+            assert tree.search(item) == item
+        assert tree.contains(-1) is False
+
+    def test_insert_duplicate_item(self):
+        tree = RedBlackTree([2, 1, 3])
+        tree.insert(3)
+        assert tree.size == 3
+
+    def test_from_sorted(self):
+        for count in [1, 2, 3, 7, 10, 100]:
+            tree = RedBlackTree.from_sorted(range(count))
+            assert tree.size == count
+            assert tree.root.red is False
+            assert_red_black(tree.root)
+            tree.insert(count)
+            tree.insert(-1)
+            assert_red_black(tree.root)
+            assert tree.items_in_order() == list(range(-1, count + 1))
+
+    def test_order_statistics(self):
+        tree = RedBlackTree()
+        for item in range(99, -1, -1):
+            tree.insert(item)
+        assert_red_black(tree.root)
+        for item in range(100):
+            assert tree.rank(item) == item
+            assert tree.select(item) == item
+        assert tree.floor(100) == 99
+        assert tree.ceiling(-5) == 0
+        assert list(tree.range(90, 200)) == list(range(90, 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
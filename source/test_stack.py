@@ -1,6 +1,8 @@
 #!python
 
-from stack import Stack
+from stack import Stack, LinkedStack, ArrayStack, PersistentStack
+from deque import BlockDeque
+import sys
 import unittest
 
 
@@ -68,5 +70,84 @@ class TestStack(unittest.TestCase):
             s.pop()
 
 
+class TestArrayStack(unittest.TestCase):
+
+    def test_push_and_pop(self):
+        s = ArrayStack(['A', 'B'])
+        s.push('C')
+        assert s.peek() == 'C'
+        assert s.length() == 3
+        assert [s.pop() for _ in range(3)] == ['C', 'B', 'A']
+        assert s.peek() is None
+        assert s.is_empty() is True
+        with self.assertRaises(ValueError):
+            s.pop()
+
+
+class TestBlockDequeBackend(unittest.TestCase):
+
+    def test_push_and_pop(self):
+        s = LinkedStack(['A', 'B'], backend=BlockDeque)
+        assert isinstance(s.list, BlockDeque)
+        items = list(range(200))
+        for item in items:
+            s.push(item)
+        assert s.peek() == 199
+        assert s.length() == 202
+        assert [s.pop() for _ in range(202)] == items[::-1] + ['B', 'A']
+        assert s.peek() is None
+        with self.assertRaises(ValueError):
+            s.pop()
+
+
+class TestTypedArrayStack(unittest.TestCase):
+
+    def test_push_and_pop(self):
+        s = ArrayStack([1, 2], typecode='i')
+        s.push(3)
+        assert s.list.typecode == 'i'
+        assert s.peek() == 3
+        assert [s.pop() for _ in range(3)] == [3, 2, 1]
+        with self.assertRaises(TypeError):
+            s.push('A')  # Not a number
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'arrays need Python 3 views')
+    def test_buffer(self):
+        s = ArrayStack([1.5, 2.5], typecode='d')
+        view = s.buffer()
+        assert view.tolist() == [1.5, 2.5]
+        assert view.itemsize == 8
+        view.release()
+        with self.assertRaises(TypeError):
+            ArrayStack().buffer()
+
+
+class TestPersistentStack(unittest.TestCase):
+
+    def test_init_with_list(self):
+        s = PersistentStack(['A', 'B', 'C'])
+        assert s.peek() == 'C'
+        assert s.length() == 3
+        assert s.items() == ['C', 'B', 'A']
+
+    def test_push_and_pop_return_new_versions(self):
+        empty = PersistentStack()
+        a = empty.push('A')
+        ab = a.push('B')
+        ac = a.push('C')
+        assert empty.is_empty() is True
+        assert ab.items() == ['B', 'A']
+        assert ac.items() == ['C', 'A']
+        assert ab.head[1] is ac.head[1]  # Both share the cell of A
+        with self.assertRaises(TypeError):
+            ab.head[1][0] = 'Z'  # Shared cells cannot be changed
+        assert ac.items() == ['C', 'A']
+        assert ab.pop().items() == ['A']
+        assert ab.length() == 2  # Unchanged by pop
+        assert ab.pop().pop().is_empty() is True
+        with self.assertRaises(ValueError):
+            empty.pop()
+
+
 if __name__ == '__main__':
     unittest.main()